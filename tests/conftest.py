@@ -0,0 +1,89 @@
+"""
+Shared fixtures for the tools.core and kb_search tests.
+
+Provides a minimal knowledge base tree (kb_root) and helpers to write
+and change its files. Test modules import the sample data and helpers
+from here.
+"""
+
+import os
+import pytest
+import yaml
+from pathlib import Path
+
+
+DOCKER_ERRORS = {
+    'version': '1.0',
+    'category': 'docker-errors',
+    'errors': [
+        {
+            'id': 'DOCKER-001',
+            'title': 'Compose service cannot reach database',
+            'severity': 'high',
+            'scope': 'docker',
+            'problem': 'Containers on different networks cannot resolve each other.',
+            'solution': {
+                'code': 'networks:\n  - backend',
+                'explanation': 'Attach both services to the same network.'
+            },
+            'tags': ['docker', 'compose', 'networking']
+        },
+        {
+            'id': 'DOCKER-002',
+            'title': 'Image build cache never used',
+            'severity': 'low',
+            'scope': 'docker',
+            'problem': 'COPY before dependency install invalidates the layer cache.',
+            'solution': {'explanation': 'Copy requirements first, then install.'},
+            'tags': ['docker', 'build']
+        }
+    ]
+}
+
+
+PYTHON_PATTERNS = {
+    'version': '1.0',
+    'category': 'python-async',
+    'patterns': [
+        {
+            'id': 'PYTHON-001',
+            'title': 'Bounded concurrency with asyncio semaphore',
+            'severity': 'medium',
+            'scope': 'python',
+            'problem': 'Unbounded gather exhausts database connections.',
+            'solution': {'code': 'async with sem:\n    await task()'},
+            'tags': ['python', 'asyncio']
+        }
+    ]
+}
+
+
+def write_yaml(path: Path, data: dict) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        yaml.safe_dump(data, f, sort_keys=False)
+
+
+@pytest.fixture
+def kb_root(tmp_path, monkeypatch):
+    """Minimal knowledge base tree, used as working directory."""
+    write_yaml(tmp_path / "domains" / "docker" / "errors" / "compose.yaml", DOCKER_ERRORS)
+    write_yaml(tmp_path / "domains" / "python" / "patterns" / "async.yaml", PYTHON_PATTERNS)
+    write_yaml(tmp_path / "domains" / "docker" / "_meta.yaml", {'version': '1.0'})
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+def touch_changed(path: Path, data: dict) -> None:
+    """Rewrite a file and bump its mtime so the change is always detected."""
+    write_yaml(path, data)
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+def line_of(path: Path, text: str) -> int:
+    """1-based line of the first line of a file containing text."""
+    for number, line in enumerate(path.read_text().splitlines(), 1):
+        if text in line:
+            return number
+    raise AssertionError(f"{text!r} not in {path}")
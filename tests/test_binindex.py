@@ -0,0 +1,100 @@
+"""
+Tests for tools.core binary index.
+
+This test suite ensures that:
+1. The memory-mapped binary index answers queries like the in-memory engine
+2. Freshness checks and unranked queries do not visit every document
+"""
+
+import os
+import sys
+import pytest
+from pathlib import Path
+
+# Add repository root to path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from tools.core import KnowledgeSearch
+from tools.core.binindex import BinaryIndex
+
+from conftest import DOCKER_ERRORS, write_yaml
+
+
+class TestBinaryIndex:
+    """Test the memory-mapped binary index."""
+
+    @pytest.fixture
+    def binary_index(self, kb_root):
+        stats = KnowledgeSearch().build_index()
+        index = BinaryIndex.open(stats['binary_path'])
+        yield index
+        index.close()
+
+    @pytest.mark.parametrize("query, options", [
+        ("database", {}),
+        ("docker", {'severity': 'low'}),
+        ("async", {'scope': 'python'}),
+        ("", {'limit': 2}),
+        ("missing", {}),
+    ])
+    def test_matches_in_memory_search(self, binary_index, query, options):
+        expected = KnowledgeSearch().search(query, **options).all_results
+        results = binary_index.search(query, **options).all_results
+
+        assert [(r.metadata.id, r.relevance_score, r.kb_type) for r in results] == [
+            (r.metadata.id, r.relevance_score, r.kb_type) for r in expected
+        ]
+
+    def test_category_filter(self, binary_index):
+        hits = binary_index.query("", category="python-async")
+
+        assert [hit['metadata']['id'] for hit in hits] == ['PYTHON-001']
+
+    def test_changes_make_index_stale(self, binary_index, kb_root):
+        assert binary_index.is_fresh()
+
+        write_yaml(kb_root / "domains" / "docker" / "errors" / "new.yaml", DOCKER_ERRORS)
+
+        assert not binary_index.is_fresh()
+
+    def test_freshness_checks_directories_only(self, binary_index, monkeypatch):
+        checked = []
+        real_stat = os.stat
+        monkeypatch.setattr(os, "stat", lambda path, *args, **kwargs: checked.append(path) or real_stat(path, *args, **kwargs))
+
+        assert binary_index.is_fresh()
+        assert checked and not any(str(path).endswith('.yaml') for path in checked)
+
+    def test_unranked_query_stops_at_limit(self, kb_root, monkeypatch):
+        write_yaml(kb_root / "domains" / "widgets" / "errors" / "widgets.yaml", {
+            'version': '1.0',
+            'category': 'widgets',
+            'errors': [
+                {'id': f'WIDGET-{n}', 'title': f'Widget {n}', 'severity': 'low', 'scope': 'universal'}
+                for n in range(50)
+            ]
+        })
+        index = BinaryIndex.open(KnowledgeSearch().build_index()['binary_path'])
+        visited = set()
+        column = index.column
+        monkeypatch.setattr(index, "column", lambda name, doc: visited.add(doc) or column(name, doc))
+
+        try:
+            hits = index.query("", limit=2)
+        finally:
+            index.close()
+
+        assert len(hits) == 2
+        assert len(visited) <= 3
+
+    def test_incompatible_file_is_rejected(self, kb_root):
+        path = kb_root / "garbage.bin"
+        path.write_bytes(b"not an index")
+
+        assert BinaryIndex.open(path) is None
+        assert BinaryIndex.open(kb_root / "missing.bin") is None
+
+
+if __name__ == '__main__':
+    # Run tests
+    pytest.main([__file__, '-v'])
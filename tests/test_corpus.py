@@ -0,0 +1,68 @@
+"""
+Tests for tools.core corpus cache.
+
+This test suite ensures that:
+1. Parsed entries are cached and only changed files are re-parsed
+"""
+
+import sys
+import asyncio
+import pytest
+from pathlib import Path
+
+# Add repository root to path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from tools.core import KnowledgeSearch
+
+from conftest import PYTHON_PATTERNS, touch_changed
+
+
+class TestCorpusCache:
+    """Test that parsed entries are cached across queries."""
+
+    def test_warm_query_does_not_parse(self, kb_root):
+        search = KnowledgeSearch()
+        search.search("docker")
+        parses = search.corpus.parse_count
+
+        results = search.search("asyncio")
+
+        assert search.corpus.parse_count == parses
+        assert [r.metadata.id for r in results.all_results] == ['PYTHON-001']
+
+    def test_only_changed_file_is_reparsed(self, kb_root):
+        search = KnowledgeSearch()
+        search.search("docker")
+        parses = search.corpus.parse_count
+
+        changed = dict(PYTHON_PATTERNS)
+        changed['patterns'] = [dict(PYTHON_PATTERNS['patterns'][0], title='Renamed trio pattern')]
+        touch_changed(kb_root / "domains" / "python" / "patterns" / "async.yaml", changed)
+
+        results = search.search("trio")
+
+        assert search.corpus.parse_count == parses + 1
+        assert [r.metadata.id for r in results.all_results] == ['PYTHON-001']
+
+    def test_deleted_file_is_dropped(self, kb_root):
+        search = KnowledgeSearch()
+        assert search.search("compose").total == 1
+
+        (kb_root / "domains" / "docker" / "errors" / "compose.yaml").unlink()
+
+        assert search.search("compose").total == 0
+        assert search.get_by_id("DOCKER-001") is None
+
+    def test_invalid_yaml_is_skipped(self, kb_root):
+        broken = kb_root / "domains" / "docker" / "errors" / "broken.yaml"
+        broken.write_text("errors: [unclosed", encoding='utf-8')
+
+        search = KnowledgeSearch()
+
+        assert search.search("docker").total == 2
+
+
+if __name__ == '__main__':
+    # Run tests
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,135 @@
+"""
+Tests for tools.core search daemon.
+
+This test suite ensures that:
+1. The search daemon answers like the in-process engine
+2. Client queries without a limit fetch every result, a page at a time
+3. Failed requests are reported as errors and keep the connection open
+"""
+
+import sys
+import time
+import socket
+import threading
+import pytest
+from pathlib import Path
+
+# Add repository root to path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from tools.core import KnowledgeSearch
+from tools.core import daemon
+
+from conftest import PYTHON_PATTERNS, touch_changed, write_yaml
+
+
+@pytest.fixture
+def running_daemon(kb_root):
+    """Search daemon serving kb_root on a background thread."""
+    server = daemon.KnowledgeDaemon(KnowledgeSearch(), kb_root / "kb.sock")
+    server.warm()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    for _ in range(100):
+        if server.path.exists():
+            break
+        time.sleep(0.01)
+
+    yield server
+
+    server.stop()
+    thread.join(timeout=5)
+
+
+@pytest.mark.skipif(not hasattr(socket, 'AF_UNIX'), reason="Unix sockets are not available")
+class TestDaemon:
+    """Test the resident search daemon and its client."""
+
+    def test_results_match_in_process(self, running_daemon):
+        local = daemon.execute(KnowledgeSearch(), 'search', {'query': 'database'})
+
+        with daemon.DaemonClient.connect(running_daemon.path) as client:
+            remote = client.request('search', query='database')
+
+        assert [r['metadata']['id'] for r in remote['shared_results']] == ['DOCKER-001', 'PYTHON-001']
+        for result in local['project_results'] + local['shared_results']:
+            result.pop('preview')
+        for result in remote['project_results'] + remote['shared_results']:
+            result.pop('preview')
+        local.pop('execution_time_ms')
+        remote.pop('execution_time_ms')
+        assert remote == local
+
+    def test_get_and_browse(self, running_daemon):
+        with daemon.DaemonClient.connect(running_daemon.path) as client:
+            found = client.request('get', entry_id='DOCKER-002')
+            missing = client.request('get', entry_id='NOPE-001')
+            browsed = client.request('browse', category='docker-errors')
+
+        assert found['entry']['title'] == 'Image build cache never used'
+        assert Path(found['file_path']).is_absolute()
+        assert missing is None
+        assert [r['metadata']['id'] for r in browsed] == ['DOCKER-001', 'DOCKER-002']
+
+    def test_sees_changed_files(self, running_daemon, kb_root):
+        changed = dict(PYTHON_PATTERNS)
+        changed['patterns'] = [dict(PYTHON_PATTERNS['patterns'][0], title='Renamed trio pattern')]
+        touch_changed(kb_root / "domains" / "python" / "patterns" / "async.yaml", changed)
+
+        with daemon.DaemonClient.connect(running_daemon.path) as client:
+            hits = client.query("trio")
+
+        assert [hit['metadata']['id'] for hit in hits] == ['PYTHON-001']
+
+    def test_query_without_limit_pages(self, running_daemon, kb_root):
+        write_yaml(kb_root / "domains" / "widgets" / "errors" / "widgets.yaml", {
+            'version': '1.0',
+            'category': 'widgets',
+            'errors': [
+                {'id': f'WIDGET-{n}', 'title': f'Widget {n}', 'severity': 'low', 'scope': 'universal'}
+                for n in range(daemon.QUERY_PAGE_SIZE + 10)
+            ]
+        })
+
+        with daemon.DaemonClient.connect(running_daemon.path) as client:
+            hits = client.query("widget", limit=None)
+
+        assert len({hit['metadata']['id'] for hit in hits}) == daemon.QUERY_PAGE_SIZE + 10
+
+    def test_invalid_request_reports_error(self, running_daemon):
+        with daemon.DaemonClient.connect(running_daemon.path) as client:
+            with pytest.raises(daemon.DaemonError):
+                client.request('search', unknown='x')
+            # The connection stays usable after an error
+            assert client.request('ping')['protocol'] == daemon.PROTOCOL_VERSION
+
+    def test_engine_failure_reports_error(self, running_daemon, monkeypatch):
+        def fail(*args, **kwargs):
+            raise RuntimeError("index corrupted")
+
+        monkeypatch.setattr(running_daemon.engine, "search", fail)
+
+        with daemon.DaemonClient.connect(running_daemon.path) as client:
+            with pytest.raises(daemon.DaemonError, match="index corrupted"):
+                client.request('search', query='docker')
+            assert client.request('ping')['protocol'] == daemon.PROTOCOL_VERSION
+
+    def test_connect_without_daemon(self, kb_root):
+        assert daemon.DaemonClient.connect(kb_root / "missing.sock") is None
+
+    def test_shutdown_removes_socket(self, running_daemon):
+        with daemon.DaemonClient.connect(running_daemon.path) as client:
+            client.request('shutdown')
+
+        for _ in range(100):
+            if not running_daemon.path.exists():
+                break
+            time.sleep(0.01)
+
+        assert not running_daemon.path.exists()
+
+
+if __name__ == '__main__':
+    # Run tests
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,109 @@
+"""
+Tests for tools.core tool executor.
+
+This test suite ensures that:
+1. Blocking tool calls run off the event loop within per-tool limits
+"""
+
+import sys
+import asyncio
+import time
+import threading
+import pytest
+from pathlib import Path
+
+# Add repository root to path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from tools.core.executor import ToolExecutor
+
+
+class TestToolExecutor:
+    """Test running blocking tool calls off the event loop."""
+
+    def test_event_loop_keeps_running_during_slow_call(self):
+        executor = ToolExecutor({'slow': 1}, threads=2)
+        ticks = []
+
+        async def heartbeat():
+            while True:
+                ticks.append(time.monotonic())
+                await asyncio.sleep(0.01)
+
+        async def scenario():
+            beat = asyncio.create_task(heartbeat())
+            try:
+                await executor.run('slow', time.sleep, 0.2)
+            finally:
+                beat.cancel()
+
+        try:
+            asyncio.run(scenario())
+        finally:
+            executor.shutdown()
+
+        assert len(ticks) >= 5
+
+    def test_per_tool_limits(self):
+        executor = ToolExecutor({'stats': 1, 'search': 3}, threads=8)
+        lock = threading.Lock()
+        running = {'stats': 0, 'search': 0}
+        peak = {'stats': 0, 'search': 0}
+
+        def work(name):
+            with lock:
+                running[name] += 1
+                peak[name] = max(peak[name], running[name])
+            time.sleep(0.05)
+            with lock:
+                running[name] -= 1
+            return name
+
+        async def scenario():
+            calls = [executor.run(name, work, name) for name in ['stats'] * 3 + ['search'] * 6]
+            return await asyncio.gather(*calls)
+
+        try:
+            results = asyncio.run(scenario())
+        finally:
+            executor.shutdown()
+
+        assert results == ['stats'] * 3 + ['search'] * 6
+        assert peak == {'stats': 1, 'search': 3}
+
+    def test_cancelled_call_never_starts(self):
+        executor = ToolExecutor({'stats': 1}, threads=2)
+        started = []
+
+        async def scenario():
+            first = asyncio.create_task(executor.run('stats', time.sleep, 0.1))
+            queued = asyncio.create_task(executor.run('stats', started.append, 'queued'))
+            await asyncio.sleep(0.02)
+            queued.cancel()
+            await first
+            with pytest.raises(asyncio.CancelledError):
+                await queued
+
+        try:
+            asyncio.run(scenario())
+        finally:
+            executor.shutdown()
+
+        assert started == []
+
+    def test_errors_propagate(self):
+        executor = ToolExecutor({})
+
+        async def scenario():
+            await executor.run('unknown', int, 'not a number')
+
+        try:
+            with pytest.raises(ValueError):
+                asyncio.run(scenario())
+        finally:
+            executor.shutdown()
+
+
+if __name__ == '__main__':
+    # Run tests
+    pytest.main([__file__, '-v'])
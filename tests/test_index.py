@@ -0,0 +1,54 @@
+"""
+Tests for tools.core inverted index.
+
+This test suite ensures that:
+1. The inverted index intersects posting lists with field masks
+"""
+
+import sys
+import pytest
+from pathlib import Path
+
+# Add repository root to path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from tools.core.index import InvertedIndex, FIELD_TITLE, FIELD_TAGS, FIELD_ID
+
+from conftest import DOCKER_ERRORS, PYTHON_PATTERNS
+
+
+class TestInvertedIndex:
+    """Test token postings and query intersection."""
+
+    @pytest.fixture
+    def index(self):
+        index = InvertedIndex()
+        index.add(0, DOCKER_ERRORS['errors'][0])
+        index.add(1, DOCKER_ERRORS['errors'][1])
+        index.add(2, PYTHON_PATTERNS['patterns'][0])
+        return index
+
+    def test_field_masks(self, index):
+        posting = index.lookup("compose")
+
+        assert posting[0] & FIELD_TITLE
+        assert posting[0] & FIELD_TAGS
+
+    def test_tokens_are_intersected(self, index):
+        assert set(index.match("docker build")) == {1}
+        assert set(index.match("docker")) == {0, 1}
+
+    def test_prefix_match(self, index):
+        assert set(index.match("async")) == {2}
+        assert index.match("python-001")[2] & FIELD_ID
+
+    def test_remove(self, index):
+        index.remove(0)
+
+        assert set(index.match("docker")) == {1}
+        assert "networking" not in index.postings
+
+
+if __name__ == '__main__':
+    # Run tests
+    pytest.main([__file__, '-v'])
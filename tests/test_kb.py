@@ -0,0 +1,145 @@
+"""
+Tests for the kb.py command line.
+
+This test suite ensures that:
+1. validate reports duplicate ids without building or writing the search index
+2. search and stats run in-process on the KB, whatever the working directory
+3. --help starts without importing YAML or the search engine
+"""
+
+import sys
+import subprocess
+import pytest
+from pathlib import Path
+
+# Add repository root to path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from tools import kb, kb_search
+from tools.core import KnowledgeSearch
+
+from conftest import DOCKER_ERRORS, write_yaml, touch_changed
+
+
+def run_kb(monkeypatch, *argv):
+    """Run kb.py in-process and return its exit code"""
+    monkeypatch.setattr(sys, 'argv', ['kb.py', *argv])
+    try:
+        kb.main()
+    except SystemExit as e:
+        return e.code
+    return 0
+
+
+class TestValidate:
+    """Test kb.py validate."""
+
+    @pytest.fixture
+    def project_copy(self, kb_root, monkeypatch):
+        """Project KB file redefining DOCKER-001"""
+        monkeypatch.setattr(kb, 'repo_root', kb_root)
+        path = kb_root / ".kb" / "project" / "errors" / "local.yaml"
+        write_yaml(path, dict(DOCKER_ERRORS, errors=[dict(DOCKER_ERRORS['errors'][0], title='Local override')]))
+        return path
+
+    def test_duplicates_without_index(self, kb_root, project_copy, monkeypatch, capsys):
+        index_path = kb_root / ".kb" / "cache" / "search-index.pickle"
+
+        assert run_kb(monkeypatch, 'validate', str(project_copy)) == 1
+        assert 'Duplicate ID DOCKER-001' in capsys.readouterr().out
+        assert not index_path.exists()
+
+    def test_saved_index_is_read_only(self, kb_root, project_copy, monkeypatch, capsys):
+        index_path = Path(KnowledgeSearch().build_index()['path'])
+        saved = index_path.read_bytes()
+
+        # The validated file is patched in, even though the index predates it
+        touch_changed(project_copy, dict(DOCKER_ERRORS, errors=[dict(DOCKER_ERRORS['errors'][0], id='LOCAL-001')]))
+        assert run_kb(monkeypatch, 'validate', str(project_copy)) == 0
+        assert 'Duplicate ID' not in capsys.readouterr().out
+
+        touch_changed(project_copy, dict(DOCKER_ERRORS, errors=[DOCKER_ERRORS['errors'][1]]))
+        assert run_kb(monkeypatch, 'validate', str(project_copy)) == 1
+        assert 'Duplicate ID DOCKER-002' in capsys.readouterr().out
+
+        assert index_path.read_bytes() == saved
+
+    def test_max_errors_covers_duplicates(self, kb_root, project_copy, monkeypatch, capsys):
+        write_yaml(project_copy, dict(DOCKER_ERRORS))
+
+        assert run_kb(monkeypatch, 'validate', str(project_copy), '--max-errors', '1') == 1
+        out = capsys.readouterr().out
+        assert out.count('Duplicate ID') == 1
+        assert 'Stopped after 1 error(s)' in out
+
+
+class TestInProcessCommands:
+    """Test kb.py search and stats from outside the KB."""
+
+    @pytest.fixture
+    def elsewhere(self, kb_root, tmp_path_factory, monkeypatch):
+        """Point kb.py and kb_search at kb_root, then leave it"""
+        monkeypatch.setattr(kb, 'repo_root', kb_root)
+        monkeypatch.setattr(kb_search, 'PROJECT_ROOT', kb_root)
+        monkeypatch.setattr(kb_search, 'SHARED_KB_PATH', kb_root / "domains")
+        monkeypatch.setattr(kb_search, 'PATHS', {
+            "project": kb_root / ".kb" / "project",
+            "shared": kb_root / "domains"
+        })
+        monkeypatch.setattr(kb_search, '_search_engine', None)
+        monkeypatch.setattr(kb_search, '_search_engine_loaded', False)
+        monkeypatch.setattr(kb_search, '_file_metadata', {})
+
+        cwd = tmp_path_factory.mktemp("elsewhere")
+        monkeypatch.chdir(cwd)
+        return cwd
+
+    @pytest.mark.parametrize("indexed", [False, True])
+    def test_search(self, kb_root, elsewhere, monkeypatch, capsys, indexed):
+        if indexed:
+            kb_search.create_search_engine().build_index()
+
+        assert run_kb(monkeypatch, 'search', 'compose') == 0
+
+        out = capsys.readouterr().out
+        assert "Found: 1" in out
+        assert "compose.yaml" in out
+        # The index is found under the KB, not the working directory
+        engine = kb_search.get_search_engine()
+        assert (engine is not None) == indexed
+        if engine is not None:
+            engine.close()
+        assert not (elsewhere / ".kb").exists()
+
+    def test_stats(self, kb_root, elsewhere, monkeypatch, capsys):
+        assert run_kb(monkeypatch, 'stats', '--verbose') == 0
+
+        out = capsys.readouterr().out
+        assert "METRICS DASHBOARD" in out
+        assert "Total Entries: 3" in out
+        assert "docker: 2 entries" in out
+        assert "python: 1 files, 1 entries" in out
+
+
+class TestStartup:
+    """Test what kb.py imports before running a command."""
+
+    def test_help_skips_heavy_imports(self):
+        script = (
+            "import runpy, sys\n"
+            "sys.argv = ['kb.py', '--help']\n"
+            "try:\n"
+            f"    runpy.run_path({kb.__file__!r}, run_name='__main__')\n"
+            "except SystemExit:\n"
+            "    pass\n"
+            "print(sorted(name for name in ('yaml', 'tools.core', 'tools.core.search') if name in sys.modules))\n"
+        )
+        result = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, check=True)
+
+        assert "usage:" in result.stdout
+        assert result.stdout.splitlines()[-1] == "[]"
+
+
+if __name__ == '__main__':
+    # Run tests
+    pytest.main([__file__, '-v'])
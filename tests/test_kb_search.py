@@ -0,0 +1,125 @@
+"""
+Tests for kb_search.py file search.
+
+This test suite ensures that:
+1. The index supplies the matching files, without reading them
+2. Every matching entry counts, however many there are
+3. Files are described and filtered by their first matching entry, with
+   and without the index
+4. The index ranks files by their best matching entry
+"""
+
+import sys
+import pytest
+from pathlib import Path
+
+# Add repository root to path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from tools.core import KnowledgeSearch
+from tools.core.binindex import BinaryIndex
+from tools import kb_search
+
+from conftest import DOCKER_ERRORS, write_yaml
+
+
+class TestFileSearch:
+    """Test kb_search file matching with and without the index."""
+
+    @pytest.fixture
+    def shared_root(self, kb_root, monkeypatch):
+        # DOCKER-002 again, in a second file
+        write_yaml(kb_root / "domains" / "docker" / "errors" / "best-practices.yaml", {
+            'version': '1.0',
+            'category': 'docker-errors',
+            'errors': [dict(DOCKER_ERRORS['errors'][1], title='Order Dockerfile layers')]
+        })
+        # Matches only through keys the index does not cover
+        write_yaml(kb_root / "domains" / "python" / "patterns" / "settings.yaml", {
+            'version': '1.0',
+            'category': 'python-config',
+            'patterns': [{
+                'id': 'PYTHON-002',
+                'title': 'Settings per environment',
+                'scope': 'python',
+                'pattern': 'Load settings from environment variables',
+                'implementation': 'Mount a .env file into the docker container'
+            }]
+        })
+        root = kb_root / "domains"
+        monkeypatch.setattr(kb_search, "PATHS", {"project": kb_root / ".kb" / "project", "shared": root})
+        monkeypatch.setattr(kb_search, "_file_metadata", {})
+        return root
+
+    def search(self, monkeypatch, engine, root, query):
+        monkeypatch.setattr(kb_search, "get_search_engine", lambda: engine)
+        return [path.resolve() for path in kb_search.search_files(root, query)]
+
+    def test_index_supplies_matches(self, shared_root, monkeypatch):
+        def fail(*args):
+            raise AssertionError("matched files were read")
+
+        binary_index = BinaryIndex.open(KnowledgeSearch().build_index()['binary_path'])
+        monkeypatch.setattr(kb_search, "scan_files", fail)
+        monkeypatch.setattr(kb_search, "read_metadata", fail)
+
+        try:
+            for engine in (KnowledgeSearch(), binary_index):
+                matches = self.search(monkeypatch, engine, shared_root, "docker")
+                # settings.yaml only mentions docker in a key the index does not cover
+                assert sorted(path.name for path in matches) == ['best-practices.yaml', 'compose.yaml']
+        finally:
+            binary_index.close()
+
+    def test_text_scan_without_index(self, shared_root, monkeypatch):
+        matches = self.search(monkeypatch, None, shared_root, "docker")
+
+        assert sorted(path.name for path in matches) == ['best-practices.yaml', 'compose.yaml', 'settings.yaml']
+
+    def test_index_reports_every_match(self, shared_root, monkeypatch):
+        for name in ("a", "b", "c"):
+            write_yaml(shared_root / "widgets" / "errors" / f"{name}.yaml", {
+                'version': '1.0',
+                'category': 'widgets',
+                'errors': [
+                    {'id': f'WIDGET-{name}{n}', 'title': f'Widget {n}', 'severity': 'low', 'scope': 'universal'}
+                    for n in range(300)
+                ]
+            })
+        binary_index = BinaryIndex.open(KnowledgeSearch().build_index()['binary_path'])
+
+        try:
+            for engine in (KnowledgeSearch(), binary_index):
+                matches = self.search(monkeypatch, engine, shared_root, "widget")
+                assert sorted(path.name for path in matches) == ['a.yaml', 'b.yaml', 'c.yaml']
+        finally:
+            binary_index.close()
+
+    @pytest.mark.parametrize("severity,expected", [
+        ("low", ['best-practices.yaml', 'compose.yaml']),
+        # compose.yaml's first entry is high, but not about the cache
+        ("high", [])
+    ])
+    def test_filters_use_first_matching_entry(self, shared_root, monkeypatch, severity, expected):
+        binary_index = BinaryIndex.open(KnowledgeSearch().build_index()['binary_path'])
+
+        try:
+            for engine in (None, KnowledgeSearch(), binary_index):
+                monkeypatch.setattr(kb_search, "get_search_engine", lambda: engine)
+                matches = kb_search.search_files(shared_root, "cache", severity=severity)
+                assert sorted(path.name for path in matches) == expected
+                for path in matches:
+                    assert kb_search.extract_metadata(path)['severity'] == severity
+        finally:
+            binary_index.close()
+
+    def test_index_ranks_files(self, shared_root, monkeypatch):
+        matches = self.search(monkeypatch, KnowledgeSearch(), shared_root, "layer")
+
+        assert [path.name for path in matches] == ['best-practices.yaml', 'compose.yaml']
+        assert kb_search.extract_metadata(matches[0])['title'] == 'Order Dockerfile layers'
+
+
+if __name__ == '__main__':
+    # Run tests
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,50 @@
+"""
+Tests for tools.core parallel loader.
+
+This test suite ensures that:
+1. Full-corpus scans parse files in a process pool, in input order
+"""
+
+import sys
+import pytest
+from pathlib import Path
+
+# Add repository root to path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from tools.core import KnowledgeSearch
+from tools.core import loader
+
+from conftest import write_yaml
+
+
+class TestParallelLoader:
+    """Test parsing files in a process pool."""
+
+    def test_results_keep_input_order(self, kb_root, monkeypatch):
+        monkeypatch.setattr(loader, 'PARALLEL_THRESHOLD', 2)
+        paths = []
+        for number in range(6):
+            path = kb_root / "domains" / "bulk" / "errors" / f"bulk-{number}.yaml"
+            write_yaml(path, {'version': '1.0', 'category': f"bulk-{number}"})
+            paths.append(path)
+        paths.append(kb_root / "domains" / "bulk" / "missing.yaml")
+
+        loaded = loader.load_files(paths, workers=2)
+
+        assert [f.path for f in loaded] == paths
+        assert [f.content['category'] for f in loaded[:-1]] == [f"bulk-{n}" for n in range(6)]
+        assert loaded[-1].signature is None and not loaded[-1].ok
+
+    def test_cold_build_preloads_in_parallel(self, kb_root, monkeypatch):
+        monkeypatch.setattr(loader, 'PARALLEL_THRESHOLD', 2)
+
+        search = KnowledgeSearch(workers=2)
+
+        assert [r.metadata.id for r in search.search("database").all_results] == ['DOCKER-001', 'PYTHON-001']
+        assert search.corpus.parse_count == 2
+
+
+if __name__ == '__main__':
+    # Run tests
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,205 @@
+"""
+Tests for tools.core metrics.
+
+This test suite ensures that:
+1. Metrics are recalculated incrementally
+2. Repository statistics prune ignored directories and cache line counts
+3. Only changed directories and reported files are checked for changes
+"""
+
+import os
+import sys
+import pytest
+from pathlib import Path
+
+# Add repository root to path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from tools.core import MetricsCalculator, KnowledgeSearch, ChangeWatcher
+from tools.core import metrics as metrics_module
+
+from conftest import DOCKER_ERRORS, write_yaml, touch_changed
+
+
+class TestMetricsCache:
+    """Test incremental metrics for long-lived calculators."""
+
+    def test_repeated_calls_only_parse_changed_files(self, kb_root):
+        metrics = MetricsCalculator(str(kb_root))
+        first = metrics.calculate_all()
+        assert metrics.parse_count == 2
+
+        assert metrics.calculate_all().yaml_files == first.yaml_files
+        assert metrics.parse_count == 2
+
+        changed = dict(DOCKER_ERRORS)
+        changed['errors'] = DOCKER_ERRORS['errors'] + [
+            dict(DOCKER_ERRORS['errors'][0], id='DOCKER-003', title='Healthcheck never passes')
+        ]
+        compose = kb_root / "domains" / "docker" / "errors" / "compose.yaml"
+        touch_changed(compose, changed)
+
+        # Edited in place, so the directory looks unchanged until reported
+        assert metrics.calculate_all().yaml_files == first.yaml_files
+        metrics.mark_changed([compose])
+
+        updated = metrics.calculate_all()
+        assert metrics.parse_count == 3
+        assert updated.yaml_files.total_entries == first.yaml_files.total_entries + 1
+        assert updated.domain_distribution['docker'] == first.domain_distribution['docker'] + 1
+
+    def test_removed_files_drop_out(self, kb_root):
+        metrics = MetricsCalculator(str(kb_root))
+        metrics.calculate_all()
+
+        (kb_root / "domains" / "python" / "patterns" / "async.yaml").unlink()
+
+        result = metrics.calculate_all()
+        assert 'python' not in result.domain_distribution
+        assert result.quality_scores.total_entries == result.yaml_files.total_entries
+
+    def test_probe_checks_changed_directories_only(self, kb_root, monkeypatch):
+        metrics = MetricsCalculator(str(kb_root))
+        first = metrics.calculate_all()
+
+        checked = []
+        signature = MetricsCalculator._signature
+        monkeypatch.setattr(MetricsCalculator, "_signature", staticmethod(
+            lambda file_path: checked.append(file_path) or signature(file_path)
+        ))
+
+        metrics.calculate_all()
+        assert checked == []
+
+        patterns = kb_root / "domains" / "python" / "patterns"
+        write_yaml(patterns / "threads.yaml", {
+            'version': '1.0',
+            'category': 'python-async',
+            'patterns': [{'id': 'PYTHON-002', 'title': 'Thread pools', 'severity': 'low', 'scope': 'python'}]
+        })
+        stat = os.stat(patterns)
+        os.utime(patterns, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        updated = metrics.calculate_all()
+        assert sorted(Path(file_path).name for file_path in checked) == ['async.yaml', 'threads.yaml']
+        assert updated.yaml_files.total_entries == first.yaml_files.total_entries + 1
+
+    def test_watcher_reports_changes(self, kb_root):
+        metrics = MetricsCalculator(str(kb_root))
+        watcher = ChangeWatcher(KnowledgeSearch(repo_path=str(kb_root), auto_refresh=False), on_change=metrics.mark_changed)
+        watcher.poll()
+        metrics.calculate_all()
+
+        changed = dict(DOCKER_ERRORS)
+        changed['errors'] = [dict(DOCKER_ERRORS['errors'][0], severity='low', tags=[])]
+        touch_changed(kb_root / "domains" / "docker" / "errors" / "compose.yaml", changed)
+        (kb_root / "domains" / "python" / "patterns" / "async.yaml").unlink()
+        watcher.poll()
+
+        updated = metrics.calculate_all()
+        fresh = MetricsCalculator(str(kb_root)).calculate_all()
+        for key in ('yaml_files', 'domain_distribution', 'quality_scores', 'version_distribution'):
+            assert getattr(updated, key) == getattr(fresh, key)
+        assert updated.yaml_files.total_entries == 1
+
+    def test_single_pass_matches_individual_metrics(self, kb_root):
+        write_yaml(kb_root / "domains" / "docker" / "_meta.yaml", {'domain': 'docker'})
+        write_yaml(kb_root / "domains" / "docker" / "errors" / "catalog.yaml", {
+            'version': '1.0',
+            'errors': [dict(DOCKER_ERRORS['errors'][0], id='DOCKER-010')]
+        })
+
+        metrics = MetricsCalculator(str(kb_root))
+        result = metrics.calculate_all()
+
+        # One parse per file for all metrics; _meta.yaml is never parsed
+        assert metrics.parse_count == 3
+
+        separate = MetricsCalculator(str(kb_root))
+        assert result.yaml_files.model_dump() == separate.analyze_yaml_files()
+        assert result.quality_scores.model_dump() == separate.calculate_quality_distribution()
+        assert result.domain_distribution == separate.get_domain_distribution()
+        assert result.version_distribution == separate.get_version_distribution()
+        # catalog.yaml only counts toward the domain distribution
+        assert result.domain_distribution['docker'] == result.yaml_files.domains['docker']['entries'] + 1
+
+    def test_dashboard_reports_core_metrics(self, kb_root, capsys):
+        from tools.kb_metrics import KBMetrics
+
+        dashboard = KBMetrics(str(kb_root))
+        reported = dashboard.calculate_all_metrics()
+        core = MetricsCalculator(str(kb_root)).calculate_all().model_dump()
+
+        for key in ('repository_stats', 'yaml_files', 'domain_distribution', 'quality_scores', 'version_distribution'):
+            assert reported[key] == core[key]
+        assert reported['entry_types'] == {'errors': 2, 'patterns': 1}
+        assert dashboard.calculator.parse_count == 2
+
+        dashboard.print_dashboard(verbose=True)
+        assert "docker: 1 files, 2 entries" in capsys.readouterr().out
+
+    def test_repository_stats_reused_within_ttl(self, kb_root):
+        metrics = MetricsCalculator(str(kb_root), repo_stats_ttl=3600)
+        before = metrics.calculate_all().repository_stats.total_files
+        (kb_root / "notes.md").write_text("# Notes\n")
+
+        assert metrics.calculate_all().repository_stats.total_files == before
+
+        metrics.invalidate()
+        assert metrics.calculate_all().repository_stats.total_files == before + 1
+
+
+class TestRepositoryStats:
+    """Test the pruned repository walk and cached line counts."""
+
+    def test_ignored_directories_are_pruned_by_name(self, tmp_path):
+        (tmp_path / "node_modules" / "pkg").mkdir(parents=True)
+        (tmp_path / "node_modules" / "pkg" / "index.md").write_text("ignored\n")
+        (tmp_path / ".git").mkdir()
+        (tmp_path / ".git" / "HEAD").write_text("ref: refs/heads/main\n")
+        (tmp_path / "docs").mkdir()
+        # Names containing an ignored directory name are still counted
+        (tmp_path / "docs" / "environment.md").write_text("one\ntwo\n")
+        (tmp_path / ".gitignore").write_text("*.pyc")
+
+        stats = MetricsCalculator(str(tmp_path)).get_repository_stats()
+
+        assert stats['total_files'] == 2
+        assert stats['markdown_files'] == 1
+        assert stats['total_lines'] == 2
+
+    def test_count_lines(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(metrics_module, 'LINE_COUNT_CHUNK', 4)
+        sample = tmp_path / "sample.txt"
+
+        sample.write_bytes(b"alpha\nbeta\r\ngamma")
+        assert metrics_module.count_lines(str(sample)) == 3
+
+        sample.write_bytes(b"alpha\nbeta\n")
+        assert metrics_module.count_lines(str(sample)) == 2
+
+        sample.write_bytes(b"")
+        assert metrics_module.count_lines(str(sample)) == 0
+        assert metrics_module.count_lines(str(tmp_path / "missing.txt")) == 0
+
+    def test_line_counts_cached_by_signature(self, kb_root, monkeypatch):
+        counted = []
+        count_lines = metrics_module.count_lines
+        monkeypatch.setattr(metrics_module, 'count_lines', lambda path: counted.append(path) or count_lines(path))
+
+        metrics = MetricsCalculator(str(kb_root))
+        first = metrics.get_repository_stats()
+        assert len(counted) == first['yaml_files']
+
+        counted.clear()
+        changed = kb_root / "domains" / "docker" / "errors" / "compose.yaml"
+        touch_changed(changed, dict(DOCKER_ERRORS, notes='extra line'))
+
+        second = metrics.get_repository_stats()
+        assert counted == [str(changed)]
+        assert second['total_lines'] == first['total_lines'] + 1
+
+
+if __name__ == '__main__':
+    # Run tests
+    pytest.main([__file__, '-v'])
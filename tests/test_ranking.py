@@ -0,0 +1,41 @@
+"""
+Tests for tools.core BM25 ranking.
+
+This test suite ensures that:
+1. Results are ranked by field-weighted BM25
+"""
+
+import sys
+import pytest
+from pathlib import Path
+
+# Add repository root to path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from tools.core import KnowledgeSearch
+
+
+class TestRanking:
+    """Test BM25 relevance ranking."""
+
+    def test_title_match_ranks_first(self, kb_root):
+        search = KnowledgeSearch()
+
+        # "database" is in DOCKER-001's title but only in PYTHON-001's problem
+        results = search.search("database").all_results
+
+        assert [r.metadata.id for r in results] == ['DOCKER-001', 'PYTHON-001']
+        assert results[0].relevance_score == 1.0
+        assert 0.0 < results[1].relevance_score < 1.0
+
+    def test_best_match_survives_limit(self, kb_root):
+        search = KnowledgeSearch()
+
+        results = search.search("database", limit=1).all_results
+
+        assert [r.metadata.id for r in results] == ['DOCKER-001']
+
+
+if __name__ == '__main__':
+    # Run tests
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,83 @@
+"""
+Tests for tools.core entry schema.
+
+This test suite ensures that:
+1. One compiled entry schema drives validation and submission checks
+"""
+
+import sys
+import pickle
+import pytest
+import yaml
+from pathlib import Path
+
+# Add repository root to path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from tools.core import KnowledgeValidator
+from tools.core.schema import compile_schema, entry_schema
+
+from conftest import DOCKER_ERRORS
+
+
+class TestEntrySchema:
+    """Test the compiled entry schema."""
+
+    def test_reports_rule_violations(self):
+        entry = dict(DOCKER_ERRORS['errors'][0], id='docker-1', severity='urgent', solution={})
+        del entry['title']
+
+        errors, warnings = compile_schema().check(dict(DOCKER_ERRORS, errors=[entry]))
+
+        assert [(error_type, path) for error_type, _, path in errors] == [
+            ('required_field', 'errors[0].title'),
+            ('format', 'errors[0].severity'),
+        ]
+        assert [(error_type, path) for error_type, _, path in warnings] == [
+            ('format', 'errors[0].id'),
+            ('incomplete_solution', 'errors[0].solution'),
+        ]
+
+    def test_malformed_entries_are_errors(self):
+        content = dict(DOCKER_ERRORS, errors=[
+            dict(DOCKER_ERRORS['errors'][0], scope=['docker']),
+            'not an entry'
+        ])
+
+        errors, _ = compile_schema().check(content)
+
+        assert [path for _, _, path in errors] == ['errors[0].scope', 'errors[1]']
+
+    def test_validator_compiles_overridden_tables(self, kb_root):
+        class LenientValidator(KnowledgeValidator):
+            VALID_SEVERITIES = KnowledgeValidator.VALID_SEVERITIES + ['urgent']
+
+        default = KnowledgeValidator()
+        lenient = LenientValidator()
+
+        assert default.schema is compile_schema()
+        assert lenient.schema.definition == entry_schema(severities=LenientValidator.VALID_SEVERITIES)
+        assert lenient.cache_key() != default.cache_key()
+
+    def test_compiled_schema_pickles(self):
+        content = dict(DOCKER_ERRORS, errors=[dict(DOCKER_ERRORS['errors'][0], id='bad')])
+        schema = pickle.loads(pickle.dumps(compile_schema()))
+
+        assert schema.check(content) == compile_schema().check(content)
+
+    def test_submission_uses_schema(self):
+        from tools import kb_submit
+
+        entry = dict(DOCKER_ERRORS['errors'][0], severity='urgent')
+        is_valid, message, _ = kb_submit.validate_yaml_content(yaml.safe_dump(dict(DOCKER_ERRORS, errors=[entry])))
+
+        assert not is_valid
+        assert 'errors[0].severity' in message
+
+        is_valid, _, score = kb_submit.validate_yaml_content(yaml.safe_dump(DOCKER_ERRORS))
+        assert is_valid and score > 0
+
+
+if __name__ == '__main__':
+    # Run tests
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,250 @@
+"""
+Tests for tools.core search engine.
+
+This test suite ensures that:
+1. Search results are correct for cached and changed corpora
+2. Duplicate entry ids are tracked across files and KB tiers, with or
+   without an index
+3. Unranked results keep root, file path and entry order when files are re-indexed
+"""
+
+import sys
+import pytest
+from pathlib import Path
+
+# Add repository root to path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from tools.core import KnowledgeSearch, KnowledgeValidator
+from tools.core.binindex import BinaryIndex
+from tools.core.validation import EntryIdScan
+
+from conftest import DOCKER_ERRORS, write_yaml, touch_changed, line_of
+
+
+class TestDuplicateIds:
+    """Test the cross-file entry id registry."""
+
+    @pytest.fixture
+    def project_copy(self, kb_root):
+        """Project KB file redefining DOCKER-001"""
+        path = kb_root / ".kb" / "project" / "errors" / "local.yaml"
+        write_yaml(path, dict(DOCKER_ERRORS, errors=[dict(DOCKER_ERRORS['errors'][0], title='Local override')]))
+        return path
+
+    def test_finds_ids_defined_in_several_tiers(self, kb_root, project_copy):
+        duplicates = KnowledgeSearch().find_duplicate_ids()
+
+        assert list(duplicates) == ['DOCKER-001']
+        assert [(occurrence['kb_type'], occurrence['line_number']) for occurrence in duplicates['DOCKER-001']] == [
+            ('shared', line_of(kb_root / "domains" / "docker" / "errors" / "compose.yaml", 'id: DOCKER-001')),
+            ('project', line_of(project_copy, 'id: DOCKER-001')),
+        ]
+
+    def test_registry_is_maintained_incrementally(self, kb_root, project_copy):
+        search = KnowledgeSearch()
+        assert 'DOCKER-001' in search.find_duplicate_ids()
+
+        touch_changed(project_copy, dict(DOCKER_ERRORS, errors=[dict(DOCKER_ERRORS['errors'][0], id='LOCAL-001')]))
+        parsed = search.corpus.parse_count
+
+        assert search.find_duplicate_ids() == {}
+        assert search.corpus.parse_count == parsed + 1
+
+        touch_changed(project_copy, dict(DOCKER_ERRORS, errors=[DOCKER_ERRORS['errors'][1]]))
+        assert list(search.find_duplicate_ids()) == ['DOCKER-002']
+
+    def test_registry_is_restored_from_snapshot(self, kb_root, project_copy):
+        KnowledgeSearch().build_index()
+        search = KnowledgeSearch()
+
+        assert list(search.find_duplicate_ids()) == ['DOCKER-001']
+        assert search.corpus.parse_count == 0
+
+    def test_validator_reports_occurrences_in_scope(self, kb_root, project_copy):
+        errors = KnowledgeValidator().check_duplicate_ids(KnowledgeSearch(), [project_copy])
+
+        error, = errors
+        assert error.error_type == 'duplicate_id'
+        assert error.file_path == str(Path(".kb") / "project" / "errors" / "local.yaml")
+        assert error.field_path == 'errors[0].id'
+        assert 'compose.yaml' in error.message
+
+        assert len(KnowledgeValidator().check_duplicate_ids(KnowledgeSearch())) == 2
+
+    def test_scan_matches_index(self, kb_root, project_copy):
+        search = KnowledgeSearch()
+        scanned = EntryIdScan(search.search_roots()).find_duplicate_ids()
+
+        assert scanned == search.find_duplicate_ids()
+        assert KnowledgeValidator().check_duplicate_ids(EntryIdScan(search.search_roots()), [project_copy])
+
+    def test_sync_paths_patches_only_given_files(self, kb_root, project_copy):
+        KnowledgeSearch().build_index()
+        other = kb_root / ".kb" / "project" / "errors" / "other.yaml"
+        write_yaml(other, dict(DOCKER_ERRORS, errors=[DOCKER_ERRORS['errors'][1]]))
+        touch_changed(project_copy, dict(DOCKER_ERRORS, errors=[dict(DOCKER_ERRORS['errors'][0], id='LOCAL-001')]))
+
+        search = KnowledgeSearch(auto_refresh=False)
+        assert search.load_index()
+        assert list(search.find_duplicate_ids()) == ['DOCKER-001']
+
+        # Resolved paths map back onto the configured roots
+        assert search.sync_paths([project_copy.resolve(), kb_root / "README.md"]) == 1
+        assert search.find_duplicate_ids() == {}
+
+        assert search.sync_paths([other]) == 1
+        assert list(search.find_duplicate_ids()) == ['DOCKER-002']
+
+        other.unlink()
+        assert search.sync_paths([other]) == 1
+        assert search.find_duplicate_ids() == {}
+
+    def test_get_by_id_lists_ignored_duplicates(self, kb_root, project_copy):
+        found = KnowledgeSearch().get_by_id('DOCKER-001')
+
+        assert found['entry']['title'].startswith('Compose service')
+        assert [duplicate['kb_type'] for duplicate in found['duplicates']] == ['project']
+
+
+class TestSearch:
+    """Test search, lookup and browse behaviour."""
+
+    def test_get_by_id(self, kb_root):
+        search = KnowledgeSearch()
+
+        result = search.get_by_id("PYTHON-001")
+
+        assert result['entry']['title'].startswith('Bounded concurrency')
+        assert result['category'] == 'python-async'
+
+    def test_get_by_id_parses_at_most_one_file(self, kb_root):
+        KnowledgeSearch().build_index()
+        search = KnowledgeSearch()
+
+        assert search.get_by_id("DOCKER-002")['entry']['severity'] == 'low'
+        assert search.corpus.parse_count == 0
+
+        changed = dict(DOCKER_ERRORS)
+        changed['errors'] = [DOCKER_ERRORS['errors'][0], dict(DOCKER_ERRORS['errors'][1], severity='high')]
+        touch_changed(kb_root / "domains" / "docker" / "errors" / "compose.yaml", changed)
+
+        assert search.get_by_id("DOCKER-002")['entry']['severity'] == 'high'
+        assert search.corpus.parse_count == 1
+
+    def test_get_by_id_finds_new_file(self, kb_root):
+        search = KnowledgeSearch()
+        assert search.get_by_id("REDIS-001") is None
+
+        write_yaml(kb_root / "domains" / "redis" / "errors" / "redis.yaml", {
+            'version': '1.0',
+            'category': 'redis',
+            'errors': [{'id': 'REDIS-001', 'title': 'Eviction', 'severity': 'low', 'scope': 'universal'}]
+        })
+
+        assert search.get_by_id("REDIS-001")['category'] == 'redis'
+
+    def test_browse_by_category(self, kb_root):
+        search = KnowledgeSearch()
+
+        results = search.browse_by_category("docker-errors")
+
+        assert sorted(r.metadata.id for r in results) == ['DOCKER-001', 'DOCKER-002']
+
+    def test_order_survives_reindexing(self, kb_root):
+        search = KnowledgeSearch()
+        expected = ['DOCKER-001', 'DOCKER-002', 'PYTHON-001']
+        assert [r.metadata.id for r in search.search("").all_results] == expected
+
+        # Re-indexing reuses the freed document ids
+        touch_changed(kb_root / "domains" / "docker" / "errors" / "compose.yaml", DOCKER_ERRORS)
+
+        assert [r.metadata.id for r in search.search("").all_results] == expected
+        assert [r.metadata.id for r in search.iter_search("")] == expected
+        assert [r.metadata.id for r in search.browse_by_category("docker-errors")] == expected[:2]
+        with BinaryIndex.open(search.build_index()['binary_path']) as index:
+            assert [hit['metadata']['id'] for hit in index.query("")] == expected
+
+    def test_browse_by_kb_type(self, kb_root):
+        write_yaml(kb_root / ".kb" / "project" / "docker.yaml", {
+            'version': '1.0',
+            'category': 'docker-errors',
+            'errors': [{'id': 'PROJ-001', 'title': 'Local registry', 'severity': 'low', 'scope': 'project'}]
+        })
+        search = KnowledgeSearch()
+
+        assert [r.metadata.id for r in search.browse_by_category("docker-errors", kb_type="project")] == ['PROJ-001']
+        assert len(search.browse_by_category("docker-errors")) == 3
+
+    def test_category_and_tag_filters(self, kb_root):
+        search = KnowledgeSearch()
+
+        assert [r.metadata.id for r in search.search("", category="python-async").all_results] == ['PYTHON-001']
+        assert [r.metadata.id for r in search.search("docker", tags=["compose"]).all_results] == ['DOCKER-001']
+        assert search.search("docker", category="python-async").total == 0
+
+    def test_facet_counts(self, kb_root):
+        search = KnowledgeSearch()
+
+        facets = search.search("", limit=1).facets
+
+        assert facets['category'] == {'docker-errors': 2, 'python-async': 1}
+        assert facets['severity'] == {'high': 1, 'low': 1, 'medium': 1}
+        assert facets['tags']['docker'] == 2
+        assert search.search("database").facets['scope'] == {'docker': 1, 'python': 1}
+
+    def test_pagination(self, kb_root):
+        search = KnowledgeSearch()
+        everything = [r.metadata.id for r in search.search("").all_results]
+
+        first = search.search("", limit=2)
+        second = search.search("", limit=2, cursor=first.next_cursor)
+
+        assert first.has_more and not second.has_more
+        assert second.offset == 2
+        assert [r.metadata.id for r in first.all_results + second.all_results] == everything
+        assert [r.metadata.id for r in search.search("", limit=2, offset=1).all_results] == everything[1:3]
+
+    def test_cursor_is_bound_to_query(self, kb_root):
+        search = KnowledgeSearch()
+        cursor = search.search("docker", limit=1).next_cursor
+
+        with pytest.raises(ValueError):
+            search.search("compose", cursor=cursor)
+        with pytest.raises(ValueError):
+            search.search("docker", cursor="not-a-cursor")
+
+    def test_iter_search_stops_early(self, kb_root):
+        search = KnowledgeSearch()
+
+        results = list(search.iter_search("", limit=1))
+
+        assert len(results) == 1
+        assert search.corpus.parse_count == 1
+
+    def test_iter_search_ranked(self, kb_root):
+        search = KnowledgeSearch()
+
+        ranked = [r.metadata.id for r in search.iter_search("database")]
+
+        assert ranked == [r.metadata.id for r in search.search("database").all_results]
+        assert [r.metadata.id for r in search.iter_search("", severity="low")] == ['DOCKER-002']
+
+    def test_multi_word_query(self, kb_root):
+        search = KnowledgeSearch()
+
+        results = search.search("layer cache")
+
+        assert [r.metadata.id for r in results.all_results] == ['DOCKER-002']
+
+    def test_severity_filter(self, kb_root):
+        search = KnowledgeSearch()
+
+        results = search.search("docker", severity="low")
+
+        assert [r.metadata.id for r in results.all_results] == ['DOCKER-002']
+
+
+if __name__ == '__main__':
+    # Run tests
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,53 @@
+"""
+Tests for tools.core on-disk index snapshot.
+
+This test suite ensures that:
+1. The on-disk index is reused across processes and updated incrementally
+"""
+
+import sys
+import pytest
+from pathlib import Path
+
+# Add repository root to path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from tools.core import KnowledgeSearch
+
+from conftest import PYTHON_PATTERNS, touch_changed
+
+
+class TestIndexStore:
+    """Test building and loading the on-disk index."""
+
+    def test_loaded_index_skips_parsing(self, kb_root):
+        stats = KnowledgeSearch().build_index()
+        assert stats['entries'] == 3
+        assert (kb_root / ".kb" / "cache" / "search-index.pickle").exists()
+
+        search = KnowledgeSearch()
+        results = search.search("compose")
+
+        assert search.corpus.parse_count == 0
+        assert [r.metadata.id for r in results.all_results] == ['DOCKER-001']
+
+    def test_incremental_build(self, kb_root):
+        KnowledgeSearch().build_index()
+        touch_changed(kb_root / "domains" / "python" / "patterns" / "async.yaml", PYTHON_PATTERNS)
+
+        assert KnowledgeSearch().build_index()['parsed'] == 1
+        assert KnowledgeSearch().build_index(force=True)['parsed'] == 2
+
+    def test_stale_snapshot_is_updated_on_query(self, kb_root):
+        KnowledgeSearch().build_index()
+        (kb_root / "domains" / "docker" / "errors" / "compose.yaml").unlink()
+
+        search = KnowledgeSearch()
+
+        assert search.search("compose").total == 0
+        assert search.index_is_dirty
+
+
+if __name__ == '__main__':
+    # Run tests
+    pytest.main([__file__, '-v'])
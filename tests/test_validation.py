@@ -0,0 +1,170 @@
+"""
+Tests for tools.core validation.
+
+This test suite ensures that:
+1. Validation results are cached by content hash
+2. Validation runs in parallel, streams per-file results and stops early
+"""
+
+import os
+import sys
+import subprocess
+import pytest
+from pathlib import Path
+
+# Add repository root to path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from tools.core import KnowledgeValidator
+from tools.core import loader
+from tools.core import validation as validation_module
+from tools.core.validation import changed_files
+
+from conftest import DOCKER_ERRORS, write_yaml, touch_changed
+
+
+class TestValidationCache:
+    """Test content-hash caching of validation results."""
+
+    @pytest.fixture
+    def parsed(self, monkeypatch):
+        """Record files the validator parses"""
+        parsed = []
+        load_file = validation_module.load_file
+
+        def recording_load_file(path, **kwargs):
+            parsed.append(path)
+            return load_file(path, **kwargs)
+
+        monkeypatch.setattr(validation_module, 'load_file', recording_load_file)
+        return parsed
+
+    def test_unchanged_files_are_not_revalidated(self, kb_root, parsed):
+        compose = kb_root / "domains" / "docker" / "errors" / "compose.yaml"
+        broken = dict(DOCKER_ERRORS, errors=[dict(DOCKER_ERRORS['errors'][0], severity='urgent')])
+        write_yaml(compose, broken)
+
+        first = KnowledgeValidator(str(kb_root), cache=True).validate_directory(kb_root / "domains")
+        assert len(parsed) == 2
+
+        parsed.clear()
+        validator = KnowledgeValidator(str(kb_root), cache=True)
+        second = validator.validate_directory(kb_root / "domains")
+
+        assert parsed == []
+        assert validator.cache.hits == 2
+        assert second.errors == first.errors
+        assert second.warnings == first.warnings
+        assert 'errors[0].severity' in [error.field_path for error in second.errors]
+
+        # Fixing the file revalidates only that file
+        touch_changed(compose, DOCKER_ERRORS)
+        third = KnowledgeValidator(str(kb_root), cache=True).validate_directory(kb_root / "domains")
+        assert parsed == [compose]
+        assert len(third.errors) == len(first.errors) - 1
+
+    def test_touched_file_with_same_contents_is_reused(self, kb_root, parsed):
+        compose = kb_root / "domains" / "docker" / "errors" / "compose.yaml"
+        KnowledgeValidator(str(kb_root), cache=True).validate_file(compose)
+
+        stat = compose.stat()
+        os.utime(compose, ns=(stat.st_atime_ns, stat.st_mtime_ns + 5_000_000_000))
+        parsed.clear()
+
+        validator = KnowledgeValidator(str(kb_root), cache=True)
+        assert validator.validate_file(compose).is_valid
+        assert parsed == []
+        assert validator.cache.hits == 1
+
+    def test_rule_changes_invalidate_cache(self, kb_root, parsed):
+        class StrictValidator(KnowledgeValidator):
+            VALID_SCOPES = ['python']
+
+        KnowledgeValidator(str(kb_root), cache=True).validate_directory(kb_root / "domains")
+        parsed.clear()
+
+        result = StrictValidator(str(kb_root), cache=True).validate_directory(kb_root / "domains")
+        assert len(parsed) == 2
+        assert not result.is_valid
+
+    def test_changed_files_since_ref(self, kb_root):
+        def git(*args):
+            subprocess.run(
+                ['git', '-c', 'user.name=test', '-c', 'user.email=test@example.com', *args],
+                cwd=kb_root, check=True, capture_output=True
+            )
+
+        git('init', '-q')
+        git('add', '.')
+        git('commit', '-q', '-m', 'initial')
+
+        compose = kb_root / "domains" / "docker" / "errors" / "compose.yaml"
+        touch_changed(compose, dict(DOCKER_ERRORS, notes='changed'))
+        added = kb_root / "domains" / "docker" / "errors" / "build.yaml"
+        write_yaml(added, DOCKER_ERRORS)
+        write_yaml(kb_root / "domains" / "docker" / "_meta.yaml", {'domain': 'docker'})
+
+        assert changed_files('HEAD', kb_root) == sorted([added, compose])
+        assert changed_files('HEAD', kb_root, kb_root / "domains" / "python") == []
+
+        with pytest.raises(ValueError):
+            changed_files('no-such-ref', kb_root)
+
+
+class TestStreamingValidation:
+    """Test parallel, streamed validation with early stop."""
+
+    @pytest.fixture
+    def bulk_files(self, kb_root):
+        """Eight files with one invalid severity each, in validation order"""
+        paths = []
+        for number in range(8):
+            path = kb_root / "domains" / "bulk" / "errors" / f"bulk-{number}.yaml"
+            write_yaml(path, dict(DOCKER_ERRORS, errors=[
+                dict(DOCKER_ERRORS['errors'][0], id=f'BULK-{number:03d}', severity='urgent')
+            ]))
+            paths.append(path)
+        return paths
+
+    def test_parallel_matches_serial(self, bulk_files, monkeypatch):
+        monkeypatch.setattr(loader, 'PARALLEL_THRESHOLD', 2)
+
+        serial = KnowledgeValidator(workers=1).validate_files(bulk_files)
+        parallel = KnowledgeValidator(workers=2).validate_files(bulk_files)
+
+        assert parallel.files_checked == serial.files_checked == 8
+        assert parallel.errors == serial.errors
+        assert parallel.warnings == serial.warnings
+
+    def test_iter_validate_streams_in_order(self, bulk_files):
+        results = KnowledgeValidator().iter_validate(bulk_files)
+
+        first = next(results)
+        assert first.files_checked == 1
+        assert [error.file_path for error in first.errors] == [str(bulk_files[0])]
+        assert [result.errors[0].file_path for result in results] == [str(path) for path in bulk_files[1:]]
+
+    def test_max_errors_stops_early(self, bulk_files, monkeypatch):
+        parsed = []
+        load_file = validation_module.load_file
+        monkeypatch.setattr(validation_module, 'load_file', lambda path, **kwargs: parsed.append(path) or load_file(path, **kwargs))
+
+        result = KnowledgeValidator().validate_files(bulk_files, max_errors=3)
+
+        assert not result.is_valid
+        assert len(result.errors) == 3
+        assert result.files_checked == 3
+        assert parsed == bulk_files[:3]
+
+    def test_unpicklable_validator_validates_in_process(self, bulk_files, monkeypatch):
+        monkeypatch.setattr(loader, 'PARALLEL_THRESHOLD', 2)
+
+        class LenientValidator(KnowledgeValidator):
+            VALID_SEVERITIES = KnowledgeValidator.VALID_SEVERITIES + ['urgent']
+
+        assert LenientValidator(workers=2).validate_files(bulk_files).is_valid
+
+
+if __name__ == '__main__':
+    # Run tests
+    pytest.main([__file__, '-v'])
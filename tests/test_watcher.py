@@ -0,0 +1,97 @@
+"""
+Tests for tools.core change watcher.
+
+This test suite ensures that:
+1. Polling change detection patches only affected files
+"""
+
+import os
+import sys
+import pytest
+from pathlib import Path
+
+# Add repository root to path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from tools.core import KnowledgeSearch
+from tools.core.watcher import ChangeWatcher, git_head
+
+from conftest import DOCKER_ERRORS, PYTHON_PATTERNS, write_yaml, touch_changed
+
+
+class TestChangeWatcher:
+    """Test polling change detection for long-running engines."""
+
+    def test_poll_patches_only_changed_files(self, kb_root):
+        search = KnowledgeSearch(auto_refresh=False)
+        watcher = ChangeWatcher(search)
+        assert watcher.poll() == 2
+        parses = search.corpus.parse_count
+
+        changed = dict(PYTHON_PATTERNS)
+        changed['patterns'] = [dict(PYTHON_PATTERNS['patterns'][0], title='Renamed trio pattern')]
+        touch_changed(kb_root / "domains" / "python" / "patterns" / "async.yaml", changed)
+
+        # Queries trust the index until the next poll
+        assert search.search("trio").total == 0
+        assert watcher.poll() == 1
+        assert [r.metadata.id for r in search.search("trio").all_results] == ['PYTHON-001']
+        assert search.corpus.parse_count == parses + 1
+        assert watcher.poll() == 0
+
+    def test_poll_adds_and_removes_files(self, kb_root):
+        search = KnowledgeSearch(auto_refresh=False)
+        watcher = ChangeWatcher(search)
+        watcher.poll()
+
+        write_yaml(kb_root / ".kb" / "project" / "local" / "stripe.yaml", {
+            'version': '1.0',
+            'category': 'payments',
+            'errors': [dict(DOCKER_ERRORS['errors'][0], id='STRIPE-001', title='Stripe webhook retries', tags=['stripe'])]
+        })
+        (kb_root / "domains" / "docker" / "errors" / "compose.yaml").unlink()
+
+        assert watcher.poll() == 2
+        assert search.search("compose").total == 0
+        assert [r.kb_type for r in search.search("stripe").all_results] == ['project']
+
+    def test_shared_head_move_forces_reparse(self, kb_root):
+        shared_file = kb_root / ".kb" / "shared" / "domains" / "docker" / "compose.yaml"
+        write_yaml(shared_file, DOCKER_ERRORS)
+        git_dir = kb_root / ".kb" / "shared" / ".git"
+        (git_dir / "refs" / "heads").mkdir(parents=True)
+        (git_dir / "HEAD").write_text("ref: refs/heads/main\n")
+        (git_dir / "refs" / "heads" / "main").write_text("a" * 40 + "\n")
+
+        search = KnowledgeSearch(auto_refresh=False)
+        watcher = ChangeWatcher(search)
+        watcher.poll()
+        assert watcher.shared_head == "a" * 40
+
+        # Same size and mtime, so only the HEAD change reveals the edit
+        stat = shared_file.stat()
+        shared_file.write_text(shared_file.read_text().replace('Compose', 'Kompose'))
+        os.utime(shared_file, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        assert watcher.poll() == 0
+
+        (git_dir / "refs" / "heads" / "main").write_text("b" * 40 + "\n")
+
+        assert watcher.poll() == 1
+        assert search.search("kompose").total == 1
+
+    def test_git_head_follows_submodule_gitdir(self, tmp_path):
+        module_dir = tmp_path / "git" / "modules" / "shared"
+        module_dir.mkdir(parents=True)
+        (module_dir / "HEAD").write_text("ref: refs/heads/main\n")
+        (module_dir / "packed-refs").write_text("# pack-refs\n" + "c" * 40 + " refs/heads/main\n")
+        checkout = tmp_path / "shared"
+        checkout.mkdir()
+        (checkout / ".git").write_text("gitdir: ../git/modules/shared\n")
+
+        assert git_head(checkout) == "c" * 40
+        assert git_head(tmp_path / "missing") is None
+
+
+if __name__ == '__main__':
+    # Run tests
+    pytest.main([__file__, '-v'])
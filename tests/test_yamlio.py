@@ -0,0 +1,98 @@
+"""
+Tests for tools.core YAML layer.
+
+This test suite ensures that:
+1. The libyaml and pure-Python YAML loaders agree
+2. Validation errors and search results report source lines
+"""
+
+import sys
+import pytest
+from pathlib import Path
+
+# Add repository root to path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from tools.core import KnowledgeSearch, KnowledgeValidator
+from tools.core import loader, yamlio
+
+from conftest import DOCKER_ERRORS, write_yaml, line_of
+
+
+class TestYamlIO:
+    """Test the libyaml-accelerated YAML layer"""
+
+    def test_accelerated_loader_matches_pure(self):
+        text = yamlio.safe_dump(DOCKER_ERRORS, sort_keys=False)
+
+        assert yamlio.safe_load(text) == DOCKER_ERRORS
+        assert yamlio.safe_load(text, yamlio.PureSafeLoader) == DOCKER_ERRORS
+
+    def test_syntax_error_names_file(self, tmp_path):
+        broken = tmp_path / "broken.yaml"
+        broken.write_text("errors: [unclosed\n")
+
+        loaded = loader.load_file(broken)
+
+        assert loaded.error[0] == loader.ERROR_SYNTAX
+        assert str(broken) in loaded.error[1]
+
+
+class TestFieldLines:
+    """Test line numbers derived from the composed YAML node graph."""
+
+    def test_lines_come_from_the_same_parse(self):
+        text = yamlio.safe_dump(DOCKER_ERRORS, sort_keys=False)
+
+        data, lines = yamlio.safe_load_lines(text)
+
+        assert data == DOCKER_ERRORS
+        assert lines['version'] == 1
+        assert lines['errors[0]'] == lines['errors[0].id'] == 4
+        assert lines['errors[0].title'] == 5
+        assert 'errors[0].solution.code' not in lines  # Deeper than LINE_DEPTH
+
+    def test_field_line_falls_back_to_parent(self):
+        lines = {'errors': 3, 'errors[1]': 12, 'errors[1].id': 12}
+
+        assert yamlio.field_line(lines, 'errors[1].title') == 12
+        assert yamlio.field_line(lines, 'errors[4].title') == 3
+        assert yamlio.field_line(lines, 'version') is None
+
+    def test_validation_errors_have_lines(self, kb_root):
+        path = kb_root / "domains" / "docker" / "errors" / "compose.yaml"
+        entry = dict(DOCKER_ERRORS['errors'][1], severity='urgent')
+        del entry['title']
+        write_yaml(path, dict(DOCKER_ERRORS, errors=[DOCKER_ERRORS['errors'][0], entry]))
+
+        errors = {error.field_path: error.line_number for error in KnowledgeValidator().validate_file(path).errors}
+
+        assert errors == {
+            'errors[1].title': line_of(path, 'id: DOCKER-002'),
+            'errors[1].severity': line_of(path, 'severity: urgent'),
+        }
+
+    def test_syntax_errors_have_lines(self, kb_root):
+        path = kb_root / "domains" / "docker" / "errors" / "broken.yaml"
+        path.write_text("version: '1.0'\ncategory: docker\nerrors: [unclosed\n")
+
+        error, = KnowledgeValidator().validate_file(path).errors
+
+        assert error.error_type == 'syntax'
+        assert error.line_number == 4  # End of input, where the flow sequence is still open
+
+    def test_search_results_have_lines(self, kb_root):
+        path = kb_root / "domains" / "docker" / "errors" / "compose.yaml"
+        search = KnowledgeSearch()
+
+        result, = search.search("image build cache").all_results
+        found = search.get_by_id("DOCKER-002")
+
+        assert result.metadata.line_number == line_of(path, 'id: DOCKER-002')
+        assert found['line_number'] == result.metadata.line_number
+        assert found['lines']['severity'] == line_of(path, 'severity: low')
+
+
+if __name__ == '__main__':
+    # Run tests
+    pytest.main([__file__, '-v'])
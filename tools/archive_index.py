@@ -4,11 +4,15 @@ Archive Index Manager - Maintains catalog of condensed files.
 Provides fast lookups and metadata tracking.
 """
 
-import yaml
 from pathlib import Path
 from datetime import datetime
 from typing import Dict, List
 
+try:
+    from tools.core import yamlio
+except ImportError:
+    from core import yamlio
+
 
 class ArchiveIndex:
     """Manages the archive index (catalog of condensed files)."""
@@ -24,7 +28,7 @@ class ArchiveIndex:
         """Load existing index or create new."""
         if self.index_file.exists():
             with open(self.index_file, 'r') as f:
-                return yaml.safe_load(f) or {"files": [], "last_updated": None}
+                return yamlio.safe_load(f) or {"files": [], "last_updated": None}
         return {"files": [], "last_updated": None}
 
     def _save_index(self):
@@ -32,7 +36,7 @@ class ArchiveIndex:
         self.index_file.parent.mkdir(parents=True, exist_ok=True)
         self.index_data["last_updated"] = datetime.now().isoformat()
         with open(self.index_file, 'w') as f:
-            yaml.dump(self.index_data, f, default_flow_style=False)
+            yamlio.safe_dump(self.index_data, f, default_flow_style=False)
 
     def add_entry(self, source_file: str, condensed_file: str, metadata: Dict):
         """Add condensed file to index."""
@@ -144,13 +148,13 @@ class ProcessingLog:
         """Load existing log or create new."""
         if self.log_file.exists():
             with open(self.log_file, 'r') as f:
-                return yaml.safe_load(f) or []
+                return yamlio.safe_load(f) or []
         return []
 
     def _save_log(self):
         """Save log to disk."""
         with open(self.log_file, 'w') as f:
-            yaml.dump(self.entries, f, default_flow_style=False)
+            yamlio.safe_dump(self.entries, f, default_flow_style=False)
 
     def log_processing(self, source_file: str, result: Dict):
         """Log a processing event."""
@@ -235,7 +239,7 @@ if __name__ == "__main__":
         fm_match = re.match(r'^---\n(.*?)\n---', content, re.DOTALL)
         if fm_match:
             try:
-                metadata = yaml.safe_load(fm_match.group(1))
+                metadata = yamlio.safe_load(fm_match.group(1))
             except:
                 pass
         
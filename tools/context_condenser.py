@@ -7,13 +7,17 @@ It prepares files for the Agent to condense manually.
 
 import os
 import sys
-import yaml
 from pathlib import Path
 from datetime import datetime
 from typing import Optional, List, Tuple
 from dataclasses import dataclass
 import hashlib
 
+try:
+    from tools.core import yamlio
+except ImportError:
+    from core import yamlio
+
 @dataclass
 class CondensingResult:
     """Result of context condensing operation."""
@@ -90,7 +94,7 @@ def create_markdown_output(metadata: dict, condensed_content: str, tags: List[st
         "tags": tags
     }
 
-    frontmatter_yaml = yaml.dump(frontmatter, default_flow_style=False)
+    frontmatter_yaml = yamlio.safe_dump(frontmatter, default_flow_style=False)
 
     markdown = f"""---
 {frontmatter_yaml}---
@@ -7,7 +7,11 @@ Used by the background agent to chunk files and save results.
 from pathlib import Path
 from typing import List
 import hashlib
-import yaml
+
+try:
+    from tools.core import yamlio
+except ImportError:
+    from core import yamlio
 
 
 def chunk_text(text: str, chunk_size: int = 12000) -> List[str]:
@@ -110,7 +114,7 @@ def save_condensed_file(
             "tags": tags
         }
 
-        frontmatter_yaml = yaml.dump(frontmatter, default_flow_style=False)
+        frontmatter_yaml = yamlio.safe_dump(frontmatter, default_flow_style=False)
 
         markdown = f"""---
 {frontmatter_yaml}---
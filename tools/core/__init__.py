@@ -7,8 +7,20 @@ used by CLI tools, MCP server, and future API interfaces.
 
 Classes:
     KnowledgeSearch: Search knowledge entries with filters
+    CorpusCache: In-memory cache of parsed knowledge files
+    BinaryIndex: Memory-mapped search index for one-shot queries
+    KnowledgeDaemon: Resident search daemon serving a Unix socket
+    DaemonClient: Client for a running search daemon
+    ChangeWatcher: Keeps a long-running search index current by polling
+    ToolExecutor: Runs blocking tool calls off the event loop with per-tool limits
     MetricsCalculator: Calculate repository metrics and quality scores
     KnowledgeValidator: Validate YAML files and entries
+    ValidationCache: Content-hash cache of per-file validation results
+    CompiledSchema: Entry schema compiled for fast checking
+
+Modules:
+    yamlio: YAML loading and dumping (libyaml-accelerated when available)
+    daemon: Search daemon protocol, server and client
 
 Example:
     >>> from tools.core import KnowledgeSearch, MetricsCalculator
@@ -24,33 +36,104 @@ Example:
     >>> print(f"Average quality: {repo_metrics.quality_scores.avg_score}/100")
 """
 
-from .search import KnowledgeSearch
-from .metrics import MetricsCalculator
-from .validation import KnowledgeValidator
-from .models import (
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+# Exported names and the submodule defining each. Submodules are imported
+# on first attribute access, so lightweight readers such as
+# core.binindex do not pay for pydantic and the YAML parser.
+_EXPORTS = {
+    # Main classes
+    'KnowledgeSearch': '.search',
+    'CorpusCache': '.corpus',
+    'BinaryIndex': '.binindex',
+    'KnowledgeDaemon': '.daemon',
+    'DaemonClient': '.daemon',
+    'ChangeWatcher': '.watcher',
+    'ToolExecutor': '.executor',
+    'MetricsCalculator': '.metrics',
+    'KnowledgeValidator': '.validation',
+    'ValidationCache': '.valcache',
+    'CompiledSchema': '.schema',
     # Search models
-    SearchFilter,
-    SearchResult,
-    SearchResults,
-    EntryMetadata,
+    'SearchFilter': '.models',
+    'SearchResult': '.models',
+    'SearchResults': '.models',
+    'EntryMetadata': '.models',
     # Metrics models
-    QualityScore,
-    RepositoryStats,
-    YamlStats,
-    QualityDistribution,
-    Metrics,
+    'QualityScore': '.models',
+    'RepositoryStats': '.models',
+    'YamlStats': '.models',
+    'QualityDistribution': '.models',
+    'Metrics': '.models',
     # Validation models
-    ValidationError,
-    ValidationResult,
+    'ValidationError': '.models',
+    'ValidationResult': '.models',
     # Health models
-    HealthStatus
-)
+    'HealthStatus': '.models',
+}
+
+# Public submodules, also imported on first attribute access
+_SUBMODULES = ('yamlio', 'daemon')
+
+if TYPE_CHECKING:
+    from . import yamlio
+    from .search import KnowledgeSearch
+    from .corpus import CorpusCache
+    from .binindex import BinaryIndex
+    from .daemon import KnowledgeDaemon, DaemonClient
+    from .watcher import ChangeWatcher
+    from .executor import ToolExecutor
+    from .metrics import MetricsCalculator
+    from .validation import KnowledgeValidator
+    from .valcache import ValidationCache
+    from .schema import CompiledSchema
+    from .models import (
+        SearchFilter,
+        SearchResult,
+        SearchResults,
+        EntryMetadata,
+        QualityScore,
+        RepositoryStats,
+        YamlStats,
+        QualityDistribution,
+        Metrics,
+        ValidationError,
+        ValidationResult,
+        HealthStatus
+    )
+
+
+def __getattr__(name):
+    if name in _SUBMODULES:
+        return import_module(f'.{name}', __name__)
+
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_EXPORTS) + list(_SUBMODULES))
+
 
 __all__ = [
     # Main classes
     'KnowledgeSearch',
+    'CorpusCache',
+    'BinaryIndex',
+    'KnowledgeDaemon',
+    'DaemonClient',
+    'ChangeWatcher',
+    'ToolExecutor',
     'MetricsCalculator',
     'KnowledgeValidator',
+    'ValidationCache',
+    'CompiledSchema',
     # Search models
     'SearchFilter',
     'SearchResult',
@@ -0,0 +1,553 @@
+"""
+Memory-mapped binary search index for Shared Knowledge Base.
+
+One-shot CLI searches start a fresh process per query. This module
+writes the inverted index to a compact, versioned binary file that is
+memory-mapped and queried in place: the vocabulary is binary searched,
+only the posting lists of the query tokens are read, filters run on
+fixed-width metadata columns, and entry payloads are decoded for the
+returned hits only. Nothing here imports pydantic or the YAML parser.
+
+File layout (little-endian):
+
+    header      magic, format version, section count, doc count, token count
+    sections    (offset, length) for each entry of SECTIONS
+    meta        JSON: search roots and their doc ranges, column value
+                tables, field length averages and the directory stamps
+                used for freshness
+    vocabulary  sorted token records (string offset, string length,
+                first posting, posting count)
+    strings     token bytes
+    postings    (doc, packed value) records, grouped by token, doc ascending
+    columns     u16 arrays of root, severity, scope and category codes
+    lengths     u16 token count per field, per doc
+    offsets     (offset, length) of each doc payload
+    payloads    JSON entry metadata and preview per doc
+"""
+
+import json
+import mmap
+import os
+import struct
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Any, Callable, Iterator, TYPE_CHECKING
+
+from .index import KnowledgeIndex, FIELDS, tokenize, unpack_frequencies
+from .ranking import BM25Scorer, idf, ranked
+
+if TYPE_CHECKING:
+    from .models import SearchResults
+
+# Bump when the binary layout changes
+BINARY_FORMAT_VERSION = 2
+
+BINARY_INDEX_FILENAME = "search-index.bin"
+
+MAGIC = b'SKBI'
+
+SECTIONS = (
+    'meta',
+    'vocabulary',
+    'strings',
+    'postings',
+    'columns',
+    'lengths',
+    'offsets',
+    'payloads',
+)
+
+# Metadata columns, each stored as a u16 array of codes into meta['values']
+COLUMNS = ('root', 'severity', 'scope', 'category')
+
+HEADER = struct.Struct('<4sHHII')
+SECTION = struct.Struct('<QQ')
+VOCABULARY_RECORD = struct.Struct('<IIII')
+POSTING_RECORD = struct.Struct('<IQ')
+COLUMN_VALUE = struct.Struct('<H')
+LENGTHS_RECORD = struct.Struct('<' + 'H' * len(FIELDS))
+OFFSET_RECORD = struct.Struct('<II')
+
+U16_MAX = (1 << 16) - 1
+
+# Search root roles, matching the include flags of KnowledgeSearch.search()
+ROLE_SEARCH = 'search'
+ROLE_PROJECT = 'project'
+ROLE_SHARED = 'shared'
+
+
+def write_binary_index(
+    path: Path,
+    index: KnowledgeIndex,
+    roots: List[Tuple[str, str, str]],
+    payload: Callable[[Any], Optional[Dict[str, Any]]]
+) -> Path:
+    """
+    Write an index to the binary format.
+
+    Args:
+        path: Output file
+        index: Up-to-date knowledge index
+        roots: (root path, KB type, role) per search root, in priority order
+        payload: Builds the stored JSON payload for an entry (None if invalid)
+
+    Returns:
+        Path to the written file
+    """
+    path = Path(path)
+
+    # Dense document numbers by root, then file path and entry position, so
+    # ties rank as in KnowledgeSearch and each root is one doc range
+    root_codes = {root: code for code, (root, _, _) in enumerate(roots)}
+    doc_ids = sorted(
+        index.docs,
+        key=lambda doc_id: (root_codes.get(index.doc_roots.get(doc_id), U16_MAX), *index.doc_order(doc_id))
+    )
+    dense = {doc_id: number for number, doc_id in enumerate(doc_ids)}
+
+    values: Dict[str, List[str]] = {column: [] for column in COLUMNS[1:]}
+    codes: Dict[str, Dict[str, int]] = {column: {} for column in COLUMNS[1:]}
+
+    def code_for(column: str, value: Any) -> int:
+        value = '' if value is None else str(value)
+        code = codes[column].get(value)
+        if code is None:
+            code = codes[column][value] = len(values[column])
+            values[column].append(value)
+        return code
+
+    columns = {column: [] for column in COLUMNS}
+    lengths = bytearray()
+    offsets = bytearray()
+    payloads = bytearray()
+
+    for doc_id in doc_ids:
+        item = index.docs[doc_id]
+        columns['root'].append(root_codes.get(index.doc_roots.get(doc_id), U16_MAX))
+        columns['severity'].append(code_for('severity', item.entry.get('severity')))
+        columns['scope'].append(code_for('scope', item.entry.get('scope')))
+        columns['category'].append(code_for('category', item.category))
+
+        doc_lengths = index.tokens.field_lengths.get(doc_id, (0,) * len(FIELDS))
+        lengths += LENGTHS_RECORD.pack(*(min(length, U16_MAX) for length in doc_lengths))
+
+        data = payload(item)
+        encoded = json.dumps(data, separators=(',', ':')).encode('utf-8') if data is not None else b''
+        offsets += OFFSET_RECORD.pack(len(payloads), len(encoded))
+        payloads += encoded
+
+    if any(len(table) > U16_MAX for table in values.values()):
+        raise ValueError("Too many distinct metadata values for the binary index")
+
+    column_bytes = bytearray()
+    for column in COLUMNS:
+        for code in columns[column]:
+            column_bytes += COLUMN_VALUE.pack(code)
+
+    vocabulary = bytearray()
+    strings = bytearray()
+    postings = bytearray()
+    posting_count = 0
+
+    for token in sorted(index.tokens.postings):
+        encoded = token.encode('utf-8')
+        posting = index.tokens.postings[token]
+        vocabulary += VOCABULARY_RECORD.pack(len(strings), len(encoded), posting_count, len(posting))
+        strings += encoded
+        for doc_id in sorted(posting, key=dense.__getitem__):
+            postings += POSTING_RECORD.pack(dense[doc_id], posting[doc_id])
+        posting_count += len(posting)
+
+    root_docs = [[0, 0] for _ in roots]
+    for number, code in enumerate(columns['root']):
+        if code != U16_MAX:
+            if root_docs[code][1] == 0:
+                root_docs[code][0] = number
+            root_docs[code][1] = number + 1
+
+    meta = {
+        'roots': [
+            {'path': root, 'kb_type': kb_type, 'role': role, 'docs': docs}
+            for (root, kb_type, role), docs in zip(roots, root_docs)
+        ],
+        'values': values,
+        'average_field_lengths': index.tokens.average_field_lengths(),
+        'dirs': _directory_stamps(root for root, _, _ in roots),
+        'created_at': time.time()
+    }
+
+    sections = [
+        json.dumps(meta, separators=(',', ':')).encode('utf-8'),
+        vocabulary,
+        strings,
+        postings,
+        column_bytes,
+        lengths,
+        offsets,
+        payloads,
+    ]
+
+    header = HEADER.pack(MAGIC, BINARY_FORMAT_VERSION, len(SECTIONS), len(doc_ids), len(index.tokens.postings))
+    offset = HEADER.size + SECTION.size * len(SECTIONS)
+    table = bytearray()
+    for data in sections:
+        table += SECTION.pack(offset, len(data))
+        offset += len(data)
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    # Write to a temp file first so readers never map a partial index
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=path.name, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(header)
+            f.write(table)
+            for data in sections:
+                f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+    return path
+
+
+def _directory_stamps(roots: Iterator[str]) -> List[List[Any]]:
+    """Get [path, mtime_ns] of every directory under the roots (None if missing)"""
+    stamps = []
+
+    for root in roots:
+        if not os.path.isdir(root):
+            stamps.append([root, None])
+            continue
+
+        for dirpath, _, _ in os.walk(root):
+            try:
+                stamps.append([dirpath, os.stat(dirpath).st_mtime_ns])
+            except OSError:
+                stamps.append([dirpath, None])
+
+    return stamps
+
+
+class BinaryIndex:
+    """
+    Read-only, memory-mapped view of a binary search index.
+
+    Queries rank and filter like KnowledgeSearch.search() on the same
+    corpus, but touch only the vocabulary records, the posting lists of
+    the query tokens, and the payloads of the returned hits.
+    """
+
+    def __init__(self, path: Path, data: mmap.mmap):
+        """
+        Initialize from a mapped file (use BinaryIndex.open()).
+
+        Args:
+            path: Path to the index file
+            data: Memory-mapped file contents
+
+        Raises:
+            ValueError: If the file is not a compatible binary index
+        """
+        self.path = Path(path)
+        self._data = data
+
+        if len(data) < HEADER.size:
+            raise ValueError(f"Truncated binary index: {path}")
+
+        magic, version, section_count, self.doc_count, self.token_count = HEADER.unpack_from(data, 0)
+        if magic != MAGIC or version != BINARY_FORMAT_VERSION or section_count != len(SECTIONS):
+            raise ValueError(f"Unsupported binary index: {path}")
+
+        self._sections: Dict[str, Tuple[int, int]] = {}
+        for position, name in enumerate(SECTIONS):
+            offset, length = SECTION.unpack_from(data, HEADER.size + SECTION.size * position)
+            if offset + length > len(data):
+                raise ValueError(f"Truncated binary index: {path}")
+            self._sections[name] = (offset, length)
+
+        offset, length = self._sections['meta']
+        self.meta = json.loads(bytes(data[offset:offset + length]))
+
+        self._vocabulary_offset = self._sections['vocabulary'][0]
+        self._strings_offset = self._sections['strings'][0]
+        self._postings_offset = self._sections['postings'][0]
+        self._lengths_offset = self._sections['lengths'][0]
+        self._offsets_offset = self._sections['offsets'][0]
+        self._payloads_offset = self._sections['payloads'][0]
+        self._columns_offset = {
+            column: self._sections['columns'][0] + COLUMN_VALUE.size * self.doc_count * position
+            for position, column in enumerate(COLUMNS)
+        }
+        self.scorer = BM25Scorer()
+
+    @classmethod
+    def open(cls, path: Path) -> Optional['BinaryIndex']:
+        """
+        Map a binary index file.
+
+        Returns:
+            BinaryIndex, or None if the file is missing or incompatible
+        """
+        try:
+            with open(path, 'rb') as f:
+                data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            return None
+
+        try:
+            return cls(path, data)
+        except (ValueError, struct.error):
+            data.close()
+            return None
+
+    def close(self) -> None:
+        self._data.close()
+
+    def __enter__(self) -> 'BinaryIndex':
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    @property
+    def roots(self) -> List[str]:
+        """Search root paths in priority order"""
+        return [root['path'] for root in self.meta['roots']]
+
+    def is_fresh(self) -> bool:
+        """
+        Check that no directory under the search roots changed since the index was written.
+
+        New, removed and renamed files (including files saved through a
+        temp file and rename) change their directory's mtime, so only
+        directories are checked, not every indexed file. Files edited in
+        place are picked up by the next `kb.py index`, which compares
+        every file.
+        """
+        for dir_path, mtime_ns in self.meta['dirs']:
+            try:
+                current = os.stat(dir_path).st_mtime_ns
+            except OSError:
+                current = None
+            if current != mtime_ns:
+                return False
+
+        return True
+
+    def _token(self, position: int) -> bytes:
+        """Get the bytes of the vocabulary token at a position"""
+        string_offset, string_length, _, _ = VOCABULARY_RECORD.unpack_from(
+            self._data, self._vocabulary_offset + VOCABULARY_RECORD.size * position
+        )
+        start = self._strings_offset + string_offset
+        return self._data[start:start + string_length]
+
+    def expand(self, token: str) -> List[int]:
+        """Get vocabulary positions of indexed tokens that start with the given token"""
+        prefix = token.encode('utf-8')
+
+        low, high = 0, self.token_count
+        while low < high:
+            middle = (low + high) // 2
+            if self._token(middle) < prefix:
+                low = middle + 1
+            else:
+                high = middle
+
+        positions = []
+        while low < self.token_count and self._token(low).startswith(prefix):
+            positions.append(low)
+            low += 1
+
+        return positions
+
+    def term_frequencies(self, token: str) -> Dict[int, List[int]]:
+        """
+        Get per-field term frequencies of a token and its prefix expansions.
+
+        Returns:
+            Mapping of document number to term frequency per field
+        """
+        frequencies: Dict[int, List[int]] = {}
+
+        for position in self.expand(token):
+            _, _, first, count = VOCABULARY_RECORD.unpack_from(
+                self._data, self._vocabulary_offset + VOCABULARY_RECORD.size * position
+            )
+            start = self._postings_offset + POSTING_RECORD.size * first
+            for doc, value in POSTING_RECORD.iter_unpack(self._data[start:start + POSTING_RECORD.size * count]):
+                freqs = unpack_frequencies(value)
+                current = frequencies.get(doc)
+                if current is None:
+                    frequencies[doc] = freqs
+                else:
+                    for field, tf in enumerate(freqs):
+                        current[field] += tf
+
+        return frequencies
+
+    def column(self, name: str, doc: int) -> int:
+        """Get the code of a metadata column for a document"""
+        return COLUMN_VALUE.unpack_from(self._data, self._columns_offset[name] + COLUMN_VALUE.size * doc)[0]
+
+    def field_lengths(self, doc: int) -> Tuple[int, ...]:
+        """Get the token count per field of a document"""
+        return LENGTHS_RECORD.unpack_from(self._data, self._lengths_offset + LENGTHS_RECORD.size * doc)
+
+    def payload(self, doc: int) -> Optional[Dict[str, Any]]:
+        """Decode the stored payload of a document (None for invalid entries)"""
+        offset, length = OFFSET_RECORD.unpack_from(self._data, self._offsets_offset + OFFSET_RECORD.size * doc)
+        if not length:
+            return None
+        start = self._payloads_offset + offset
+        return json.loads(bytes(self._data[start:start + length]))
+
+    def query(
+        self,
+        query: str,
+        category: Optional[str] = None,
+        severity: Optional[str] = None,
+        scope: Optional[str] = None,
+        limit: Optional[int] = 50,
+        include_project: bool = True,
+        include_shared: bool = True,
+        unique_ids: bool = True
+    ) -> List[Dict[str, Any]]:
+        """
+        Search the index.
+
+        Args:
+            query: Search string to match
+            category: Filter by category
+            severity: Filter by severity level
+            scope: Filter by scope
+            limit: Maximum results to return (None for all)
+            include_project: Include project KB results
+            include_shared: Include shared KB results
+            unique_ids: Only return the highest priority entry of each ID
+
+        Returns:
+            Result dicts ('metadata', 'preview', 'relevance_score', 'kb_type'), best match first
+        """
+        excluded_roles = set()
+        if not include_project:
+            excluded_roles.add(ROLE_PROJECT)
+        if not include_shared:
+            excluded_roles.add(ROLE_SHARED)
+
+        root_order = {
+            code: code for code, root in enumerate(self.meta['roots'])
+            if root['role'] not in excluded_roles
+        }
+
+        filters = []
+        for column, value in (('category', category), ('severity', severity), ('scope', scope)):
+            if not value:
+                continue
+            table = self.meta['values'][column]
+            if value not in table:
+                return []
+            filters.append((column, table.index(value)))
+
+        def accepted(doc: int) -> bool:
+            if self.column('root', doc) not in root_order:
+                return False
+            return all(self.column(column, doc) == code for column, code in filters)
+
+        tokens = list(dict.fromkeys(tokenize(query)))
+
+        if tokens:
+            # Intersect posting lists smallest-first, then rank by BM25
+            frequencies = sorted((self.term_frequencies(token) for token in tokens), key=len)
+            candidates = set(frequencies[0])
+            for token_frequencies in frequencies[1:]:
+                candidates.intersection_update(token_frequencies)
+
+            matches = [doc for doc in sorted(candidates) if accepted(doc)]
+
+            avg_lengths = self.meta['average_field_lengths']
+            scores = {doc: 0.0 for doc in matches}
+            for token_frequencies in frequencies:
+                token_idf = idf(self.doc_count, len(token_frequencies))
+                for doc in matches:
+                    scores[doc] += token_idf * self.scorer.term_score(
+                        token_frequencies[doc], self.field_lengths(doc), avg_lengths
+                    )
+
+            best = max(scores.values(), default=0.0) or 1.0
+            stream = (
+                (doc, score / best)
+                for doc, score in ranked(scores, {doc: self.column('root', doc) for doc in matches})
+            )
+        else:
+            # Unranked: root priority, then file path and entry position
+            # (the doc number order). Each root is a
+            # doc range, read lazily until limit results were found
+            stream = (
+                (doc, 1.0)
+                for code, root in enumerate(self.meta['roots']) if code in root_order
+                for doc in range(*root['docs']) if accepted(doc)
+            )
+
+        roots = self.meta['roots']
+        results = []
+        seen_ids = set()
+
+        for doc, relevance in stream:
+            if limit is not None and len(results) >= limit:
+                break
+
+            payload = self.payload(doc)
+            if payload is None:
+                continue
+
+            entry_id = payload['metadata'].get('id')
+            if unique_ids and entry_id in seen_ids:
+                continue
+
+            seen_ids.add(entry_id)
+            payload['relevance_score'] = round(min(max(relevance, 0.0), 1.0), 4)
+            payload['kb_type'] = roots[self.column('root', doc)]['kb_type']
+            results.append(payload)
+
+        return results
+
+    def search(self, query: str, **kwargs: Any) -> 'SearchResults':
+        """
+        Search the index and build SearchResults like KnowledgeSearch.search().
+
+        Accepts the keyword arguments of query().
+        """
+        from .models import SearchFilter, SearchResult, SearchResults, EntryMetadata
+
+        start_time = time.time()
+        results = [
+            SearchResult(
+                metadata=EntryMetadata(**hit['metadata']),
+                preview=hit['preview'],
+                relevance_score=hit['relevance_score'],
+                kb_type=hit['kb_type']
+            )
+            for hit in self.query(query, **kwargs)
+        ]
+
+        return SearchResults(
+            query=query,
+            total=len(results),
+            project_results=[r for r in results if r.kb_type == "project"],
+            shared_results=[r for r in results if r.kb_type == "shared"],
+            filters_applied=SearchFilter(
+                query=query,
+                category=kwargs.get('category'),
+                severity=kwargs.get('severity'),
+                scope=kwargs.get('scope'),
+                limit=kwargs.get('limit', 50)
+            ),
+            execution_time_ms=(time.time() - start_time) * 1000
+        )
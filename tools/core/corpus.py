@@ -0,0 +1,253 @@
+"""
+Parsed-entry corpus cache for Shared Knowledge Base.
+
+Keeps parsed YAML knowledge files in memory, keyed by file path and
+(mtime, size) signature, so repeated queries only re-parse files that
+actually changed on disk. Files are parsed with their field lines, so
+every entry knows the line it starts on.
+"""
+
+import os
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Any, Iterable
+
+from .loader import LoadedFile, load_file, load_files
+
+# (st_mtime_ns, st_size) of a file at the time it was parsed
+FileSignature = Tuple[int, int]
+
+# Top-level sections that hold knowledge entries
+ENTRY_SECTIONS = ('errors', 'patterns')
+
+# YAML files under search roots that hold no entries
+SKIPPED_FILES = ('_index.yaml', '_meta.yaml', 'catalog.yaml')
+
+
+def is_corpus_file(file_path: Any) -> bool:
+    """Check whether a YAML file under a search root belongs to the corpus"""
+    path = str(file_path)
+    return not any(name in path for name in SKIPPED_FILES)
+
+
+class CorpusEntry:
+    """Single error or pattern entry together with its source location"""
+
+    __slots__ = ('entry', 'file_path', 'category', 'kb_type', 'section', 'position', 'lines')
+
+    def __init__(
+        self,
+        entry: Dict[str, Any],
+        file_path: Path,
+        category: str,
+        kb_type: str,
+        section: str,
+        position: int,
+        lines: Optional[Dict[str, int]] = None
+    ):
+        self.entry = entry
+        self.file_path = file_path
+        self.category = category
+        self.kb_type = kb_type
+        self.section = section
+        self.position = position
+        self.lines = lines
+
+    @property
+    def field_path(self) -> str:
+        """Path of the entry within its file, e.g. errors[2]"""
+        return f"{self.section}[{self.position}]"
+
+    @property
+    def line(self) -> Optional[int]:
+        """Line the entry starts on, if known"""
+        return self.lines.get(self.field_path) if self.lines else None
+
+    def field_lines(self) -> Dict[str, int]:
+        """Lines of the entry's fields, by field name"""
+        if not self.lines:
+            return {}
+        prefix = self.field_path + '.'
+        return {
+            name[len(prefix):]: line for name, line in self.lines.items()
+            if name.startswith(prefix)
+        }
+
+    @property
+    def is_pattern(self) -> bool:
+        return self.section == 'patterns'
+
+
+class CorpusFile:
+    """Parsed contents of a single YAML file"""
+
+    __slots__ = ('path', 'signature', 'kb_type', 'content', 'lines', 'entries')
+
+    def __init__(
+        self,
+        path: Path,
+        signature: FileSignature,
+        kb_type: str,
+        content: Optional[Dict[str, Any]],
+        lines: Optional[Dict[str, int]] = None
+    ):
+        self.path = path
+        self.signature = signature
+        self.kb_type = kb_type
+        self.content = content
+        self.lines = lines
+        self.entries = self._collect_entries()
+
+    @property
+    def category(self) -> str:
+        return self.content.get('category', '') if self.content else ''
+
+    def _collect_entries(self) -> List[CorpusEntry]:
+        """Flatten errors and patterns into a list of entries"""
+        entries = []
+
+        if not self.content:
+            return entries
+
+        category = self.category
+        for section in ENTRY_SECTIONS:
+            for position, entry in enumerate(self.content.get(section) or []):
+                if isinstance(entry, dict):
+                    entries.append(CorpusEntry(
+                        entry, self.path, category, self.kb_type, section, position, self.lines
+                    ))
+
+        return entries
+
+
+class CorpusCache:
+    """
+    In-memory cache of parsed knowledge files.
+
+    Files are re-parsed only when their (mtime, size) signature changes,
+    so a warm query never touches the YAML parser.
+    """
+
+    def __init__(self):
+        self._files: Dict[str, CorpusFile] = {}
+        self.parse_count = 0
+
+    @staticmethod
+    def signature(file_path: Path) -> Optional[FileSignature]:
+        """Get the cache signature of a file, or None if it is missing"""
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def get(self, file_path: Path, kb_type: str = "shared") -> Optional[CorpusFile]:
+        """
+        Get parsed file contents, re-parsing only if the file changed.
+
+        Args:
+            file_path: Path to YAML file
+            kb_type: "project" or "shared"
+
+        Returns:
+            CorpusFile, or None if the file no longer exists
+        """
+        key = str(file_path)
+        signature = self.signature(file_path)
+
+        if signature is None:
+            self._files.pop(key, None)
+            return None
+
+        cached = self._files.get(key)
+        if cached is not None and cached.signature == signature and cached.kb_type == kb_type:
+            return cached
+
+        self.parse_count += 1
+        loaded = load_file(file_path, lines=True)
+        corpus_file = CorpusFile(file_path, signature, kb_type, self._content(loaded), self._lines(loaded))
+        self._files[key] = corpus_file
+        return corpus_file
+
+    def preload(
+        self,
+        file_paths: Iterable[Path],
+        kb_type: str = "shared",
+        workers: Optional[int] = None
+    ) -> int:
+        """
+        Parse files that are missing or stale in the cache, in parallel.
+
+        Args:
+            file_paths: Files about to be read with get()
+            kb_type: "project" or "shared"
+            workers: Worker processes (default: KB_WORKERS or CPU count)
+
+        Returns:
+            Number of files parsed
+        """
+        stale = []
+        for file_path in file_paths:
+            cached = self._files.get(str(file_path))
+            if cached is None or cached.kb_type != kb_type or cached.signature != self.signature(file_path):
+                stale.append(file_path)
+
+        for file_path, loaded in zip(stale, load_files(stale, workers, lines=True)):
+            self.parse_count += 1
+            if loaded.signature is None:
+                self._files.pop(str(file_path), None)
+                continue
+            self._files[str(file_path)] = CorpusFile(
+                file_path, loaded.signature, kb_type, self._content(loaded), self._lines(loaded)
+            )
+
+        return len(stale)
+
+    @staticmethod
+    def _content(loaded: LoadedFile) -> Optional[Dict[str, Any]]:
+        """Parsed contents, or None for unreadable or non-mapping files"""
+        if not loaded.ok:
+            return None
+        return loaded.content if isinstance(loaded.content, dict) else None
+
+    @classmethod
+    def _lines(cls, loaded: LoadedFile) -> Optional[Dict[str, int]]:
+        return loaded.lines if cls._content(loaded) is not None else None
+
+    def discard(self, file_path: Path) -> None:
+        """Drop a file from the cache"""
+        self._files.pop(str(file_path), None)
+
+    def prune(self, keep: Iterable[str]) -> List[str]:
+        """
+        Drop cached files that are not in keep.
+
+        Args:
+            keep: File paths (as strings) that are still part of the corpus
+
+        Returns:
+            List of removed file paths
+        """
+        keep = set(keep)
+        removed = [key for key in self._files if key not in keep]
+        for key in removed:
+            del self._files[key]
+        return removed
+
+    def clear(self) -> None:
+        """Drop all cached files"""
+        self._files.clear()
+
+    def get_state(self) -> Dict[str, CorpusFile]:
+        """Get cached files for persistence"""
+        return dict(self._files)
+
+    def set_state(self, files: Dict[str, CorpusFile]) -> None:
+        """Replace cached files with previously persisted ones"""
+        self._files.clear()
+        self._files.update(files)
+
+    def __contains__(self, file_path: object) -> bool:
+        return str(file_path) in self._files
+
+    def __len__(self) -> int:
+        return len(self._files)
@@ -0,0 +1,325 @@
+"""
+Resident search daemon for Shared Knowledge Base.
+
+A long-lived process keeps a warm KnowledgeSearch (parsed corpus, token
+index and facets) and answers requests over a Unix socket. One-shot
+clients such as `kb.py search` then pay for a socket round trip
+instead of interpreter warm-up, index loading and YAML parsing.
+
+Requests and responses are single lines of JSON:
+
+    {"protocol": 1, "command": "search", "args": {"query": "docker"}}
+    {"ok": true, "result": {...}}
+    {"ok": false, "error": "..."}
+
+DaemonClient only needs socket and json, so clients stay cheap to
+import. When no daemon is running they run the same command in-process
+with execute(), which produces the same result.
+"""
+
+import json
+import os
+import socket
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+PROTOCOL_VERSION = 1
+
+# Socket location relative to the repository root
+DAEMON_SOCKET_PATH = Path(".kb") / "cache" / "kb-daemon.sock"
+
+# Overrides the socket location
+SOCKET_ENV = "KB_DAEMON_SOCKET"
+
+COMMANDS = ('ping', 'search', 'get', 'browse', 'shutdown')
+
+# Seconds a client waits for a response before falling back
+DEFAULT_TIMEOUT = 10.0
+
+# Results per search request when a query asks for all of them (the
+# largest limit SearchFilter accepts)
+QUERY_PAGE_SIZE = 500
+
+
+class DaemonError(Exception):
+    """Error reported by the daemon for a request"""
+
+
+def socket_path(repo_path: Optional[str] = None) -> Path:
+    """Get the daemon socket path for a repository (KB_DAEMON_SOCKET overrides it)"""
+    override = os.environ.get(SOCKET_ENV)
+    if override:
+        return Path(override)
+    return (Path(repo_path) if repo_path else Path()) / DAEMON_SOCKET_PATH
+
+
+def _absolute(file_path: str) -> str:
+    """Make a file path independent of the daemon's working directory"""
+    return os.path.abspath(file_path)
+
+
+def execute(engine: Any, command: str, args: Dict[str, Any]) -> Any:
+    """
+    Run a command against a search engine.
+
+    Used by the daemon for every request and by clients in-process when
+    the daemon is not running, so both paths return the same data.
+
+    Args:
+        engine: KnowledgeSearch instance
+        command: One of COMMANDS, except 'shutdown'
+        args: Command arguments
+
+    Returns:
+        JSON-serializable result:
+        - search: SearchResults as a dict
+        - get: {'entry', 'file_path', 'category'} or None
+        - browse: List of SearchResult dicts
+
+    Raises:
+        ValueError: For unknown commands or invalid arguments
+    """
+    if command == 'ping':
+        return {'pid': os.getpid(), 'protocol': PROTOCOL_VERSION}
+
+    if command == 'search':
+        results = engine.search(**args).model_dump(mode='json', exclude={'filters_applied'})
+        for result in results['project_results'] + results['shared_results']:
+            result['metadata']['file_path'] = _absolute(result['metadata']['file_path'])
+        return results
+
+    if command == 'get':
+        found = engine.get_by_id(args['entry_id'])
+        if found is not None:
+            found = dict(
+                found,
+                file_path=_absolute(found['file_path']),
+                duplicates=[
+                    dict(duplicate, file_path=_absolute(duplicate['file_path']))
+                    for duplicate in found['duplicates']
+                ]
+            )
+        return found
+
+    if command == 'browse':
+        results = [result.model_dump(mode='json') for result in engine.browse_by_category(**args)]
+        for result in results:
+            result['metadata']['file_path'] = _absolute(result['metadata']['file_path'])
+        return results
+
+    raise ValueError(f"Unknown command: {command}")
+
+
+class DaemonClient:
+    """
+    Connection to a running search daemon.
+
+    Example:
+        >>> client = DaemonClient.connect(socket_path())
+        >>> if client is not None:
+        ...     results = client.request('search', query='docker')
+    """
+
+    def __init__(self, sock: socket.socket, path: Path):
+        self.path = path
+        self._sock = sock
+        self._reader = sock.makefile('rb')
+
+    @classmethod
+    def connect(cls, path: Path, timeout: float = DEFAULT_TIMEOUT) -> Optional['DaemonClient']:
+        """
+        Connect to the daemon listening on a socket.
+
+        Returns:
+            DaemonClient, or None if no daemon is listening
+        """
+        path = Path(path)
+        if not hasattr(socket, 'AF_UNIX') or not path.exists():
+            return None
+
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(timeout)
+        try:
+            sock.connect(str(path))
+        except OSError:
+            sock.close()
+            return None
+
+        return cls(sock, path)
+
+    def request(self, command: str, **args: Any) -> Any:
+        """
+        Send a command and wait for its result.
+
+        Raises:
+            DaemonError: If the daemon reports an error for the request
+            OSError: If the connection fails (the daemon went away)
+        """
+        message = {'protocol': PROTOCOL_VERSION, 'command': command, 'args': args}
+        self._sock.sendall(json.dumps(message, default=str).encode('utf-8') + b'\n')
+
+        line = self._reader.readline()
+        if not line:
+            raise ConnectionError(f"Daemon at {self.path} closed the connection")
+
+        response = json.loads(line)
+        if not response.get('ok'):
+            raise DaemonError(response.get('error', 'Unknown daemon error'))
+        return response.get('result')
+
+    def query(
+        self,
+        query: str,
+        category: Optional[str] = None,
+        severity: Optional[str] = None,
+        scope: Optional[str] = None,
+        limit: Optional[int] = 50,
+        include_project: bool = True,
+        include_shared: bool = True,
+        unique_ids: bool = True
+    ) -> List[Dict[str, Any]]:
+        """
+        Search through the daemon, in the same form as BinaryIndex.query().
+
+        With limit None, all results are fetched QUERY_PAGE_SIZE at a time.
+
+        Returns:
+            Result dicts ('metadata', 'preview', 'relevance_score', 'kb_type'), best match first
+        """
+        results = []
+
+        while True:
+            page = self.request(
+                'search',
+                query=query,
+                category=category,
+                severity=severity,
+                scope=scope,
+                limit=limit if limit is not None else QUERY_PAGE_SIZE,
+                offset=len(results),
+                include_project=include_project,
+                include_shared=include_shared,
+                unique_ids=unique_ids
+            )
+            results.extend(page['project_results'] + page['shared_results'])
+            if limit is not None or not page['has_more']:
+                return results
+
+    def close(self) -> None:
+        """Close the connection"""
+        self._reader.close()
+        self._sock.close()
+
+    def __enter__(self) -> 'DaemonClient':
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+
+class KnowledgeDaemon:
+    """
+    Search daemon serving one warm KnowledgeSearch over a Unix socket.
+
+    Connections are handled on their own threads; commands run one at a
+    time under a lock because the engine updates its index in place.
+    Every command refreshes changed files first, so results stay current
+    while the daemon runs.
+    """
+
+    def __init__(self, engine: Any, path: Path):
+        """
+        Initialize daemon.
+
+        Args:
+            engine: KnowledgeSearch to serve
+            path: Socket path to listen on
+        """
+        self.engine = engine
+        self.path = Path(path)
+        self.lock = threading.Lock()
+        self._server = None
+
+    def warm(self) -> None:
+        """Load the index snapshot and bring it up to date before serving"""
+        self.engine.load_index()
+        self.engine.search("", limit=1)
+
+    def handle(self, message: Dict[str, Any]) -> Dict[str, Any]:
+        """Answer one request message"""
+        if message.get('protocol') != PROTOCOL_VERSION:
+            return {'ok': False, 'error': f"Unsupported protocol: {message.get('protocol')} (daemon speaks {PROTOCOL_VERSION})"}
+
+        command = message.get('command')
+        if command not in COMMANDS:
+            return {'ok': False, 'error': f"Unknown command: {command}"}
+
+        if command == 'shutdown':
+            # shutdown() waits for serve_forever(), so it can't run on a handler thread
+            threading.Thread(target=self.stop, daemon=True).start()
+            return {'ok': True, 'result': None}
+
+        try:
+            with self.lock:
+                result = execute(self.engine, command, message.get('args') or {})
+        except (TypeError, KeyError, ValueError) as e:
+            return {'ok': False, 'error': f"Invalid request: {e}"}
+        except Exception as e:
+            # Report any other failure instead of dropping the connection
+            return {'ok': False, 'error': f"{type(e).__name__}: {e}"}
+
+        return {'ok': True, 'result': result}
+
+    def serve_forever(self) -> None:
+        """
+        Listen on the socket until stopped.
+
+        Raises:
+            RuntimeError: If another daemon is already listening on the socket
+        """
+        import socketserver
+
+        running = DaemonClient.connect(self.path, timeout=1.0)
+        if running is not None:
+            running.close()
+            raise RuntimeError(f"A daemon is already listening on {self.path}")
+
+        # Left behind by a daemon that did not exit cleanly
+        if self.path.exists():
+            self.path.unlink()
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        daemon = self
+
+        class Handler(socketserver.StreamRequestHandler):
+            def handle(self):
+                for line in self.rfile:
+                    try:
+                        response = daemon.handle(json.loads(line))
+                    except ValueError as e:
+                        response = {'ok': False, 'error': f"Invalid request: {e}"}
+                    self.wfile.write(json.dumps(response, default=str).encode('utf-8') + b'\n')
+
+        class Server(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+            daemon_threads = True
+
+        # Only the owner may query the daemon
+        old_umask = os.umask(0o177)
+        try:
+            self._server = Server(str(self.path), Handler)
+        finally:
+            os.umask(old_umask)
+
+        try:
+            self._server.serve_forever()
+        finally:
+            self._server.server_close()
+            self._server = None
+            if self.path.exists():
+                self.path.unlink()
+
+    def stop(self) -> None:
+        """Stop serving (safe to call from another thread)"""
+        if self._server is not None:
+            self._server.shutdown()
@@ -0,0 +1,104 @@
+"""
+Bounded executor for blocking tool calls.
+
+Search, validation and metrics do synchronous file I/O and YAML parsing.
+Long-running asyncio servers such as the MCP server run them through a
+ToolExecutor instead of on the event loop:
+
+- Calls run on a fixed-size thread pool, so the event loop keeps reading
+  and answering requests while a slow call runs.
+- Each tool has its own concurrency limit. Calls over the limit wait
+  without holding a thread, so a burst of expensive calls cannot starve
+  cheap ones.
+- Cancelling the awaiting task cancels a call that has not started yet.
+  A call that is already running finishes on its thread and its result
+  is discarded.
+
+The thread count defaults to DEFAULT_THREADS and can be set with the
+KB_TOOL_THREADS environment variable.
+"""
+
+import asyncio
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, Callable, Dict, Optional
+
+THREADS_ENV = "KB_TOOL_THREADS"
+
+DEFAULT_THREADS = 8
+
+
+def default_threads() -> int:
+    """Get the thread count from KB_TOOL_THREADS, or DEFAULT_THREADS"""
+    try:
+        threads = int(os.environ.get(THREADS_ENV, ''))
+    except ValueError:
+        threads = DEFAULT_THREADS
+    return max(threads, 1)
+
+
+class ToolExecutor:
+    """
+    Runs blocking tool calls on a thread pool with per-tool limits.
+
+    Example:
+        >>> executor = ToolExecutor({'kb_search': 4, 'kb_stats': 1})
+        >>> results = await executor.run('kb_search', engine.search, 'docker')
+    """
+
+    def __init__(
+        self,
+        limits: Dict[str, int],
+        threads: Optional[int] = None,
+        default_limit: int = 1
+    ):
+        """
+        Initialize executor.
+
+        Args:
+            limits: Maximum concurrent calls per tool name
+            threads: Worker threads (default: KB_TOOL_THREADS or DEFAULT_THREADS)
+            default_limit: Limit for tools not listed in limits
+        """
+        self.limits = dict(limits)
+        self.default_limit = default_limit
+        self.threads = threads or default_threads()
+        self._pool = ThreadPoolExecutor(max_workers=self.threads, thread_name_prefix="kb-tool")
+        self._semaphores: Dict[str, asyncio.Semaphore] = {}
+
+    def _semaphore(self, name: str) -> asyncio.Semaphore:
+        semaphore = self._semaphores.get(name)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(max(self.limits.get(name, self.default_limit), 1))
+            self._semaphores[name] = semaphore
+        return semaphore
+
+    async def run(self, name: str, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """
+        Run a blocking call on the pool, within the limit for its tool.
+
+        Args:
+            name: Tool name the limit applies to
+            func: Blocking callable
+            *args, **kwargs: Arguments for func
+
+        Returns:
+            Result of func
+
+        Raises:
+            asyncio.CancelledError: If the awaiting task was cancelled
+            Exception: Whatever func raised
+        """
+        async with self._semaphore(name):
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._pool, partial(func, *args, **kwargs))
+
+    def shutdown(self) -> None:
+        """Drop queued calls and stop accepting new ones (running calls finish)"""
+        if sys.version_info >= (3, 9):
+            self._pool.shutdown(wait=False, cancel_futures=True)
+        else:
+            # cancel_futures is new in 3.9; queued calls still run on 3.8
+            self._pool.shutdown(wait=False)
@@ -0,0 +1,148 @@
+"""
+Facet indexes for Shared Knowledge Base.
+
+Maps each value of an entry facet (category, scope, severity, tags) to
+a bitset of document ids, stored as a Python int. Filters combine with
+bitwise AND, matching documents are enumerated bit by bit, and facet
+counts are popcounts, so filtering and browsing cost is proportional to
+the number of results rather than the size of the corpus.
+"""
+
+from typing import Dict, List, Optional, Tuple, Any, Iterable, Iterator
+
+# Facets reported in search results
+FACETS = ('category', 'scope', 'severity', 'tags')
+
+# Internal facet used to restrict queries to search roots
+ROOT_FACET = 'root'
+
+
+def iter_bits(bits: int) -> Iterator[int]:
+    """Yield the positions of set bits, lowest first"""
+    while bits:
+        lowest = bits & -bits
+        yield lowest.bit_length() - 1
+        bits ^= lowest
+
+
+def bits_of(doc_ids: Iterable[int]) -> int:
+    """Build a bitset from document ids"""
+    bits = 0
+    for doc_id in doc_ids:
+        bits |= 1 << doc_id
+    return bits
+
+
+def facet_values(entry: Dict[str, Any], category: str, root: str) -> List[Tuple[str, str]]:
+    """Get the (facet, value) pairs of an entry"""
+    values = [(ROOT_FACET, root)]
+
+    if category:
+        values.append(('category', category))
+
+    for facet in ('scope', 'severity'):
+        value = entry.get(facet)
+        if isinstance(value, str) and value:
+            values.append((facet, value))
+
+    tags = entry.get('tags')
+    if isinstance(tags, str):
+        tags = [tags]
+    if isinstance(tags, list):
+        values.extend(('tags', str(tag)) for tag in dict.fromkeys(tags) if tag)
+
+    return values
+
+
+class FacetIndex:
+    """
+    Facet value to document bitset index.
+
+    Document ids are kept dense by KnowledgeIndex, so bitsets stay about
+    as wide as the corpus is large.
+    """
+
+    def __init__(self):
+        self.bits: Dict[str, Dict[str, int]] = {}
+        self.all = 0
+        self._doc_values: Dict[int, List[Tuple[str, str]]] = {}
+
+    def add(self, doc_id: int, values: List[Tuple[str, str]]) -> None:
+        """Add a document under (facet, value) pairs"""
+        bit = 1 << doc_id
+        for facet, value in values:
+            facet_bits = self.bits.setdefault(facet, {})
+            facet_bits[value] = facet_bits.get(value, 0) | bit
+
+        self._doc_values[doc_id] = values
+        self.all |= bit
+
+    def remove(self, doc_id: int) -> None:
+        """Remove a document from every facet value"""
+        bit = 1 << doc_id
+        for facet, value in self._doc_values.pop(doc_id, ()):
+            facet_bits = self.bits.get(facet)
+            if facet_bits is None or value not in facet_bits:
+                continue
+            facet_bits[value] &= ~bit
+            if not facet_bits[value]:
+                del facet_bits[value]
+
+        self.all &= ~bit
+
+    def get(self, facet: str, value: str) -> int:
+        """Get the bitset of documents with a facet value"""
+        return self.bits.get(facet, {}).get(value, 0)
+
+    def any_of(self, facet: str, values: Iterable[str]) -> int:
+        """Get the bitset of documents with any of the facet values"""
+        bits = 0
+        for value in values:
+            bits |= self.get(facet, value)
+        return bits
+
+    def select(self, bits: Optional[int] = None, **filters: Any) -> int:
+        """
+        Narrow a bitset by facet filters.
+
+        Args:
+            bits: Bitset to narrow (default: all documents)
+            **filters: Facet name to required value, or list of values that
+                must all be present (None to skip the facet)
+
+        Returns:
+            Bitset of documents matching every filter
+        """
+        selected = self.all if bits is None else bits
+
+        for facet, required in filters.items():
+            if required is None:
+                continue
+            for value in (required if isinstance(required, (list, tuple, set)) else [required]):
+                selected &= self.get(facet, value)
+                if not selected:
+                    return 0
+
+        return selected
+
+    def counts(self, bits: int, facets: Iterable[str] = FACETS) -> Dict[str, Dict[str, int]]:
+        """
+        Count documents per facet value within a bitset.
+
+        Returns:
+            Mapping of facet to {value: count}, largest count first
+        """
+        counts = {}
+
+        for facet in facets:
+            facet_counts = {}
+            for value, value_bits in self.bits.get(facet, {}).items():
+                count = bin(value_bits & bits).count('1')
+                if count:
+                    facet_counts[value] = count
+            counts[facet] = dict(sorted(facet_counts.items(), key=lambda item: (-item[1], item[0])))
+
+        return counts
+
+    def __len__(self) -> int:
+        return len(self._doc_values)
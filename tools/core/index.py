@@ -0,0 +1,487 @@
+"""
+Inverted token index for Shared Knowledge Base.
+
+Maps tokens from the searchable entry fields to posting lists of entry
+ids with field masks, so a query only intersects posting lists instead
+of scanning every entry in the corpus. Postings also carry per-field
+term frequencies and the index tracks field lengths for BM25 ranking.
+"""
+
+import re
+from bisect import bisect_left
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple, Any, Iterable
+
+from .corpus import CorpusCache, CorpusEntry, CorpusFile
+from .facets import FacetIndex, facet_values
+
+# Field bits used in posting list masks
+FIELD_ID = 1 << 0
+FIELD_TITLE = 1 << 1
+FIELD_PROBLEM = 1 << 2
+FIELD_ROOT_CAUSE = 1 << 3
+FIELD_SOLUTION_CODE = 1 << 4
+FIELD_SOLUTION_EXPLANATION = 1 << 5
+FIELD_TAGS = 1 << 6
+
+# Field bits in index order (FIELDS[i] == 1 << i)
+FIELDS = (
+    FIELD_ID,
+    FIELD_TITLE,
+    FIELD_PROBLEM,
+    FIELD_ROOT_CAUSE,
+    FIELD_SOLUTION_CODE,
+    FIELD_SOLUTION_EXPLANATION,
+    FIELD_TAGS,
+)
+
+# Posting values pack the field mask into the low bits, followed by an
+# 8-bit term frequency per field
+MASK_BITS = len(FIELDS)
+MASK = (1 << MASK_BITS) - 1
+TF_BITS = 8
+TF_MAX = (1 << TF_BITS) - 1
+
+FIELD_NAMES = {
+    FIELD_ID: 'id',
+    FIELD_TITLE: 'title',
+    FIELD_PROBLEM: 'problem',
+    FIELD_ROOT_CAUSE: 'root_cause',
+    FIELD_SOLUTION_CODE: 'solution.code',
+    FIELD_SOLUTION_EXPLANATION: 'solution.explanation',
+    FIELD_TAGS: 'tags',
+}
+
+TOKEN_PATTERN = re.compile(r'[a-z0-9]+')
+
+
+def tokenize(text: Any) -> List[str]:
+    """Split text into lowercase alphanumeric tokens"""
+    if not text:
+        return []
+    return TOKEN_PATTERN.findall(str(text).lower())
+
+
+def entry_fields(entry: Dict[str, Any]) -> List[Tuple[int, Any]]:
+    """Get (field bit, value) pairs for the searchable fields of an entry"""
+    fields = [
+        (FIELD_ID, entry.get('id')),
+        (FIELD_TITLE, entry.get('title')),
+        (FIELD_PROBLEM, entry.get('problem')),
+        (FIELD_ROOT_CAUSE, entry.get('root_cause')),
+    ]
+
+    solution = entry.get('solution')
+    if isinstance(solution, dict):
+        fields.append((FIELD_SOLUTION_CODE, solution.get('code')))
+        fields.append((FIELD_SOLUTION_EXPLANATION, solution.get('explanation')))
+
+    tags = entry.get('tags')
+    if isinstance(tags, list):
+        fields.append((FIELD_TAGS, ' '.join(str(tag) for tag in tags if tag)))
+    elif tags:
+        fields.append((FIELD_TAGS, tags))
+
+    return fields
+
+
+def pack_posting(freqs: List[int]) -> int:
+    """Pack per-field term frequencies (indexed like FIELDS) into a posting value"""
+    value = 0
+    for position, tf in enumerate(freqs):
+        if tf:
+            value |= FIELDS[position]
+            value |= min(tf, TF_MAX) << (MASK_BITS + TF_BITS * position)
+    return value
+
+
+def unpack_frequencies(value: int) -> List[int]:
+    """Unpack per-field term frequencies from a posting value"""
+    freqs = value >> MASK_BITS
+    return [(freqs >> (TF_BITS * position)) & TF_MAX for position in range(len(FIELDS))]
+
+
+class InvertedIndex:
+    """
+    Token to posting list index.
+
+    Each posting list maps a document id to a packed value holding a
+    bitmask of the fields the token occurs in and its frequency in each
+    field. Query tokens match indexed tokens by prefix, so "async" still
+    finds "asyncio".
+    """
+
+    def __init__(self):
+        self.postings: Dict[str, Dict[int, int]] = {}
+        self.field_lengths: Dict[int, Tuple[int, ...]] = {}
+        self.total_field_lengths = [0] * len(FIELDS)
+        self._doc_tokens: Dict[int, List[str]] = {}
+        self._vocabulary: Optional[List[str]] = None
+
+    def add(self, doc_id: int, entry: Dict[str, Any]) -> None:
+        """Index the searchable fields of an entry"""
+        freqs: Dict[str, List[int]] = {}
+        lengths = [0] * len(FIELDS)
+
+        for field, value in entry_fields(entry):
+            position = field.bit_length() - 1
+            tokens = tokenize(value)
+            lengths[position] += len(tokens)
+            for token in tokens:
+                token_freqs = freqs.get(token)
+                if token_freqs is None:
+                    token_freqs = freqs[token] = [0] * len(FIELDS)
+                token_freqs[position] += 1
+
+        for token, token_freqs in freqs.items():
+            posting = self.postings.get(token)
+            if posting is None:
+                posting = self.postings[token] = {}
+                self._vocabulary = None
+            posting[doc_id] = pack_posting(token_freqs)
+
+        self._doc_tokens[doc_id] = list(freqs)
+        self.field_lengths[doc_id] = tuple(lengths)
+        for position, length in enumerate(lengths):
+            self.total_field_lengths[position] += length
+
+    def remove(self, doc_id: int) -> None:
+        """Remove a document from all posting lists"""
+        for token in self._doc_tokens.pop(doc_id, ()):
+            posting = self.postings.get(token)
+            if posting is None:
+                continue
+            posting.pop(doc_id, None)
+            if not posting:
+                del self.postings[token]
+                self._vocabulary = None
+
+        lengths = self.field_lengths.pop(doc_id, None)
+        if lengths is not None:
+            for position, length in enumerate(lengths):
+                self.total_field_lengths[position] -= length
+
+    def expand(self, token: str) -> List[str]:
+        """Get indexed tokens that start with the given token"""
+        vocabulary = self._sorted_vocabulary()
+        expansions = []
+
+        for position in range(bisect_left(vocabulary, token), len(vocabulary)):
+            candidate = vocabulary[position]
+            if not candidate.startswith(token):
+                break
+            expansions.append(candidate)
+
+        return expansions
+
+    def lookup(self, token: str) -> Dict[int, int]:
+        """
+        Get documents containing a token or any indexed token it prefixes.
+
+        Returns:
+            Mapping of document id to field mask
+        """
+        matches: Dict[int, int] = {}
+
+        for candidate in self.expand(token):
+            for doc_id, value in self.postings[candidate].items():
+                matches[doc_id] = matches.get(doc_id, 0) | (value & MASK)
+
+        return matches
+
+    def term_frequencies(self, token: str) -> Dict[int, List[int]]:
+        """
+        Get per-field term frequencies of a token and its prefix expansions.
+
+        Returns:
+            Mapping of document id to term frequency per field (indexed like FIELDS)
+        """
+        frequencies: Dict[int, List[int]] = {}
+
+        for candidate in self.expand(token):
+            for doc_id, value in self.postings[candidate].items():
+                freqs = unpack_frequencies(value)
+                current = frequencies.get(doc_id)
+                if current is None:
+                    frequencies[doc_id] = freqs
+                else:
+                    for position, tf in enumerate(freqs):
+                        current[position] += tf
+
+        return frequencies
+
+    def average_field_lengths(self) -> List[float]:
+        """Average token count per field across indexed documents"""
+        count = len(self.field_lengths) or 1
+        return [total / count for total in self.total_field_lengths]
+
+    def match(self, query: str) -> Dict[int, int]:
+        """
+        Find documents matching every token of a query.
+
+        Posting lists are intersected smallest-first.
+
+        Returns:
+            Mapping of document id to the fields that matched
+        """
+        tokens = list(dict.fromkeys(tokenize(query)))
+        if not tokens:
+            return {}
+
+        postings = sorted((self.lookup(token) for token in tokens), key=len)
+
+        matches = postings[0]
+        for posting in postings[1:]:
+            if not matches:
+                break
+            matches = {
+                doc_id: mask | posting[doc_id]
+                for doc_id, mask in matches.items()
+                if doc_id in posting
+            }
+
+        return matches
+
+    def _sorted_vocabulary(self) -> List[str]:
+        """Sorted token list for prefix lookups, rebuilt after vocabulary changes"""
+        if self._vocabulary is None:
+            self._vocabulary = sorted(self.postings)
+        return self._vocabulary
+
+    def __len__(self) -> int:
+        return len(self._doc_tokens)
+
+
+class IndexedFile:
+    """Bookkeeping for a file whose entries are in the index"""
+
+    __slots__ = ('corpus_file', 'root', 'doc_ids')
+
+    def __init__(self, corpus_file: CorpusFile, root: str, doc_ids: List[int]):
+        self.corpus_file = corpus_file
+        self.root = root
+        self.doc_ids = doc_ids
+
+
+class KnowledgeIndex:
+    """
+    Document table and token index over the parsed corpus.
+
+    Keeps entries from the corpus cache in sync with the inverted index
+    and facet bitsets, re-indexing only files whose parsed contents
+    changed.
+    """
+
+    def __init__(self, corpus: Optional[CorpusCache] = None):
+        self.corpus = corpus if corpus is not None else CorpusCache()
+        self.tokens = InvertedIndex()
+        self.facets = FacetIndex()
+        self.docs: Dict[int, CorpusEntry] = {}
+        self.doc_roots: Dict[int, str] = {}
+        # Entry id to the documents holding it, for constant-time lookups
+        self.ids: Dict[str, List[int]] = {}
+        # Entry ids held by more than one document, kept current as files change
+        self.duplicate_ids: Set[str] = set()
+        self._files: Dict[str, IndexedFile] = {}
+        self._free_ids: List[int] = []
+        self._next_id = 0
+        # Bumped on every change, so callers can tell whether a snapshot is stale
+        self.generation = 0
+
+    def sync_root(self, root: Path, files: Iterable[Path], kb_type: str) -> None:
+        """
+        Bring all files under a search root up to date.
+
+        Args:
+            root: Search root the files were found in
+            files: YAML files currently under the root
+            kb_type: "project" or "shared"
+        """
+        root_key = str(root)
+        seen = set()
+
+        for file_path in files:
+            seen.add(str(file_path))
+            self.sync_file(file_path, kb_type, root_key)
+
+        stale = [
+            key for key, indexed in self._files.items()
+            if indexed.root == root_key and key not in seen
+        ]
+        for key in stale:
+            self.drop_file(key)
+
+    def sync_file(self, file_path: Path, kb_type: str, root: str) -> bool:
+        """
+        Re-index a file if its parsed contents changed.
+
+        Returns:
+            True if the index was updated
+        """
+        key = str(file_path)
+        corpus_file = self.corpus.get(file_path, kb_type)
+
+        if corpus_file is None:
+            return self.drop_file(key)
+
+        indexed = self._files.get(key)
+        if indexed is not None and indexed.corpus_file is corpus_file and indexed.root == root:
+            return False
+
+        self._remove_docs(indexed)
+
+        doc_ids = []
+        for item in corpus_file.entries:
+            doc_id = self._allocate_id()
+            self.docs[doc_id] = item
+            self.doc_roots[doc_id] = root
+            self.tokens.add(doc_id, item.entry)
+            self.facets.add(doc_id, facet_values(item.entry, item.category, root))
+            self._add_id(item.entry.get('id'), doc_id)
+            doc_ids.append(doc_id)
+
+        self._files[key] = IndexedFile(corpus_file, root, doc_ids)
+        self.generation += 1
+        return True
+
+    def drop_file(self, file_path: Any) -> bool:
+        """
+        Remove a file and its entries from the index.
+
+        Returns:
+            True if the file was indexed
+        """
+        key = str(file_path)
+        indexed = self._files.pop(key, None)
+        self.corpus.discard(key)
+
+        if indexed is None:
+            return False
+
+        self._remove_docs(indexed)
+        self.generation += 1
+        return True
+
+    def match(self, query: str) -> Dict[int, int]:
+        """Find documents matching every token of a query"""
+        return self.tokens.match(query)
+
+    def duplicates(self) -> Dict[str, List[int]]:
+        """Get the documents of every entry id held by more than one (sort them with doc_order)"""
+        return {entry_id: list(self.ids[entry_id]) for entry_id in sorted(self.duplicate_ids)}
+
+    def locate(self, entry_id: str) -> List[int]:
+        """Get the documents holding an entry id (sort them with doc_order)"""
+        return list(self.ids.get(entry_id, ()))
+
+    def doc_order(self, doc_id: int) -> Tuple[str, int]:
+        """
+        Sort key for a document: its file path, then its position in the file.
+
+        Freed ids are reused, so ids do not follow the corpus order; this
+        key orders documents the same way however their files were
+        re-indexed.
+        """
+        item = self.docs[doc_id]
+        return str(item.file_path), item.position
+
+    @property
+    def file_count(self) -> int:
+        return len(self._files)
+
+    def file_doc_ids(self, file_path: Any) -> List[int]:
+        """Get the document ids of an indexed file's entries, in file order"""
+        indexed = self._files.get(str(file_path))
+        return list(indexed.doc_ids) if indexed is not None else []
+
+    def file_signatures(self, root: Optional[str] = None) -> Dict[str, Tuple[int, int]]:
+        """Get the (mtime, size) signature each indexed file, or each file under a root, was parsed at"""
+        return {
+            key: indexed.corpus_file.signature
+            for key, indexed in self._files.items()
+            if root is None or indexed.root == root
+        }
+
+    def clear(self) -> None:
+        """Drop all indexed files and cached parses"""
+        self.corpus.clear()
+        self.tokens = InvertedIndex()
+        self.facets = FacetIndex()
+        self.docs = {}
+        self.doc_roots = {}
+        self.ids = {}
+        self.duplicate_ids = set()
+        self._files = {}
+        self._free_ids = []
+        self._next_id = 0
+        self.generation += 1
+
+    def get_state(self) -> Dict[str, Any]:
+        """Get the full index state for persistence"""
+        return {
+            'corpus': self.corpus.get_state(),
+            'tokens': self.tokens,
+            'facets': self.facets,
+            'docs': self.docs,
+            'doc_roots': self.doc_roots,
+            'ids': self.ids,
+            'files': self._files,
+            'free_ids': self._free_ids,
+            'next_id': self._next_id
+        }
+
+    def set_state(self, state: Dict[str, Any]) -> None:
+        """Restore a persisted index state"""
+        self.corpus.set_state(state['corpus'])
+        self.tokens = state['tokens']
+        self.facets = state['facets']
+        self.docs = state['docs']
+        self.doc_roots = state['doc_roots']
+        self.ids = state['ids']
+        self.duplicate_ids = {entry_id for entry_id, doc_ids in self.ids.items() if len(doc_ids) > 1}
+        self._files = state['files']
+        self._free_ids = state['free_ids']
+        self._next_id = state['next_id']
+        self.generation += 1
+
+    def _remove_docs(self, indexed: Optional[IndexedFile]) -> None:
+        if indexed is None:
+            return
+
+        for doc_id in indexed.doc_ids:
+            self.tokens.remove(doc_id)
+            self.facets.remove(doc_id)
+            item = self.docs.pop(doc_id, None)
+            if item is not None:
+                self._remove_id(item.entry.get('id'), doc_id)
+            self.doc_roots.pop(doc_id, None)
+            self._free_ids.append(doc_id)
+
+    def _add_id(self, entry_id: Any, doc_id: int) -> None:
+        if isinstance(entry_id, str):
+            doc_ids = self.ids.setdefault(entry_id, [])
+            doc_ids.append(doc_id)
+            if len(doc_ids) == 2:
+                self.duplicate_ids.add(entry_id)
+
+    def _remove_id(self, entry_id: Any, doc_id: int) -> None:
+        doc_ids = self.ids.get(entry_id) if isinstance(entry_id, str) else None
+        if doc_ids is None:
+            return
+        if doc_id in doc_ids:
+            doc_ids.remove(doc_id)
+        if len(doc_ids) < 2:
+            self.duplicate_ids.discard(entry_id)
+        if not doc_ids:
+            del self.ids[entry_id]
+
+    def _allocate_id(self) -> int:
+        """Reuse freed ids first so document ids stay dense (ordering uses doc_order, not ids)"""
+        if self._free_ids:
+            return self._free_ids.pop()
+        doc_id = self._next_id
+        self._next_id += 1
+        return doc_id
+
+    def __len__(self) -> int:
+        return len(self.docs)
@@ -0,0 +1,184 @@
+"""
+Parallel YAML loader for Shared Knowledge Base.
+
+Full-corpus scans (cold index builds, metrics, directory validation) are
+dominated by CPU-bound YAML parsing. This module parses batches of files
+in a process pool and returns results in input order, so callers see the
+same output whatever the worker count.
+
+The worker count defaults to the number of CPUs and can be set with the
+KB_WORKERS environment variable (KB_WORKERS=1 disables the pool).
+"""
+
+import io
+import os
+from functools import partial
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Any, Callable, Iterable, Iterator
+
+WORKERS_ENV = "KB_WORKERS"
+
+# Below this many files starting a pool costs more than it saves
+PARALLEL_THRESHOLD = 32
+
+# Files submitted per worker at a time by imap_files()
+BATCH_PER_WORKER = 16
+
+# Error types reported in LoadedFile.error
+ERROR_READ = "read"
+ERROR_SYNTAX = "syntax"
+
+
+class LoadedFile:
+    """
+    Parsed YAML file, or the reason it could not be parsed.
+
+    When loaded with lines=True, lines maps field paths to source lines
+    (see yamlio.safe_load_lines) and error_line is the line of a syntax
+    error.
+    """
+
+    __slots__ = ('path', 'signature', 'content', 'line_count', 'error', 'lines', 'error_line')
+
+    def __init__(
+        self,
+        path: Path,
+        signature: Optional[Tuple[int, int]],
+        content: Any = None,
+        line_count: int = 0,
+        error: Optional[Tuple[str, str]] = None,
+        lines: Optional[Dict[str, int]] = None,
+        error_line: Optional[int] = None
+    ):
+        self.path = path
+        self.signature = signature
+        self.content = content
+        self.line_count = line_count
+        self.error = error
+        self.lines = lines
+        self.error_line = error_line
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def default_workers() -> int:
+    """Get the worker count from KB_WORKERS, or the number of CPUs"""
+    try:
+        workers = int(os.environ.get(WORKERS_ENV, ''))
+    except ValueError:
+        workers = os.cpu_count() or 1
+    return max(workers, 1)
+
+
+def load_file(file_path: Path, lines: bool = False) -> LoadedFile:
+    """
+    Read and parse a single YAML file.
+
+    Args:
+        file_path: Path to YAML file
+        lines: Also record the source line of every entry and field
+
+    Returns:
+        LoadedFile with the parsed content, line count and (mtime, size)
+        signature taken before reading, or the read/syntax error (the
+        signature is None if the file does not exist)
+    """
+    # Imported lazily so importing core stays cheap for index readers
+    from . import yamlio
+
+    file_path = Path(file_path)
+    signature = None
+
+    try:
+        stat = os.stat(file_path)
+        signature = (stat.st_mtime_ns, stat.st_size)
+        with open(file_path, 'r', encoding='utf-8') as f:
+            text = f.read()
+    except (OSError, UnicodeDecodeError) as e:
+        return LoadedFile(file_path, signature, error=(ERROR_READ, str(e)))
+
+    line_count = text.count('\n') + (1 if text and not text.endswith('\n') else 0)
+
+    # Named stream so syntax errors point at the file
+    stream = io.StringIO(text)
+    stream.name = str(file_path)
+
+    try:
+        if lines:
+            content, field_lines = yamlio.safe_load_lines(stream)
+        else:
+            content, field_lines = yamlio.safe_load(stream), None
+    except yamlio.YAMLError as e:
+        mark = getattr(e, 'problem_mark', None)
+        return LoadedFile(
+            file_path, signature, line_count=line_count, error=(ERROR_SYNTAX, str(e)),
+            error_line=mark.line + 1 if lines and mark is not None else None
+        )
+
+    return LoadedFile(file_path, signature, content, line_count, lines=field_lines)
+
+
+def load_files(paths: Iterable[Path], workers: Optional[int] = None, lines: bool = False) -> List[LoadedFile]:
+    """
+    Parse YAML files, in parallel when there are enough of them.
+
+    Args:
+        paths: Files to parse
+        workers: Worker processes (default: KB_WORKERS or CPU count)
+        lines: Also record source lines (see load_file)
+
+    Returns:
+        LoadedFile per path, in input order
+    """
+    load = partial(load_file, lines=lines) if lines else load_file
+    return list(imap_files(load, paths, workers))
+
+
+def imap_files(
+    func: Callable[[Path], Any],
+    paths: Iterable[Path],
+    workers: Optional[int] = None
+) -> Iterator[Any]:
+    """
+    Apply a function to files in a process pool, yielding results in input order.
+
+    Files are submitted in batches, so a consumer that stops iterating
+    early (and closes the generator) leaves the remaining files
+    unprocessed and only holds one batch of results at a time.
+
+    Args:
+        func: Picklable function taking a file path
+        paths: Files to process
+        workers: Worker processes (default: KB_WORKERS or CPU count)
+
+    Yields:
+        func(path) for each path
+    """
+    paths = [Path(path) for path in paths]
+    workers = min(workers or default_workers(), len(paths))
+
+    if workers <= 1 or len(paths) < PARALLEL_THRESHOLD:
+        for path in paths:
+            yield func(path)
+        return
+
+    # multiprocessing is slow to import, so only load it when a pool is used
+    from concurrent.futures import ProcessPoolExecutor
+    from concurrent.futures.process import BrokenProcessPool
+
+    batch_size = workers * BATCH_PER_WORKER
+    chunksize = max(1, BATCH_PER_WORKER // 4)
+    done = 0
+
+    try:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for start in range(0, len(paths), batch_size):
+                for result in executor.map(func, paths[start:start + batch_size], chunksize=chunksize):
+                    yield result
+                    done += 1
+    except (OSError, BrokenProcessPool):
+        # Process pools are unavailable in some sandboxes
+        for path in paths[done:]:
+            yield func(path)
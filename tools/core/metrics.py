@@ -2,14 +2,36 @@
 Core metrics functionality for Shared Knowledge Base.
 
 Provides metrics calculation, quality scoring, and repository statistics.
+
+A MetricsCalculator can be kept alive between calls (as the MCP server
+does) to make repeated calculate_all() calls incremental:
+
+- Each file's contribution to the entry-level aggregates is kept, so
+  only new and changed files under domains/ are parsed again: a changed
+  file's old contribution is subtracted and its new one added, and a
+  removed file's is subtracted.
+- Directory listings under domains/ are cached by directory mtime, so
+  only directories where files were added, removed or renamed are
+  listed again and only their files are stat'ed. Files edited in place
+  keep their directory's mtime; they are picked up once reported
+  through mark_changed() (the MCP server's ChangeWatcher does this) or
+  after invalidate().
+- The repository-wide file walk is reused for repo_stats_ttl seconds,
+  and only re-reads text files whose (mtime, size) changed to count
+  their lines.
 """
 
+import os
 import json
-import yaml
+import time
+import threading
 from pathlib import Path
-from typing import Dict, Any, List
+from typing import Dict, Any, Callable, Iterable, List, Optional, Set, Tuple
 from collections import Counter, defaultdict
 
+from .loader import LoadedFile, load_files
+from .watcher import DirectoryListing
+
 from .models import (
     RepositoryStats,
     YamlStats,
@@ -20,6 +42,282 @@ from .models import (
 )
 
 
+# Files under domains/ that hold no entries. catalog.yaml files do count
+# toward the domain distribution.
+SKIPPED_FILES = ('_meta.yaml', 'catalog.yaml')
+
+# Seconds calculate_all() reuses the repository-wide file walk
+REPO_STATS_TTL = 30.0
+
+# Directories left out of repository statistics (matched by name)
+IGNORED_DIRS = frozenset({
+    '.git', '__pycache__', '.venv', 'venv', 'env',
+    'node_modules', '.pytest_cache', 'dist', 'build',
+    '.archive', '.idea', '.vscode'
+})
+
+# Files whose lines are counted in repository statistics
+TEXT_SUFFIXES = ('.yaml', '.yml', '.md', '.py', '.txt', '.sh', '.json')
+
+# Bytes read at a time when counting lines
+LINE_COUNT_CHUNK = 1 << 16
+
+
+def count_lines(file_path: str) -> int:
+    """
+    Count lines in a file without decoding it.
+
+    Counts newline bytes in fixed-size chunks; a last line without a
+    trailing newline counts as a line.
+
+    Returns:
+        Number of lines, or 0 if the file cannot be read
+    """
+    lines = 0
+    last = b''
+
+    try:
+        with open(file_path, 'rb', buffering=0) as f:
+            while True:
+                chunk = f.read(LINE_COUNT_CHUNK)
+                if not chunk:
+                    break
+                lines += chunk.count(b'\n')
+                last = chunk
+    except OSError:
+        return 0
+
+    if last and not last.endswith(b'\n'):
+        lines += 1
+
+    return lines
+
+
+class EntryAggregator:
+    """
+    Builds one metric from a stream of parsed files under domains/.
+
+    MetricsCalculator feeds every aggregator from a single walk and
+    parse of domains/, so adding a metric does not add a pass. Each file
+    adds a contribution that can later be subtracted again, so a
+    long-lived calculator only re-applies files that changed.
+    """
+
+    # Files this aggregator ignores
+    skip: Tuple[str, ...] = SKIPPED_FILES
+
+    def accepts(self, file_path: Path) -> bool:
+        return not any(name in str(file_path) for name in self.skip)
+
+    def contribution(self, loaded: LoadedFile) -> Any:
+        """
+        Get one successfully parsed file's share of the metric.
+
+        Returns:
+            Contribution for apply(), or None if the file adds nothing
+
+        Raises:
+            Exception: If the file is malformed (e.g. entries that are not lists)
+        """
+        raise NotImplementedError
+
+    def apply(self, contribution: Any, sign: int) -> None:
+        """Add (sign 1) or subtract (sign -1) a file's contribution"""
+        raise NotImplementedError
+
+    def add(self, loaded: LoadedFile) -> None:
+        """Add one successfully parsed file"""
+        contribution = self.contribution(loaded)
+        if contribution is not None:
+            self.apply(contribution, 1)
+
+    def result(self) -> Any:
+        raise NotImplementedError
+
+
+class YamlStatsAggregator(EntryAggregator):
+    """Entry counts, entry sizes, largest file and per-domain file, entry and line counts"""
+
+    def __init__(self, repo_path: Path):
+        self.repo_path = repo_path
+        self.total_entries = 0
+        self.error_count = 0
+        self.pattern_count = 0
+        self.entry_size_total = 0
+        # Line count per file, to find the next largest file after a removal
+        self.file_lines: Dict[str, int] = {}
+        self.largest_file: Optional[Dict[str, Any]] = {'path': '', 'lines': 0}
+        self.domains = defaultdict(lambda: {'files': 0, 'entries': 0, 'lines': 0})
+
+    def contribution(self, loaded: LoadedFile) -> Optional[Dict[str, Any]]:
+        content = loaded.content
+        if not content:
+            return None
+
+        errors = content.get('errors', [])
+        patterns = content.get('patterns', [])
+
+        return {
+            'errors': len(errors),
+            'patterns': len(patterns),
+            # Approximate entry size in lines
+            'entry_lines': sum(len(str(entry).split('\n')) for entry in errors + patterns),
+            'path': str(loaded.path.relative_to(self.repo_path)),
+            'lines': loaded.line_count,
+            'domain': loaded.path.parent.parent.name
+        }
+
+    def apply(self, contribution: Dict[str, Any], sign: int) -> None:
+        file_entries = contribution['errors'] + contribution['patterns']
+
+        # Count entries
+        self.total_entries += sign * file_entries
+        self.error_count += sign * contribution['errors']
+        self.pattern_count += sign * contribution['patterns']
+        self.entry_size_total += sign * contribution['entry_lines']
+
+        # Track largest file
+        path, lines = contribution['path'], contribution['lines']
+        if sign > 0:
+            self.file_lines[path] = lines
+            if self.largest_file is not None and lines > self.largest_file['lines']:
+                self.largest_file = {'path': path, 'lines': lines}
+        else:
+            self.file_lines.pop(path, None)
+            if self.largest_file is not None and self.largest_file['path'] == path:
+                self.largest_file = None  # Found again in result()
+
+        # Track domain stats
+        domain = self.domains[contribution['domain']]
+        domain['files'] += sign
+        domain['entries'] += sign * file_entries
+        domain['lines'] += sign * lines
+        if not domain['files']:
+            del self.domains[contribution['domain']]
+
+    def result(self) -> Dict[str, Any]:
+        avg_size = self.entry_size_total / self.total_entries if self.total_entries else 0
+
+        if self.largest_file is None:
+            path, lines = max(self.file_lines.items(), key=lambda item: item[1], default=('', 0))
+            self.largest_file = {'path': path if lines else '', 'lines': lines}
+
+        return {
+            'total_entries': self.total_entries,
+            'errors': self.error_count,
+            'patterns': self.pattern_count,
+            'avg_entry_size_lines': round(avg_size, 1),
+            'largest_file': dict(self.largest_file),
+            'domains': {name: dict(stats) for name, stats in self.domains.items()}
+        }
+
+
+class QualityAggregator(EntryAggregator):
+    """Quality score distribution across all entries"""
+
+    def __init__(self, score: Callable[[Dict[str, Any]], int]):
+        self.score = score
+        # Score to number of entries with it
+        self.scores = Counter()
+
+    def contribution(self, loaded: LoadedFile) -> Optional[List[int]]:
+        content = loaded.content
+        if not content:
+            return None
+
+        return [
+            self.score(entry)
+            for section in ('errors', 'patterns')
+            for entry in content.get(section, [])
+        ]
+
+    def apply(self, contribution: List[int], sign: int) -> None:
+        for score in contribution:
+            self.scores[score] += sign
+            if not self.scores[score]:
+                del self.scores[score]
+
+    def result(self) -> Dict[str, Any]:
+        total = sum(self.scores.values())
+        if not total:
+            return {
+                'total_entries': 0,
+                'avg_score': 0,
+                'excellent': 0,
+                'good': 0,
+                'acceptable': 0,
+                'poor': 0,
+                'critical': 0
+            }
+
+        def count(low: int, high: int = 101) -> int:
+            return sum(n for score, n in self.scores.items() if low <= score < high)
+
+        avg_score = sum(score * n for score, n in self.scores.items()) / total
+
+        return {
+            'total_entries': total,
+            'avg_score': round(avg_score, 1),
+            'excellent': count(90),
+            'good': count(75, 90),
+            'acceptable': count(60, 75),
+            'poor': count(40, 60),
+            'critical': count(0, 40)
+        }
+
+
+class DomainAggregator(EntryAggregator):
+    """Entries per domain, largest first"""
+
+    skip = ('_meta.yaml',)
+
+    def __init__(self):
+        self.distribution = defaultdict(int)
+        # Files per domain, so a domain is dropped with its last file
+        self.files = Counter()
+
+    def contribution(self, loaded: LoadedFile) -> Optional[Tuple[str, int]]:
+        content = loaded.content
+        if not content:
+            return None
+
+        entries = content.get('errors', []) + content.get('patterns', [])
+        return loaded.path.parent.parent.name, len(entries)
+
+    def apply(self, contribution: Tuple[str, int], sign: int) -> None:
+        domain, entries = contribution
+        self.distribution[domain] += sign * entries
+        self.files[domain] += sign
+        if not self.files[domain]:
+            del self.files[domain]
+            del self.distribution[domain]
+
+    def result(self) -> Dict[str, int]:
+        return dict(sorted(self.distribution.items(), key=lambda x: x[1], reverse=True))
+
+
+class VersionAggregator(EntryAggregator):
+    """Files per schema version"""
+
+    def __init__(self):
+        self.versions = Counter()
+
+    def contribution(self, loaded: LoadedFile) -> Optional[Tuple[Any]]:
+        content = loaded.content
+        if 'version' not in content:
+            return None
+        return (content['version'],)
+
+    def apply(self, contribution: Tuple[Any], sign: int) -> None:
+        version, = contribution
+        self.versions[version] += sign
+        if not self.versions[version]:
+            del self.versions[version]
+
+    def result(self) -> Dict[str, int]:
+        return dict(self.versions)
+
+
 class MetricsCalculator:
     """
     Core metrics calculator for knowledge base.
@@ -27,32 +325,61 @@ class MetricsCalculator:
     Computes repository statistics, quality scores, and domain distributions.
     """
 
-    def __init__(self, repo_path: str = None):
+    def __init__(
+        self,
+        repo_path: str = None,
+        workers: Optional[int] = None,
+        repo_stats_ttl: float = REPO_STATS_TTL
+    ):
         """
         Initialize metrics calculator.
 
         Args:
             repo_path: Path to repository root (default: current directory)
+            workers: Processes for parsing YAML files (default: KB_WORKERS or CPU count)
+            repo_stats_ttl: Seconds calculate_all() reuses repository file
+                statistics (0 to walk the repository on every call)
         """
         self.repo_path = Path(repo_path) if repo_path else Path.cwd()
         self.domains_path = self.repo_path / "domains"
+        self.workers = workers
+        self.repo_stats_ttl = repo_stats_ttl
         self.metrics = {}
+        # Number of YAML files parsed, for tests and diagnostics
+        self.parse_count = 0
+        # Parsed files under domains/ by path, checked against their signature,
+        # for the single-metric methods
+        self._parsed: Dict[Path, LoadedFile] = {}
+        # Text file path to ((mtime, size), line count) from the last walk
+        self._line_counts: Dict[str, Tuple[Tuple[int, int], int]] = {}
+        # (time, stats) of the last repository walk
+        self._repo_stats: Optional[Tuple[float, Dict[str, Any]]] = None
+        # Aggregators kept current by calculate_all(), created on first use
+        self._aggregators: Optional[List[EntryAggregator]] = None
+        # File under domains/ to ((mtime, size), contribution per aggregator)
+        self._contributions: Dict[str, Tuple[Optional[Tuple[int, int]], List[Any]]] = {}
+        # YAML files under domains/, re-listed only where a directory changed
+        self._listing = DirectoryListing(lambda path: path.endswith('.yaml'))
+        # Files reported through mark_changed(), checked by the next call
+        self._marked: Set[str] = set()
+        self._marked_lock = threading.Lock()
+        # Serializes calculate_all() for callers sharing one calculator
+        self._lock = threading.Lock()
 
     def calculate_all(self) -> Metrics:
         """
         Calculate all repository metrics.
 
+        Only files that changed since the previous call are parsed again.
+
         Returns:
             Metrics object with complete repository statistics
         """
         from datetime import datetime
 
-        # Calculate all metric categories
-        repo_stats = self.get_repository_stats()
-        yaml_stats = self.analyze_yaml_files()
-        domain_dist = self.get_domain_distribution()
-        quality_scores = self.calculate_quality_distribution()
-        version_dist = self.get_version_distribution()
+        with self._lock:
+            repo_stats = self._cached_repository_stats()
+            yaml_stats, domain_dist, quality_scores, version_dist = self._cached_domain_metrics()
         validation_status = self.get_validation_status(yaml_stats)
 
         # Determine overall health
@@ -77,8 +404,124 @@ class MetricsCalculator:
             health_status=health
         )
 
+    def mark_changed(self, paths: Iterable[Any]) -> None:
+        """
+        Report files that changed, so the next calculate_all() checks them.
+
+        Files edited in place keep their directory's mtime and are not
+        noticed otherwise. Safe to call while calculate_all() runs.
+
+        Args:
+            paths: Changed or removed files (other files are ignored)
+        """
+        with self._marked_lock:
+            self._marked.update(str(path) for path in paths)
+
+    def invalidate(self) -> None:
+        """Drop cached statistics and parsed files, so the next call starts cold"""
+        with self._lock:
+            self._parsed.clear()
+            self._line_counts = {}
+            self._repo_stats = None
+            self._aggregators = None
+            self._contributions = {}
+            self._listing.clear()
+
+    def _cached_repository_stats(self) -> Dict[str, Any]:
+        """Get repository file statistics, walking the repository at most every repo_stats_ttl seconds"""
+        now = time.monotonic()
+        if self._repo_stats is None or now - self._repo_stats[0] >= self.repo_stats_ttl:
+            self._repo_stats = (now, self.get_repository_stats())
+        return self._repo_stats[1]
+
+    def _cached_domain_metrics(self) -> Tuple[Any, ...]:
+        """Get entry aggregates, applying only the files under domains/ that changed since the last call"""
+        if self._aggregators is None:
+            self._aggregators = [
+                YamlStatsAggregator(self.repo_path),
+                DomainAggregator(),
+                QualityAggregator(self.calculate_entry_score),
+                VersionAggregator()
+            ]
+            self._contributions = {}
+
+        changed, removed = self._domain_changes()
+
+        for file_path in removed + list(changed):
+            previous = self._contributions.pop(file_path, None)
+            if previous is not None:
+                for aggregator, contribution in zip(self._aggregators, previous[1]):
+                    if contribution is not None:
+                        aggregator.apply(contribution, -1)
+
+        wanted = []
+        for file_path, signature in changed.items():
+            if any(aggregator.accepts(Path(file_path)) for aggregator in self._aggregators):
+                wanted.append(Path(file_path))
+            else:
+                self._contributions[file_path] = (signature, [None] * len(self._aggregators))
+
+        for loaded in load_files(wanted, self.workers):
+            self.parse_count += 1
+            self._contributions[str(loaded.path)] = (loaded.signature, self._contribute(loaded))
+
+        return tuple(aggregator.result() for aggregator in self._aggregators)
+
+    def _domain_changes(self) -> Tuple[Dict[str, Optional[Tuple[int, int]]], List[str]]:
+        """
+        Find files under domains/ added, changed or removed since the last call.
+
+        Only new files, files in directories whose mtime changed and files
+        reported through mark_changed() are stat'ed.
+
+        Returns:
+            (signature of each new or changed file, removed files)
+        """
+        with self._marked_lock:
+            marked, self._marked = self._marked, set()
+
+        listed = self._listing.files(str(self.domains_path))
+        relisted = self._listing.relisted
+
+        changed = {}
+        for file_path in listed:
+            known = self._contributions.get(file_path)
+            if known is not None and file_path not in marked and os.path.dirname(file_path) not in relisted:
+                continue
+            signature = self._signature(file_path)
+            if known is None or known[0] != signature:
+                changed[file_path] = signature
+
+        current = set(listed)
+        removed = [file_path for file_path in self._contributions if file_path not in current]
+        return changed, removed
+
+    def _contribute(self, loaded: LoadedFile) -> List[Any]:
+        """Add a parsed file to every aggregator that accepts it, returning its contributions"""
+        contributions = []
+
+        for aggregator in self._aggregators:
+            contribution = None
+            if loaded.ok and aggregator.accepts(loaded.path):
+                try:
+                    contribution = aggregator.contribution(loaded)
+                    if contribution is not None:
+                        aggregator.apply(contribution, 1)
+                except Exception:
+                    # Malformed file (e.g. entries that are not lists)
+                    contribution = None
+            contributions.append(contribution)
+
+        return contributions
+
     def get_repository_stats(self) -> Dict[str, Any]:
-        """Get repository file statistics"""
+        """
+        Get repository file statistics.
+
+        Walks the repository with os.scandir, skipping IGNORED_DIRS
+        without descending into them. Line counts are cached by
+        (path, mtime, size), so repeated calls only read files that changed.
+        """
         total_files = 0
         total_lines = 0
         total_size = 0
@@ -86,28 +529,52 @@ class MetricsCalculator:
         markdown_count = 0
         python_count = 0
 
-        for file_path in self.repo_path.rglob('*'):
-            if file_path.is_file() and not self._is_ignored(file_path):
-                try:
-                    total_files += 1
-                    total_size += file_path.stat().st_size
-
-                    # Count lines for text files
-                    if file_path.suffix in ['.yaml', '.yml', '.md', '.py', '.txt', '.sh', '.json']:
-                        with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                            lines = sum(1 for _ in f)
-                            total_lines += lines
-
-                    # Count by type
-                    if file_path.suffix in ['.yaml', '.yml']:
-                        yaml_count += 1
-                    elif file_path.suffix == '.md':
-                        markdown_count += 1
-                    elif file_path.suffix == '.py':
-                        python_count += 1
+        line_counts: Dict[str, Tuple[Tuple[int, int], int]] = {}
+        directories = [str(self.repo_path)]
 
-                except Exception:
-                    continue
+        while directories:
+            try:
+                with os.scandir(directories.pop()) as entries:
+                    for entry in entries:
+                        # Like Path.rglob, don't descend into symlinked directories
+                        if entry.is_dir(follow_symlinks=False):
+                            if entry.name not in IGNORED_DIRS:
+                                directories.append(entry.path)
+                            continue
+
+                        try:
+                            if not entry.is_file():
+                                continue
+                            stat = entry.stat()
+                        except OSError:
+                            continue
+
+                        total_files += 1
+                        total_size += stat.st_size
+
+                        suffix = os.path.splitext(entry.name)[1]
+
+                        # Count lines for text files
+                        if suffix in TEXT_SUFFIXES:
+                            signature = (stat.st_mtime_ns, stat.st_size)
+                            cached = self._line_counts.get(entry.path)
+                            if cached is None or cached[0] != signature:
+                                cached = (signature, count_lines(entry.path))
+                            line_counts[entry.path] = cached
+                            total_lines += cached[1]
+
+                        # Count by type
+                        if suffix in ('.yaml', '.yml'):
+                            yaml_count += 1
+                        elif suffix == '.md':
+                            markdown_count += 1
+                        elif suffix == '.py':
+                            python_count += 1
+            except OSError:
+                continue
+
+        # Only keep files that still exist
+        self._line_counts = line_counts
 
         return {
             'total_files': total_files,
@@ -120,138 +587,11 @@ class MetricsCalculator:
 
     def analyze_yaml_files(self) -> Dict[str, Any]:
         """Analyze YAML files in domains/"""
-        total_entries = 0
-        error_count = 0
-        pattern_count = 0
-        entry_sizes = []
-        largest_file = {'path': '', 'lines': 0}
-        domains = defaultdict(lambda: {'files': 0, 'entries': 0})
-
-        if not self.domains_path.exists():
-            return {
-                'total_entries': 0,
-                'errors': 0,
-                'patterns': 0,
-                'avg_entry_size_lines': 0,
-                'largest_file': largest_file,
-                'domains': {}
-            }
-
-        for yaml_file in self.domains_path.rglob('*.yaml'):
-            if '_meta.yaml' in str(yaml_file) or 'catalog.yaml' in str(yaml_file):
-                continue
-
-            try:
-                with open(yaml_file, 'r', encoding='utf-8') as f:
-                    lines = sum(1 for _ in f)
-                    f.seek(0)
-                    content = yaml.safe_load(f)
-
-                    if not content:
-                        continue
-
-                    # Count entries
-                    errors = content.get('errors', [])
-                    patterns = content.get('patterns', [])
-                    file_entries = len(errors) + len(patterns)
-
-                    total_entries += file_entries
-                    error_count += len(errors)
-                    pattern_count += len(patterns)
-
-                    # Track entry sizes
-                    for entry in errors + patterns:
-                        # Approximate entry size in lines
-                        entry_size = len(str(entry).split('\n'))
-                        entry_sizes.append(entry_size)
-
-                    # Track largest file
-                    if lines > largest_file['lines']:
-                        largest_file = {
-                            'path': str(yaml_file.relative_to(self.repo_path)),
-                            'lines': lines
-                        }
-
-                    # Track domain stats
-                    domain = yaml_file.parent.parent.name
-                    domains[domain]['files'] += 1
-                    domains[domain]['entries'] += file_entries
-
-            except Exception:
-                continue
-
-        avg_size = sum(entry_sizes) / len(entry_sizes) if entry_sizes else 0
-
-        return {
-            'total_entries': total_entries,
-            'errors': error_count,
-            'patterns': pattern_count,
-            'avg_entry_size_lines': round(avg_size, 1),
-            'largest_file': largest_file,
-            'domains': dict(domains)
-        }
+        return self._collect(YamlStatsAggregator(self.repo_path))
 
     def calculate_quality_distribution(self) -> Dict[str, Any]:
         """Calculate quality score distribution across all entries"""
-        scores = []
-
-        if not self.domains_path.exists():
-            return {
-                'total_entries': 0,
-                'avg_score': 0,
-                'excellent': 0,
-                'good': 0,
-                'acceptable': 0,
-                'poor': 0,
-                'critical': 0
-            }
-
-        for yaml_file in self.domains_path.rglob('*.yaml'):
-            if '_meta.yaml' in str(yaml_file) or 'catalog.yaml' in str(yaml_file):
-                continue
-
-            try:
-                with open(yaml_file, 'r', encoding='utf-8') as f:
-                    content = yaml.safe_load(f)
-
-                    if not content:
-                        continue
-
-                    # Score errors
-                    for entry in content.get('errors', []):
-                        score = self.calculate_entry_score(entry)
-                        scores.append(score)
-
-                    # Score patterns
-                    for entry in content.get('patterns', []):
-                        score = self.calculate_entry_score(entry)
-                        scores.append(score)
-
-            except Exception:
-                continue
-
-        if not scores:
-            return {
-                'total_entries': 0,
-                'avg_score': 0,
-                'excellent': 0,
-                'good': 0,
-                'acceptable': 0,
-                'poor': 0,
-                'critical': 0
-            }
-
-        avg_score = sum(scores) / len(scores)
-
-        return {
-            'total_entries': len(scores),
-            'avg_score': round(avg_score, 1),
-            'excellent': sum(1 for s in scores if s >= 90),
-            'good': sum(1 for s in scores if 75 <= s < 90),
-            'acceptable': sum(1 for s in scores if 60 <= s < 75),
-            'poor': sum(1 for s in scores if 40 <= s < 60),
-            'critical': sum(1 for s in scores if s < 40)
-        }
+        return self._collect(QualityAggregator(self.calculate_entry_score))
 
     def calculate_entry_score(self, entry: Dict[str, Any]) -> int:
         """
@@ -294,51 +634,11 @@ class MetricsCalculator:
 
     def get_domain_distribution(self) -> Dict[str, int]:
         """Get distribution of entries across domains"""
-        distribution = defaultdict(int)
-
-        if not self.domains_path.exists():
-            return {}
-
-        for yaml_file in self.domains_path.rglob('*.yaml'):
-            if '_meta.yaml' in str(yaml_file):
-                continue
-
-            try:
-                with open(yaml_file, 'r', encoding='utf-8') as f:
-                    content = yaml.safe_load(f)
-
-                    if not content:
-                        continue
-
-                    domain = yaml_file.parent.parent.name
-                    entries = content.get('errors', []) + content.get('patterns', [])
-                    distribution[domain] += len(entries)
-
-            except Exception:
-                pass
-
-        return dict(sorted(distribution.items(), key=lambda x: x[1], reverse=True))
+        return self._collect(DomainAggregator())
 
     def get_version_distribution(self) -> Dict[str, int]:
         """Get distribution of schema versions"""
-        versions = Counter()
-
-        if not self.domains_path.exists():
-            return {}
-
-        for yaml_file in self.domains_path.rglob('*.yaml'):
-            if '_meta.yaml' in str(yaml_file) or 'catalog.yaml' in str(yaml_file):
-                continue
-
-            try:
-                with open(yaml_file, 'r', encoding='utf-8') as f:
-                    content = yaml.safe_load(f)
-                    if 'version' in content:
-                        versions[content['version']] += 1
-            except Exception:
-                pass
-
-        return dict(versions)
+        return self._collect(VersionAggregator())
 
     def get_validation_status(self, yaml_stats: Dict[str, Any]) -> Dict[str, Any]:
         """Get validation status"""
@@ -353,17 +653,81 @@ class MetricsCalculator:
             'warnings': 0
         }
 
-    def _is_ignored(self, file_path: Path) -> bool:
-        """Check if file should be ignored in stats"""
-        ignored_dirs = [
-            '.git', '__pycache__', '.venv', 'venv', 'env',
-            'node_modules', '.pytest_cache', 'dist', 'build',
-            '.archive', '.idea', '.vscode'
+    def _collect(self, aggregator: EntryAggregator) -> Any:
+        """Run a single aggregator over domains/"""
+        with self._lock:
+            return self._aggregate(self._domain_files(), [aggregator])[0]
+
+    def _domain_files(self) -> Dict[Path, Optional[Tuple[int, int]]]:
+        """List YAML files under domains/ with their (mtime, size) signatures, in directory order"""
+        if not self.domains_path.exists():
+            return {}
+        return {
+            yaml_file: self._signature(yaml_file)
+            for yaml_file in self.domains_path.rglob('*.yaml')
+        }
+
+    def _aggregate(
+        self,
+        files: Dict[Path, Optional[Tuple[int, int]]],
+        aggregators: List[EntryAggregator]
+    ) -> List[Any]:
+        """Feed every file under domains/ to the aggregators that accept it, in one pass"""
+        wanted = [
+            yaml_file for yaml_file in files
+            if any(aggregator.accepts(yaml_file) for aggregator in aggregators)
+        ]
+
+        for loaded in self._load_domain_files(wanted, files):
+            if not loaded.ok:
+                continue
+
+            for aggregator in aggregators:
+                if not aggregator.accepts(loaded.path):
+                    continue
+                try:
+                    aggregator.add(loaded)
+                except Exception:
+                    # Malformed file (e.g. entries that are not lists)
+                    continue
+
+        return [aggregator.result() for aggregator in aggregators]
+
+    def _load_domain_files(
+        self,
+        yaml_files: Iterable[Path],
+        signatures: Dict[Path, Optional[Tuple[int, int]]]
+    ) -> List[LoadedFile]:
+        """
+        Parse YAML files under domains/, in the given order.
+
+        Files whose signature matches the cached parse are reused; the
+        rest are parsed in parallel. Cached files no longer listed in
+        signatures are forgotten.
+        """
+        yaml_files = list(yaml_files)
+
+        for yaml_file in list(self._parsed):
+            if yaml_file not in signatures:
+                del self._parsed[yaml_file]
+
+        stale = [
+            yaml_file for yaml_file in yaml_files
+            if yaml_file not in self._parsed
+            or self._parsed[yaml_file].signature != signatures[yaml_file]
         ]
 
-        # Check if file is in ignored directory
-        for ignored in ignored_dirs:
-            if ignored in str(file_path):
-                return True
+        for loaded in load_files(stale, self.workers):
+            self.parse_count += 1
+            self._parsed[loaded.path] = loaded
+
+        return [self._parsed[yaml_file] for yaml_file in yaml_files]
 
-        return False
+    @staticmethod
+    def _signature(file_path: Path) -> Optional[Tuple[int, int]]:
+        """Get the (mtime, size) signature of a file, or None if it is missing"""
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
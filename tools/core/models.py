@@ -8,15 +8,17 @@ Used across CLI, MCP, and future API interfaces.
 from typing import Optional, List, Dict, Any, Literal
 from pydantic import BaseModel, Field, field_validator
 
+from .schema import SCOPES, SEVERITIES
+
 
 class SeverityLevel(str):
     """Valid severity levels"""
-    AUTHORIZED = ["critical", "high", "medium", "low"]
+    AUTHORIZED = list(SEVERITIES)
 
 
 class ScopeLevel(str):
     """Valid scope levels"""
-    AUTHORIZED = ["universal", "python", "javascript", "docker", "postgresql", "vps", "framework", "project"]
+    AUTHORIZED = list(SCOPES)
 
 
 class EntryMetadata(BaseModel):
@@ -78,7 +80,7 @@ class SearchResult(BaseModel):
     """Single search result"""
     metadata: EntryMetadata
     preview: Optional[str] = None
-    relevance_score: float = Field(default=1.0, ge=0.0, le=1.0)
+    relevance_score: float = Field(default=1.0, ge=0.0, le=1.0)  # BM25 score relative to the best match
     kb_type: Literal["project", "shared"] = "shared"  # project KB or shared KB
 
 
@@ -90,6 +92,10 @@ class SearchResults(BaseModel):
     shared_results: List[SearchResult] = Field(default_factory=list)
     filters_applied: Optional[SearchFilter] = None
     execution_time_ms: Optional[float] = None
+    facets: Dict[str, Dict[str, int]] = Field(default_factory=dict)  # Facet value counts over all matches
+    offset: int = 0  # Position of the first result in the full ranking
+    has_more: bool = False
+    next_cursor: Optional[str] = None  # Pass to search() for the next page
 
     @property
     def all_results(self) -> List[SearchResult]:
@@ -0,0 +1,150 @@
+"""
+Relevance ranking for Shared Knowledge Base search.
+
+Scores entries with a field-weighted BM25 (BM25F) over the inverted
+index and streams the best matches from a heap, so ranked queries never
+sort the full match list.
+"""
+
+import heapq
+import math
+from typing import Any, Dict, Iterable, Iterator, Tuple, Optional, Sequence
+
+from .index import (
+    InvertedIndex,
+    FIELDS,
+    FIELD_ID,
+    FIELD_TITLE,
+    FIELD_PROBLEM,
+    FIELD_ROOT_CAUSE,
+    FIELD_SOLUTION_CODE,
+    FIELD_SOLUTION_EXPLANATION,
+    FIELD_TAGS,
+    tokenize
+)
+
+# Per-field weights: title > tags > problem > solution
+FIELD_WEIGHTS = {
+    FIELD_ID: 3.0,
+    FIELD_TITLE: 3.0,
+    FIELD_TAGS: 2.0,
+    FIELD_PROBLEM: 1.5,
+    FIELD_ROOT_CAUSE: 1.0,
+    FIELD_SOLUTION_EXPLANATION: 1.0,
+    FIELD_SOLUTION_CODE: 0.75,
+}
+
+
+def idf(total_docs: int, doc_freq: int) -> float:
+    """BM25 inverse document frequency of a token found in doc_freq documents"""
+    return math.log(1 + (total_docs - doc_freq + 0.5) / (doc_freq + 0.5))
+
+
+class BM25Scorer:
+    """
+    Field-weighted BM25 scorer.
+
+    Term frequencies are normalized by field length per field, weighted,
+    summed, and saturated once per query token (BM25F).
+    """
+
+    def __init__(
+        self,
+        index: Optional[InvertedIndex] = None,
+        k1: float = 1.2,
+        b: float = 0.75,
+        field_weights: Optional[Dict[int, float]] = None
+    ):
+        """
+        Initialize scorer.
+
+        Args:
+            index: Inverted index to score against (None to only use term_score)
+            k1: Term frequency saturation
+            b: Field length normalization strength
+            field_weights: Weight per field bit (default: FIELD_WEIGHTS)
+        """
+        self.index = index
+        self.k1 = k1
+        self.b = b
+        weights = field_weights or FIELD_WEIGHTS
+        self.weights = [weights.get(field, 1.0) for field in FIELDS]
+
+    def term_score(
+        self,
+        freqs: Sequence[int],
+        lengths: Sequence[int],
+        avg_lengths: Sequence[float]
+    ) -> float:
+        """
+        Saturated, field-weighted frequency of one token in one document.
+
+        Args:
+            freqs: Term frequency per field (indexed like FIELDS)
+            lengths: Document length per field
+            avg_lengths: Average length per field across the corpus
+        """
+        weighted_tf = 0.0
+        for position, tf in enumerate(freqs):
+            if not tf:
+                continue
+            avg_length = avg_lengths[position] or 1.0
+            norm = 1 - self.b + self.b * lengths[position] / avg_length
+            weighted_tf += self.weights[position] * tf / norm
+
+        return weighted_tf / (self.k1 + weighted_tf)
+
+    def score(self, query: str, candidates: Iterable[int]) -> Dict[int, float]:
+        """
+        Score candidate documents against a query.
+
+        Args:
+            query: Search query
+            candidates: Document ids to score
+
+        Returns:
+            Mapping of document id to BM25 score
+        """
+        scores = {doc_id: 0.0 for doc_id in candidates}
+        if not scores:
+            return scores
+
+        total_docs = len(self.index.field_lengths)
+        avg_lengths = self.index.average_field_lengths()
+
+        for token in dict.fromkeys(tokenize(query)):
+            frequencies = self.index.term_frequencies(token)
+            if not frequencies:
+                continue
+
+            token_idf = idf(total_docs, len(frequencies))
+
+            for doc_id in scores:
+                freqs = frequencies.get(doc_id)
+                if freqs is not None:
+                    scores[doc_id] += token_idf * self.term_score(
+                        freqs, self.index.field_lengths[doc_id], avg_lengths
+                    )
+
+        return scores
+
+
+def ranked(scores: Dict[int, float], tiebreak: Optional[Dict[int, Any]] = None) -> Iterator[Tuple[int, float]]:
+    """
+    Lazily yield (document id, score) pairs, best first.
+
+    The heap is built in O(n) and each result costs O(log n), so taking
+    the top k never sorts the whole match list.
+
+    Args:
+        scores: Mapping of document id to score
+        tiebreak: Optional secondary sort key per document (lower first)
+    """
+    tiebreak = tiebreak or {}
+    heap = [(-score, tiebreak.get(doc_id, 0), doc_id) for doc_id, score in scores.items()]
+    heapq.heapify(heap)
+
+    while heap:
+        neg_score, _, doc_id = heapq.heappop(heap)
+        yield doc_id, -neg_score
+
@@ -0,0 +1,283 @@
+"""
+Declarative entry schema for Shared Knowledge Base.
+
+The rules a knowledge file must follow (required file fields, required
+fields per section, allowed severities and scopes, the ID format, the
+shape of a solution) are described once as plain data in ENTRY_SCHEMA.
+compile_schema() turns a description into a CompiledSchema: enums become
+frozensets, the ID pattern is compiled once and the per-entry rules are
+flattened into tuples, so checking an entry is a handful of dict lookups.
+
+The same compiled schema is used by KnowledgeValidator (`kb.py validate`,
+the MCP kb_validate tool) and by the submission and curation tools.
+"""
+
+import re
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+# Valid severity levels
+SEVERITIES = ('critical', 'high', 'medium', 'low')
+
+# Valid scopes
+SCOPES = ('universal', 'python', 'javascript', 'docker', 'postgresql', 'vps', 'framework', 'project')
+
+# Required fields for error entries
+ERROR_FIELDS = ('id', 'title', 'severity', 'scope', 'problem', 'solution')
+
+# Required fields for pattern entries
+PATTERN_FIELDS = ('id', 'title', 'scope', 'pattern', 'implementation')
+
+# Entry IDs look like DOCKER-024 or PYTHON-001
+ID_PATTERN = r'^[A-Z_]+-\d{3,}$'
+
+LEVEL_ERROR = 'error'
+LEVEL_WARNING = 'warning'
+
+# Field rule kinds
+RULE_ENUM = 'enum'
+RULE_PATTERN = 'pattern'
+RULE_ANY_OF = 'any_of'
+
+_MISSING = object()
+
+# A reported problem: (error_type, message, field_path)
+Issue = Tuple[str, str, Optional[str]]
+
+
+def entry_schema(
+    severities: Iterable[str] = SEVERITIES,
+    scopes: Iterable[str] = SCOPES,
+    error_fields: Iterable[str] = ERROR_FIELDS,
+    pattern_fields: Iterable[str] = PATTERN_FIELDS,
+    id_pattern: str = ID_PATTERN
+) -> Dict[str, Any]:
+    """
+    Describe the schema of a knowledge file.
+
+    Field rules apply to entries of every section, and only to fields the
+    entry has. Issues are reported by kind of rule (patterns, then enums,
+    then any_of), each kind in the order listed. Messages are format
+    strings over {value} (the field value) and {choices} (the enum
+    values, as a list).
+
+    Returns:
+        Schema description (plain, JSON-serializable data)
+    """
+    return {
+        'required': ['version', 'category'],
+        'sections': {
+            'errors': {'required': list(error_fields)},
+            'patterns': {'required': list(pattern_fields)},
+        },
+        'fields': [
+            {
+                'field': 'id',
+                'rule': RULE_PATTERN,
+                'pattern': id_pattern,
+                'level': LEVEL_WARNING,
+                'error_type': 'format',
+                'message': 'ID format should be CATEGORY-NNN (e.g., DOCKER-024), got: {value}',
+            },
+            {
+                'field': 'severity',
+                'rule': RULE_ENUM,
+                'choices': list(severities),
+                'level': LEVEL_ERROR,
+                'error_type': 'format',
+                'message': 'Invalid severity: {value}. Must be one of {choices}',
+            },
+            {
+                'field': 'scope',
+                'rule': RULE_ENUM,
+                'choices': list(scopes),
+                'level': LEVEL_ERROR,
+                'error_type': 'format',
+                'message': 'Invalid scope: {value}. Must be one of {choices}',
+            },
+            {
+                'field': 'solution',
+                'rule': RULE_ANY_OF,
+                'keys': ['code', 'explanation'],
+                'level': LEVEL_WARNING,
+                'error_type': 'incomplete_solution',
+                'message': 'Solution should have code or explanation',
+            },
+        ],
+    }
+
+
+ENTRY_SCHEMA = entry_schema()
+
+
+class CompiledSchema:
+    """
+    A schema description compiled for fast checking.
+
+    Checks return plain Issue tuples; callers build ValidationError
+    models (or messages) only for the problems actually found.
+
+    Example:
+        >>> schema = compile_schema(ENTRY_SCHEMA)
+        >>> errors, warnings = schema.check(content)
+        >>> for error_type, message, field_path in errors:
+        ...     print(field_path, message)
+    """
+
+    def __init__(self, definition: Dict[str, Any]):
+        """
+        Compile a schema description.
+
+        Args:
+            definition: Schema description, as returned by entry_schema()
+
+        Raises:
+            ValueError: If a field rule is of an unknown kind
+            re.error: If an ID pattern is not a valid regular expression
+        """
+        self.definition = definition
+        self.required = tuple(definition['required'])
+        self.sections = tuple(
+            (name, tuple(section['required']))
+            for name, section in definition['sections'].items()
+        )
+        self.section_fields = {name: (required, frozenset(required)) for name, required in self.sections}
+
+        # Field rules, grouped by kind: (field, compiled argument, report)
+        rules: Dict[str, List[Tuple[str, Any, Tuple[bool, str, str, Any]]]] = {
+            RULE_PATTERN: [], RULE_ENUM: [], RULE_ANY_OF: []
+        }
+        for rule in definition['fields']:
+            kind = rule['rule']
+            if kind == RULE_ENUM:
+                arg = frozenset(rule['choices'])
+            elif kind == RULE_PATTERN:
+                arg = re.compile(rule['pattern']).match
+            elif kind == RULE_ANY_OF:
+                arg = tuple(rule['keys'])
+            else:
+                raise ValueError(f"Unknown schema rule: {kind}")
+
+            report = (rule['level'] == LEVEL_WARNING, rule['error_type'], rule['message'], rule.get('choices'))
+            rules[kind].append((rule['field'], arg, report))
+
+        self.pattern_rules = tuple(rules[RULE_PATTERN])
+        self.enum_rules = tuple(rules[RULE_ENUM])
+        self.any_of_rules = tuple(rules[RULE_ANY_OF])
+
+    def __reduce__(self):
+        # Compiled patterns are bound methods; recompile in the receiving process
+        return (CompiledSchema, (self.definition,))
+
+    def check(self, content: Dict[str, Any]) -> Tuple[List[Issue], List[Issue]]:
+        """
+        Check a parsed knowledge file: file fields, then every entry.
+
+        Returns:
+            (errors, warnings)
+        """
+        errors, warnings = self.check_file(content)
+        for name, _ in self.sections:
+            for index, entry in enumerate(content.get(name) or ()):
+                self.check_entry(entry, name, index, errors, warnings)
+        return errors, warnings
+
+    def check_file(self, content: Dict[str, Any]) -> Tuple[List[Issue], List[Issue]]:
+        """
+        Check the file-level fields of a parsed knowledge file.
+
+        Returns:
+            (errors, warnings)
+        """
+        errors = [
+            ('required_field', f"Missing required field: {field}", field)
+            for field in self.required if field not in content
+        ]
+        warnings = []
+
+        if not any(content.get(name) for name, _ in self.sections):
+            warnings.append(('empty_content', "File has no errors or patterns", self.sections[0][0]))
+
+        return errors, warnings
+
+    def check_entry(
+        self,
+        entry: Any,
+        section: str,
+        index: int,
+        errors: List[Issue],
+        warnings: List[Issue]
+    ) -> None:
+        """
+        Check one entry, appending what it finds to errors and warnings.
+
+        Args:
+            entry: Entry from the file
+            section: Section the entry is in (e.g. 'errors')
+            index: Position of the entry in its section
+            errors, warnings: Lists to append Issue tuples to
+        """
+        if not isinstance(entry, dict):
+            errors.append(('schema', f"Entry must be a mapping, got {type(entry).__name__}", f"{section}[{index}]"))
+            return
+
+        required, required_set = self.section_fields.get(section, ((), frozenset()))
+        if not required_set <= entry.keys():
+            for field in required:
+                if field not in entry:
+                    errors.append(('required_field', f"Missing required field: {field}", f"{section}[{index}].{field}"))
+
+        for field, match, report in self.pattern_rules:
+            value = entry.get(field, _MISSING)
+            if value is not _MISSING and not match(str(value)):
+                self._report(report, value, section, index, field, errors, warnings)
+
+        for field, choices, report in self.enum_rules:
+            value = entry.get(field, _MISSING)
+            if value is _MISSING:
+                continue
+            try:
+                if value in choices:
+                    continue
+            except TypeError:
+                pass  # Unhashable, so not one of the choices
+            self._report(report, value, section, index, field, errors, warnings)
+
+        for field, keys, report in self.any_of_rules:
+            value = entry.get(field)
+            # Only applies to mappings
+            if isinstance(value, dict) and not any(value.get(key) for key in keys):
+                self._report(report, value, section, index, field, errors, warnings)
+
+    @staticmethod
+    def _report(report, value, section, index, field, errors, warnings) -> None:
+        is_warning, error_type, message, choices = report
+        issue = (error_type, message.format(value=value, choices=choices), f"{section}[{index}].{field}")
+        (warnings if is_warning else errors).append(issue)
+
+
+def format_issue(issue: Issue) -> str:
+    """Render an Issue as '<field path>: <message>'"""
+    _, message, field_path = issue
+    return f"{field_path}: {message}" if field_path else message
+
+
+_default: Optional[CompiledSchema] = None
+
+
+def compile_schema(definition: Optional[Dict[str, Any]] = None) -> CompiledSchema:
+    """
+    Compile a schema description.
+
+    Args:
+        definition: Schema description (default: ENTRY_SCHEMA, compiled once
+            and shared)
+
+    Returns:
+        CompiledSchema
+    """
+    global _default
+    if definition is not None:
+        return CompiledSchema(definition)
+    if _default is None:
+        _default = CompiledSchema(ENTRY_SCHEMA)
+    return _default
@@ -5,13 +5,22 @@ Provides search capabilities across knowledge entries with support for
 filtering, prioritization, and result aggregation.
 """
 
+import base64
+import hashlib
+import json
 import re
-import yaml
 import time
+from itertools import islice
 from pathlib import Path
-from typing import List, Dict, Any, Optional, Tuple
+from typing import List, Dict, Any, Optional, Tuple, Iterator, Callable
 from collections import defaultdict
 
+from .corpus import CorpusCache, CorpusEntry, is_corpus_file
+from .index import KnowledgeIndex
+from .facets import ROOT_FACET, bits_of, iter_bits
+from .ranking import BM25Scorer, ranked
+from .store import IndexStore, DEFAULT_CACHE_DIR, INDEX_FILENAME
+from .binindex import write_binary_index, ROLE_SEARCH, ROLE_PROJECT, ROLE_SHARED
 from .models import (
     SearchFilter,
     SearchResult,
@@ -22,24 +31,80 @@ from .models import (
 )
 
 
+def _query_key(*parts: Any) -> str:
+    """Fingerprint of a query and its filters, so cursors can't be replayed on another query"""
+    return hashlib.sha1(json.dumps(parts, sort_keys=True, default=str).encode('utf-8')).hexdigest()[:12]
+
+
+def _encode_cursor(offset: int, query_key: str) -> str:
+    """Encode an opaque pagination cursor"""
+    payload = json.dumps({'offset': offset, 'query': query_key}).encode('utf-8')
+    return base64.urlsafe_b64encode(payload).decode('ascii')
+
+
+def _decode_cursor(cursor: str, query_key: str) -> int:
+    """Decode a pagination cursor into an offset"""
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor.encode('ascii')))
+        offset = payload['offset']
+        cursor_key = payload['query']
+    except (ValueError, TypeError, KeyError, UnicodeError):
+        raise ValueError(f"Invalid cursor: {cursor}")
+
+    if cursor_key != query_key or not isinstance(offset, int) or offset < 0:
+        raise ValueError("Cursor does not belong to this query")
+
+    return offset
+
+
 class KnowledgeSearch:
     """
     Core search engine for knowledge base.
 
-    Provides string-based search across YAML files with support for
-    category, severity, scope, and tag filtering.
+    Provides token-based search across YAML files with support for
+    category, severity, scope, and tag filtering. Entries are kept in an
+    inverted index that is updated only for files that changed on disk,
+    and query results are ranked by field-weighted BM25.
     """
 
-    def __init__(self, search_paths: List[str] = None):
+    def __init__(
+        self,
+        search_paths: List[str] = None,
+        corpus: Optional[CorpusCache] = None,
+        repo_path: str = None,
+        index_path: str = None,
+        workers: Optional[int] = None,
+        auto_refresh: bool = True
+    ):
         """
         Initialize search engine.
 
         Args:
             search_paths: List of root paths to search (default: ["domains"])
+            corpus: Parsed-entry cache to share between instances (default: new cache)
+            repo_path: Base path for relative search paths (default: current directory)
+            index_path: On-disk index snapshot (default: .kb/cache/search-index.pickle);
+                the binary index is written next to it with a .bin suffix
+            workers: Processes for parsing many changed files at once
+                (default: KB_WORKERS or CPU count)
+            auto_refresh: Re-scan search roots for changed files on every
+                query. Disable when a ChangeWatcher keeps the index current.
         """
-        self.search_paths = [Path(p) for p in (search_paths or ["domains"])]
-        self.project_kb_path = Path(".kb/project")
-        self.shared_kb_path = Path(".kb/shared")
+        base_path = Path(repo_path) if repo_path else Path()
+        self.search_paths = [base_path / p for p in (search_paths or ["domains"])]
+        self.project_kb_path = base_path / ".kb" / "project"
+        self.shared_kb_path = base_path / ".kb" / "shared"
+        self.index = KnowledgeIndex(corpus)
+        self.corpus = self.index.corpus
+        self.scorer = BM25Scorer(self.index.tokens)
+        self.store = IndexStore(
+            Path(index_path) if index_path else base_path / DEFAULT_CACHE_DIR / INDEX_FILENAME
+        )
+        self.binary_index_path = self.store.path.with_suffix('.bin')
+        self.workers = workers
+        self.auto_refresh = auto_refresh
+        self._index_loaded = False
+        self._saved_generation = None
 
     def search(
         self,
@@ -49,7 +114,11 @@ class KnowledgeSearch:
         scope: Optional[str] = None,
         limit: int = 50,
         include_project: bool = True,
-        include_shared: bool = True
+        include_shared: bool = True,
+        tags: Optional[List[str]] = None,
+        offset: int = 0,
+        cursor: Optional[str] = None,
+        unique_ids: bool = True
     ) -> SearchResults:
         """
         Search knowledge base for entries matching query and filters.
@@ -62,53 +131,43 @@ class KnowledgeSearch:
             limit: Maximum results to return
             include_project: Include project KB results
             include_shared: Include shared KB results
+            tags: Only include entries with all of these tags
+            offset: Number of results to skip
+            cursor: next_cursor of a previous page (overrides offset)
+            unique_ids: Only return the highest priority entry of each ID
+                (False also returns entries whose ID is defined elsewhere)
 
         Returns:
-            SearchResults with matching entries
+            SearchResults with one page of matching entries, best match
+            first, and facet counts over all matching entries
+
+        Raises:
+            ValueError: If the cursor is invalid or belongs to another query
         """
         start_time = time.time()
 
-        # Search in domains/
-        domain_results = self._search_domains(
+        query_key = _query_key(query, category, severity, scope, tags, include_project, include_shared, unique_ids)
+        if cursor:
+            offset = _decode_cursor(cursor, query_key)
+
+        # Bring the index up to date with the requested KB roots
+        roots = self.search_roots(include_project, include_shared)
+        self._refresh(roots)
+
+        # Take one page (plus one result to tell if there are more) from
+        # the lazy stream of ranked, deduplicated entries
+        stream, facet_counts = self._result_stream(
+            roots,
             query=query,
             category=category,
             severity=severity,
-            scope=scope
+            scope=scope,
+            tags=tags,
+            unique_ids=unique_ids
         )
-
-        # Search in project KB if exists and requested
-        project_results = []
-        if include_project and self.project_kb_path.exists():
-            project_results = self._search_kb_directory(
-                self.project_kb_path,
-                query=query,
-                category=category,
-                severity=severity,
-                scope=scope
-            )
-
-        # Search in shared KB if exists and requested
-        shared_results = []
-        if include_shared and self.shared_kb_path.exists():
-            shared_results = self._search_kb_directory(
-                self.shared_kb_path,
-                query=query,
-                category=category,
-                severity=severity,
-                scope=scope
-            )
-
-        # Combine and deduplicate results
-        all_results = domain_results + project_results + shared_results
-        seen_ids = set()
-        unique_results = []
-        for result in all_results:
-            if result.metadata.id not in seen_ids:
-                seen_ids.add(result.metadata.id)
-                unique_results.append(result)
-
-        # Apply limit
-        limited_results = unique_results[:limit]
+        limited_results = list(islice(stream, offset, offset + limit + 1))
+        has_more = len(limited_results) > limit
+        limited_results = limited_results[:limit]
 
         # Separate by KB type
         final_project = [r for r in limited_results if r.kb_type == "project"]
@@ -126,206 +185,413 @@ class KnowledgeSearch:
                 category=category,
                 severity=severity,
                 scope=scope,
-                limit=limit
+                tags=tags,
+                limit=limit,
+                offset=offset
             ),
-            execution_time_ms=execution_time
+            execution_time_ms=execution_time,
+            facets=facet_counts,
+            offset=offset,
+            has_more=has_more,
+            next_cursor=_encode_cursor(offset + limit, query_key) if has_more else None
         )
 
-    def _search_domains(
+    def iter_search(
         self,
         query: str,
         category: Optional[str] = None,
         severity: Optional[str] = None,
-        scope: Optional[str] = None
-    ) -> List[SearchResult]:
-        """Search in domains/ directory"""
-        results = []
+        scope: Optional[str] = None,
+        limit: Optional[int] = None,
+        include_project: bool = True,
+        include_shared: bool = True,
+        tags: Optional[List[str]] = None,
+        unique_ids: bool = True
+    ) -> Iterator[SearchResult]:
+        """
+        Lazily yield search results.
+
+        Ranked queries need corpus-wide statistics, so the index is brought
+        up to date first and results are then popped from the ranking heap
+        one at a time. Unranked (empty) queries index and yield file by
+        file, in root priority and file path order, and stop reading files
+        once limit results were produced.
+
+        Args:
+            query: Search string to match (empty for unranked browsing)
+            category: Filter by category
+            severity: Filter by severity level
+            scope: Filter by scope
+            limit: Maximum results to yield (None for all)
+            include_project: Include project KB results
+            include_shared: Include shared KB results
+            tags: Only include entries with all of these tags
+            unique_ids: Only yield the highest priority entry of each ID
+
+        Yields:
+            SearchResult, best match first for ranked queries
+        """
+        roots = self.search_roots(include_project, include_shared)
+        filters = {'category': category, 'severity': severity, 'scope': scope, 'tags': tags}
+
+        if query:
+            self._refresh(roots)
+            stream, _ = self._result_stream(roots, query=query, unique_ids=unique_ids, **filters)
+        else:
+            self._ensure_index_loaded()
+            stream = self._build_results(
+                ((doc_id, 1.0) for doc_id in self._iter_unranked(roots, **filters)),
+                unique_ids
+            )
+
+        yield from islice(stream, limit)
 
-        for search_path in self.search_paths:
-            if not search_path.exists():
+    def _iter_unranked(
+        self,
+        roots: List[Tuple[Path, str]],
+        **filters: Any
+    ) -> Iterator[int]:
+        """Sync files one at a time and yield ids of their entries that match the filters"""
+        facets = self.index.facets
+
+        for root, kb_type in roots:
+            if not root.exists():
                 continue
 
-            for yaml_file in self._find_yaml_files(search_path):
-                file_results = self._search_file(
-                    yaml_file,
-                    query=query,
-                    category=category,
-                    severity=severity,
-                    scope=scope
-                )
-                results.extend(file_results)
+            for yaml_file in self._iter_yaml_files(root):
+                self.index.sync_file(yaml_file, kb_type, str(root))
 
-        return results
+                for doc_id in self.index.file_doc_ids(yaml_file):
+                    if facets.select(1 << doc_id, **filters):
+                        yield doc_id
 
-    def _search_kb_directory(
+    def search_roots(
         self,
-        kb_path: Path,
-        query: str,
-        category: Optional[str] = None,
-        severity: Optional[str] = None,
-        scope: Optional[str] = None
-    ) -> List[SearchResult]:
-        """Search in a KB directory (.kb/project or .kb/shared)"""
-        results = []
+        include_project: bool = True,
+        include_shared: bool = True
+    ) -> List[Tuple[Path, str]]:
+        """
+        Get (root path, KB type) pairs to search, in priority order.
 
-        if not kb_path.exists():
-            return results
+        Args:
+            include_project: Include the project KB (.kb/project)
+            include_shared: Include the shared KB (.kb/shared)
 
-        kb_type = "project" if kb_path.name == "project" else "shared"
+        Returns:
+            List of (root path, "shared" or "project")
+        """
+        roots = [(search_path, "shared") for search_path in self.search_paths]
 
-        for yaml_file in self._find_yaml_files(kb_path):
-            file_results = self._search_file(
-                yaml_file,
-                query=query,
-                category=category,
-                severity=severity,
-                scope=scope,
-                kb_type=kb_type
-            )
-            results.extend(file_results)
+        if include_project:
+            roots.append((self.project_kb_path, "project"))
 
-        return results
+        if include_shared:
+            roots.append((self.shared_kb_path, "shared"))
 
-    def _find_yaml_files(self, root_path: Path) -> List[Path]:
-        """Find all YAML files, excluding index and meta files"""
-        yaml_files = []
+        return roots
 
-        for yaml_file in root_path.rglob('*.yaml'):
-            # Skip index and meta files
-            if any(x in str(yaml_file) for x in ['_index.yaml', '_meta.yaml', 'catalog.yaml']):
-                continue
+    def load_index(self) -> bool:
+        """
+        Load the on-disk index snapshot built by `kb.py index`.
+
+        Files that changed since the snapshot was written are re-parsed on
+        the next query.
+
+        Returns:
+            True if a compatible snapshot was loaded
+        """
+        self._index_loaded = True
+
+        snapshot = self.store.load()
+        if snapshot is None:
+            return False
+
+        # File keys are relative to the search roots, so they must match
+        roots = [str(root) for root, _ in self.search_roots()]
+        if snapshot['metadata'].get('roots') != roots:
+            return False
+
+        self.index.set_state(snapshot['state'])
+        self.scorer.index = self.index.tokens
+        self._saved_generation = self.index.generation
+        return True
 
-            yaml_files.append(yaml_file)
+    def save_index(self) -> Path:
+        """
+        Write the current index to disk.
+
+        Writes both the snapshot used to resume incremental indexing and
+        the memory-mapped binary index used by one-shot CLI searches.
+
+        Returns:
+            Path to the written snapshot
+        """
+        path = self.store.save(
+            self.index.get_state(),
+            metadata={
+                'roots': [str(root) for root, _ in self.search_roots()],
+                'files': self.index.file_count,
+                'entries': len(self.index),
+                'tokens': len(self.index.tokens.postings)
+            }
+        )
+        write_binary_index(
+            self.binary_index_path,
+            self.index,
+            self._binary_roots(),
+            self._binary_payload
+        )
+        self._saved_generation = self.index.generation
+        return path
+
+    def _binary_roots(self) -> List[Tuple[str, str, str]]:
+        """Get (root path, KB type, role) of every search root for the binary index"""
+        roots = [(str(path), "shared", ROLE_SEARCH) for path in self.search_paths]
+        roots.append((str(self.project_kb_path), "project", ROLE_PROJECT))
+        roots.append((str(self.shared_kb_path), "shared", ROLE_SHARED))
+        return roots
+
+    def _binary_payload(self, item: CorpusEntry) -> Optional[Dict[str, Any]]:
+        """Get the stored result payload of an entry, or None if its metadata is invalid"""
+        result = self._build_result(item)
+        if result is None:
+            return None
+        return {
+            'metadata': result.metadata.model_dump(mode='json'),
+            'preview': result.preview
+        }
+
+    def build_index(self, force: bool = False) -> Dict[str, Any]:
+        """
+        Build or update the on-disk index.
 
-        return yaml_files
+        Args:
+            force: Discard any existing snapshot and re-parse every file
 
-    def _search_file(
+        Returns:
+            Dict with snapshot and binary index paths, file/entry/token counts
+            and number of parsed files
+        """
+        if force:
+            self._index_loaded = True
+            self.index.clear()
+        elif not self._index_loaded:
+            self.load_index()
+
+        parses_before = self.corpus.parse_count
+        self._refresh(self.search_roots())
+        path = self.save_index()
+
+        return {
+            'path': str(path),
+            'binary_path': str(self.binary_index_path),
+            'files': self.index.file_count,
+            'entries': len(self.index),
+            'tokens': len(self.index.tokens.postings),
+            'parsed': self.corpus.parse_count - parses_before
+        }
+
+    def _ensure_index_loaded(self) -> None:
+        """Start from the on-disk snapshot instead of re-parsing everything"""
+        if not self._index_loaded:
+            self.load_index()
+
+    @property
+    def index_is_dirty(self) -> bool:
+        """Whether the in-memory index changed since it was loaded or saved"""
+        return self._saved_generation != self.index.generation
+
+    def _refresh(self, roots: List[Tuple[Path, str]]) -> None:
+        """Re-index files under the given roots that changed on disk"""
+        self._ensure_index_loaded()
+
+        if not self.auto_refresh:
+            # A ChangeWatcher patches changes in between queries
+            return
+
+        for root, kb_type in roots:
+            files = self._find_yaml_files(root) if root.exists() else []
+            # Parse changed files in parallel before indexing them in order
+            self.corpus.preload(files, kb_type, self.workers)
+            self.index.sync_root(root, files, kb_type)
+
+    def sync_files(
         self,
-        file_path: Path,
-        query: str,
-        category: Optional[str] = None,
-        severity: Optional[str] = None,
-        scope: Optional[str] = None,
-        kb_type: str = "shared"
-    ) -> List[SearchResult]:
-        """Search a single YAML file for matching entries"""
-        results = []
+        root: Path,
+        kb_type: str,
+        changed: List[Path],
+        removed: List[str],
+        force: bool = False
+    ) -> int:
+        """
+        Patch specific files under a search root into the index.
 
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = yaml.safe_load(f)
+        Used by ChangeWatcher, which finds the changed files itself.
 
-                if not content:
-                    return results
+        Args:
+            root: Search root holding the files
+            kb_type: "project" or "shared"
+            changed: New or modified files to (re-)index
+            removed: Indexed files that no longer exist
+            force: Re-parse changed files even if their signature matches
 
-                # Extract category from file
-                file_category = content.get('category', '')
-
-                # Search in errors
-                for entry in content.get('errors', []):
-                    if self._matches_filters(
-                        entry,
-                        query=query,
-                        category=category or file_category,
-                        severity=severity,
-                        scope=scope
-                    ):
-                        metadata = self._extract_metadata(entry, file_path, file_category)
-                        preview = self._extract_preview(entry)
-
-                        results.append(SearchResult(
-                            metadata=metadata,
-                            preview=preview,
-                            kb_type=kb_type
-                        ))
-
-                # Search in patterns
-                for entry in content.get('patterns', []):
-                    if self._matches_filters(
-                        entry,
-                        query=query,
-                        category=category or file_category,
-                        severity=severity,
-                        scope=scope
-                    ):
-                        metadata = self._extract_metadata(entry, file_path, file_category, is_pattern=True)
-                        preview = self._extract_preview(entry)
-
-                        results.append(SearchResult(
-                            metadata=metadata,
-                            preview=preview,
-                            kb_type=kb_type
-                        ))
-
-        except Exception as e:
-            # Log error but continue processing
-            pass
+        Returns:
+            Number of files re-indexed or removed
+        """
+        self._ensure_index_loaded()
 
-        return results
+        if force:
+            for file_path in changed:
+                self.corpus.discard(file_path)
+
+        # Parse changed files in parallel before indexing them in order
+        self.corpus.preload(changed, kb_type, self.workers)
+
+        updated = 0
+        for file_path in changed:
+            updated += self.index.sync_file(file_path, kb_type, str(root))
+        for file_path in removed:
+            updated += self.index.drop_file(file_path)
+
+        return updated
+
+    def sync_paths(self, paths: List[Path]) -> int:
+        """
+        Patch specific files into the index under the search roots holding them.
 
-    def _matches_filters(
+        Lets an engine with auto_refresh=False bring just these files up to
+        date, without scanning the roots. Files outside every search root
+        are ignored.
+
+        Args:
+            paths: New, modified or deleted files
+
+        Returns:
+            Number of files re-indexed or removed
+        """
+        resolved = [Path(path).resolve() for path in paths]
+
+        updated = 0
+        for root, kb_type in self.search_roots():
+            root_resolved = root.resolve()
+            # Index keys are built from the root as configured, not resolved
+            files = [root / path.relative_to(root_resolved) for path in resolved if root_resolved in path.parents]
+            if files:
+                changed = [path for path in files if path.exists() and is_corpus_file(path)]
+                removed = [str(path) for path in files if not path.exists()]
+                updated += self.sync_files(root, kb_type, changed, removed)
+
+        return updated
+
+    def _result_stream(
         self,
-        entry: Dict[str, Any],
+        roots: List[Tuple[Path, str]],
         query: str,
         category: Optional[str] = None,
         severity: Optional[str] = None,
-        scope: Optional[str] = None
-    ) -> bool:
-        """Check if entry matches all filters"""
-        # Query matching (string search in entry content)
-        if query and not self._matches_query(entry, query):
-            return False
-
-        # Severity filter
-        if severity and entry.get('severity') != severity:
-            return False
+        scope: Optional[str] = None,
+        tags: Optional[List[str]] = None,
+        unique_ids: bool = True
+    ) -> Tuple[Iterator[SearchResult], Dict[str, Dict[str, int]]]:
+        """
+        Get a lazy stream of results for indexed entries matching query and
+        filters, best first, together with facet counts over all matches.
 
-        # Scope filter
-        if scope and entry.get('scope') != scope:
-            return False
+        Results are only built as the stream is consumed.
+        """
+        facets = self.index.facets
+        root_keys = [str(root) for root, _ in roots]
 
-        # Category filter
-        # Note: category is typically at file level, not entry level
-        # So we handle it at the file search level
+        # Combine root and facet bitsets with the query's posting lists;
+        # an empty query matches everything
+        selected = facets.select(
+            facets.any_of(ROOT_FACET, root_keys),
+            category=category,
+            severity=severity,
+            scope=scope,
+            tags=tags
+        )
+        if query and selected:
+            selected &= bits_of(self.index.match(query))
+
+        facet_counts = facets.counts(selected)
+
+        if query:
+            # Rank by BM25, ties broken by root priority, file path and position
+            priority = self._priority(roots)
+            matches = list(iter_bits(selected))
+            scores = self.scorer.score(query, matches)
+            best = max(scores.values(), default=0.0) or 1.0
+            stream = (
+                (doc_id, score / best)
+                for doc_id, score in ranked(scores, {doc_id: priority(doc_id) for doc_id in matches})
+            )
+        else:
+            # Unranked: root priority, then file path and entry position
+            stream = (
+                (doc_id, 1.0)
+                for root in root_keys
+                for doc_id in sorted(iter_bits(selected & facets.get(ROOT_FACET, root)), key=self.index.doc_order)
+            )
 
-        return True
+        return self._build_results(stream, unique_ids), facet_counts
 
-    def _matches_query(self, entry: Dict[str, Any], query: str) -> bool:
-        """Check if entry matches query string"""
-        query_lower = query.lower()
+    def _build_results(
+        self,
+        stream: Iterator[Tuple[int, float]],
+        unique_ids: bool = True
+    ) -> Iterator[SearchResult]:
+        """Build results for (doc id, relevance) pairs, skipping invalid entries and, if unique_ids, repeated ids"""
+        seen_ids = set()
 
-        # Search in key fields
-        searchable_fields = [
-            entry.get('id', ''),
-            entry.get('title', ''),
-            entry.get('problem', ''),
-            entry.get('root_cause', ''),
-        ]
+        for doc_id, relevance in stream:
+            item = self.index.docs[doc_id]
+            entry_id = item.entry.get('id', 'UNKNOWN')
+            if unique_ids and entry_id in seen_ids:
+                continue
 
-        # Search in solution
-        solution = entry.get('solution', {})
-        if isinstance(solution, dict):
-            searchable_fields.append(solution.get('code', ''))
-            searchable_fields.append(solution.get('explanation', ''))
+            result = self._build_result(item, relevance)
+            if result is not None:
+                seen_ids.add(entry_id)
+                yield result
 
-        # Search in tags
-        tags = entry.get('tags', [])
-        if tags:
-            searchable_fields.extend(tags)
+    def _build_result(self, item: CorpusEntry, relevance: float = 1.0) -> Optional[SearchResult]:
+        """Build a search result for an entry, or None if its metadata is invalid"""
+        try:
+            metadata = self._extract_metadata(
+                item.entry, item.file_path, item.category, is_pattern=item.is_pattern,
+                line_number=item.line
+            )
+            preview = self._extract_preview(item.entry)
+        except (ValueError, AttributeError):
+            # Entry with invalid metadata, skip it
+            return None
+
+        return SearchResult(
+            metadata=metadata,
+            preview=preview,
+            relevance_score=round(min(max(relevance, 0.0), 1.0), 4),
+            kb_type=item.kb_type
+        )
 
-        # Check if any field contains the query
-        for field in searchable_fields:
-            if field and query_lower in str(field).lower():
-                return True
+    def _find_yaml_files(self, root_path: Path) -> List[Path]:
+        """Find all YAML files, excluding index and meta files"""
+        return list(self._iter_yaml_files(root_path))
 
-        return False
+    def _iter_yaml_files(self, root_path: Path) -> Iterator[Path]:
+        """Lazily yield YAML files in path order, excluding index and meta files"""
+        for yaml_file in sorted(root_path.rglob('*.yaml'), key=str):
+            # Skip index and meta files
+            if is_corpus_file(yaml_file):
+                yield yaml_file
 
     def _extract_metadata(
         self,
         entry: Dict[str, Any],
         file_path: Path,
         category: str,
-        is_pattern: bool = False
+        is_pattern: bool = False,
+        line_number: Optional[int] = None
     ) -> EntryMetadata:
         """Extract metadata from entry"""
         solution = entry.get('solution', {})
@@ -337,6 +603,7 @@ class KnowledgeSearch:
             scope=entry.get('scope', 'universal'),
             category=category,
             file_path=str(file_path),
+            line_number=line_number,
             has_prevention=bool(entry.get('prevention')),
             has_code=bool(solution.get('code') if isinstance(solution, dict) else False),
             has_explanation=bool(solution.get('explanation') if isinstance(solution, dict) else False),
@@ -378,50 +645,112 @@ class KnowledgeSearch:
         """
         Retrieve a specific entry by ID.
 
+        Looks the entry up in the index's id map, so only the file holding
+        it is checked (and re-parsed if it changed on disk).
+
         Args:
             entry_id: Entry ID (e.g., "DOCKER-024")
 
         Returns:
-            Entry dict if found, None otherwise
+            Dict with the entry, its file_path, category, line_number, the
+            lines of its fields and the other places the same id is
+            defined (duplicates), or None if not found
+        """
+        self._ensure_index_loaded()
+        roots = self.search_roots()
+
+        # Build the id map once if there is no snapshot to start from
+        if not self.index.file_count:
+            self._refresh(roots)
+
+        item = self._locate(entry_id, roots)
+
+        if item is None:
+            # The entry may live in a file added since the index was built
+            self._refresh(roots)
+            item = self._locate(entry_id, roots)
+
+        if item is None:
+            return None
+
+        return {
+            'entry': item.entry,
+            'file_path': str(item.file_path),
+            'category': item.category,
+            'line_number': item.line,
+            'lines': item.field_lines(),
+            'duplicates': [
+                occurrence for occurrence in self._occurrences(entry_id, roots)
+                if occurrence['field_path'] != f"{item.field_path}.id"
+                or occurrence['file_path'] != str(item.file_path)
+            ]
+        }
+
+    def find_duplicate_ids(self) -> Dict[str, List[Dict[str, Any]]]:
         """
-        # Search all YAML files for matching ID
-        all_paths = self.search_paths + [self.project_kb_path, self.shared_kb_path]
+        Find entry ids defined more than once across all search roots.
 
-        for search_path in all_paths:
-            if not search_path.exists():
-                continue
+        The index keeps the set of duplicated ids current as files are
+        re-indexed, so this costs one refresh of changed files plus a
+        lookup per duplicated id.
 
-            for yaml_file in self._find_yaml_files(search_path):
-                try:
-                    with open(yaml_file, 'r', encoding='utf-8') as f:
-                        content = yaml.safe_load(f)
-
-                        if not content:
-                            continue
-
-                        # Search in errors
-                        for entry in content.get('errors', []):
-                            if entry.get('id') == entry_id:
-                                return {
-                                    'entry': entry,
-                                    'file_path': str(yaml_file),
-                                    'category': content.get('category', '')
-                                }
-
-                        # Search in patterns
-                        for entry in content.get('patterns', []):
-                            if entry.get('id') == entry_id:
-                                return {
-                                    'entry': entry,
-                                    'file_path': str(yaml_file),
-                                    'category': content.get('category', '')
-                                }
-
-                except Exception:
-                    continue
+        Returns:
+            Entry id to its occurrences (file_path, line_number, field_path,
+            kb_type), in lookup order: get_by_id returns the first
+        """
+        roots = self.search_roots()
+        self._refresh(roots)
+
+        duplicates = {}
+        for entry_id in self.index.duplicates():
+            occurrences = self._occurrences(entry_id, roots)
+            if len(occurrences) > 1:
+                duplicates[entry_id] = occurrences
+        return duplicates
+
+    def _occurrences(self, entry_id: str, roots: List[Tuple[Path, str]]) -> List[Dict[str, Any]]:
+        """Describe every indexed entry with an id under the given roots, in lookup order"""
+        occurrences = []
+        for doc_id in self._candidates(entry_id, roots):
+            item = self.index.docs[doc_id]
+            occurrences.append({
+                'file_path': str(item.file_path),
+                'line_number': item.line,
+                'field_path': f"{item.field_path}.id",
+                'kb_type': item.kb_type
+            })
+        return occurrences
+
+    def _locate(self, entry_id: str, roots: List[Tuple[Path, str]]) -> Optional[CorpusEntry]:
+        """Find the highest-priority indexed entry with an id, re-indexing its file if it changed"""
+        for doc_id in self._candidates(entry_id, roots):
+            item = self.index.docs[doc_id]
+
+            # Stats the one file; parses it only if it changed on disk
+            if self.index.sync_file(item.file_path, item.kb_type, self.index.doc_roots[doc_id]):
+                return self._locate(entry_id, roots)
+
+            if item.entry.get('id') == entry_id:
+                return item
 
         return None
 
+    def _candidates(self, entry_id: str, roots: List[Tuple[Path, str]]) -> List[int]:
+        """Get the documents holding an id under the given roots, in lookup order"""
+        root_keys = {str(root) for root, _ in roots}
+        priority = self._priority(roots)
+        return sorted(
+            (doc_id for doc_id in self.index.locate(entry_id) if self.index.doc_roots.get(doc_id) in root_keys),
+            key=priority
+        )
+
+    def _priority(self, roots: List[Tuple[Path, str]]) -> Callable[[int], Tuple[int, str, int]]:
+        """Get the sort key of documents under the given roots: root priority, then file path and position"""
+        root_order = {str(root): position for position, (root, _) in enumerate(roots)}
+        doc_roots = self.index.doc_roots
+        doc_order = self.index.doc_order
+        return lambda doc_id: (root_order[doc_roots[doc_id]], *doc_order(doc_id))
+
     def browse_by_category(
         self,
         category: str,
@@ -439,41 +768,23 @@ class KnowledgeSearch:
         Returns:
             List of search results
         """
+        roots = [
+            (root, root_kb_type) for root, root_kb_type in self.search_roots()
+            if kb_type is None or root_kb_type == kb_type
+        ]
+        self._refresh(roots)
+
+        facets = self.index.facets
+        category_bits = facets.get('category', category)
         results = []
 
-        # Search in domains/
-        for search_path in self.search_paths:
-            if not search_path.exists():
-                continue
+        for root, _ in roots:
+            for doc_id in sorted(iter_bits(category_bits & facets.get(ROOT_FACET, str(root))), key=self.index.doc_order):
+                if len(results) >= limit:
+                    return results
 
-            for yaml_file in self._find_yaml_files(search_path):
-                try:
-                    with open(yaml_file, 'r', encoding='utf-8') as f:
-                        content = yaml.safe_load(f)
-
-                        if not content or content.get('category') != category:
-                            continue
-
-                        # Add errors
-                        for entry in content.get('errors', []):
-                            metadata = self._extract_metadata(entry, yaml_file, category)
-                            results.append(SearchResult(
-                                metadata=metadata,
-                                preview=self._extract_preview(entry),
-                                kb_type="shared"
-                            ))
-
-                        # Add patterns
-                        for entry in content.get('patterns', []):
-                            metadata = self._extract_metadata(entry, yaml_file, category, is_pattern=True)
-                            results.append(SearchResult(
-                                metadata=metadata,
-                                preview=self._extract_preview(entry),
-                                kb_type="shared"
-                            ))
-
-                except Exception:
-                    continue
-
-        # Apply limit
-        return results[:limit]
+                result = self._build_result(self.index.docs[doc_id])
+                if result is not None:
+                    results.append(result)
+
+        return results
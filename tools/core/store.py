@@ -0,0 +1,147 @@
+"""
+On-disk index store for Shared Knowledge Base.
+
+Persists the parsed corpus, token index and index metadata under
+.kb/cache/ so processes can start from a warm index instead of
+re-parsing every YAML file.
+
+The snapshot is a local cache written with pickle. Loading goes through
+a restricted unpickler that only resolves index classes, paths and date
+types, and it must still not be shared between machines.
+"""
+
+import datetime as _datetime
+import os
+import pathlib
+import pickle
+import sys
+import tempfile
+from pathlib import Path
+from typing import Dict, Any, Optional
+
+# Bump when the pickled index layout changes
+INDEX_FORMAT_VERSION = 4
+
+DEFAULT_CACHE_DIR = Path(".kb") / "cache"
+INDEX_FILENAME = "search-index.pickle"
+
+# Core modules whose classes may appear in a snapshot
+SNAPSHOT_MODULES = ('corpus', 'index', 'facets')
+
+# Types YAML can produce besides the builtin containers
+SNAPSHOT_DATE_TYPES = ('date', 'datetime', 'time', 'timedelta', 'timezone')
+
+# Entry file paths
+SNAPSHOT_PATH_TYPES = ('PosixPath', 'WindowsPath', 'PurePosixPath', 'PureWindowsPath')
+
+
+class _SnapshotUnpickler(pickle.Unpickler):
+    """
+    Unpickler restricted to index classes, paths and date types.
+
+    Core may be imported as "tools.core" (kb.py) or as "core" (scripts and
+    the MCP server), so classes are resolved against whichever package is
+    running rather than the module path recorded in the snapshot.
+    """
+
+    def find_class(self, module: str, name: str) -> Any:
+        package, _, submodule = module.rpartition('.')
+        if package in ('core', 'tools.core') and submodule in SNAPSHOT_MODULES:
+            from importlib import import_module
+            return getattr(import_module(f"{__package__}.{submodule}"), name)
+
+        if module == 'datetime' and name in SNAPSHOT_DATE_TYPES:
+            return getattr(_datetime, name)
+
+        if module == 'pathlib' and name in SNAPSHOT_PATH_TYPES:
+            return getattr(pathlib, name)
+
+        raise pickle.UnpicklingError(f"Disallowed class in index snapshot: {module}.{name}")
+
+
+class IndexStore:
+    """
+    Reads and writes index snapshots.
+
+    Snapshots with a different format or Python version are ignored, so
+    callers fall back to building the index from YAML.
+    """
+
+    def __init__(self, path: Path):
+        """
+        Initialize store.
+
+        Args:
+            path: Path to the snapshot file
+        """
+        self.path = Path(path)
+
+    def load(self) -> Optional[Dict[str, Any]]:
+        """
+        Load a snapshot.
+
+        Returns:
+            Snapshot dict with 'metadata' and 'state', or None if missing or incompatible
+        """
+        try:
+            with open(self.path, 'rb') as f:
+                snapshot = _SnapshotUnpickler(f).load()
+        except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ImportError, TypeError):
+            return None
+
+        if not isinstance(snapshot, dict):
+            return None
+
+        metadata = snapshot.get('metadata') or {}
+        if metadata.get('format_version') != INDEX_FORMAT_VERSION:
+            return None
+        if metadata.get('python_version') != list(sys.version_info[:2]):
+            return None
+
+        return snapshot
+
+    def save(self, state: Dict[str, Any], metadata: Optional[Dict[str, Any]] = None) -> Path:
+        """
+        Atomically write a snapshot.
+
+        Args:
+            state: Index state to persist
+            metadata: Extra metadata to store alongside the state
+
+        Returns:
+            Path to the written snapshot
+        """
+        snapshot = {
+            'metadata': {
+                **(metadata or {}),
+                'format_version': INDEX_FORMAT_VERSION,
+                'python_version': list(sys.version_info[:2]),
+                'created_at': _datetime.datetime.now().isoformat()
+            },
+            'state': state
+        }
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        # Write to a temp file first so readers never see a partial snapshot
+        fd, tmp_path = tempfile.mkstemp(dir=self.path.parent, prefix=self.path.name, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                pickle.dump(snapshot, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
+
+        return self.path
+
+    def metadata(self) -> Optional[Dict[str, Any]]:
+        """Get metadata of the stored snapshot, if any"""
+        snapshot = self.load()
+        return snapshot['metadata'] if snapshot else None
+
+    def exists(self) -> bool:
+        return self.path.exists()
@@ -0,0 +1,202 @@
+"""
+Validation result cache for Shared Knowledge Base.
+
+Stores per-file validation results under .kb/cache/, keyed by the
+SHA-256 of the file contents and the validator version, so repeated
+runs (pre-commit hooks, `kb.py validate`, the MCP kb_validate tool) only
+re-validate files whose contents changed. Files whose (mtime, size) is
+unchanged since they were hashed are not read at all.
+
+The cache is plain JSON and holds no parsed content, only the errors and
+warnings reported for each file.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+# Bump when the cache file layout changes
+CACHE_FORMAT_VERSION = 1
+
+VALIDATION_CACHE_FILENAME = "validation-cache.json"
+
+# A file modified this close to when it was hashed may change again
+# without its (mtime, size) changing, so it is re-hashed next time
+RACY_WINDOW_NS = 2_000_000_000
+
+# Cached errors and warnings, without file paths
+CachedResult = Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]
+
+
+def file_digest(file_path: Path) -> Optional[str]:
+    """Get the SHA-256 of a file's contents, or None if it cannot be read"""
+    digest = hashlib.sha256()
+    try:
+        with open(file_path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1 << 16), b''):
+                digest.update(chunk)
+    except OSError:
+        return None
+    return digest.hexdigest()
+
+
+class ValidationCache:
+    """
+    Per-file validation results keyed by content hash.
+
+    Results recorded by a validator with a different key (version or
+    rules) are ignored.
+
+    Example:
+        >>> cache = ValidationCache(Path(".kb/cache/validation-cache.json"), "1:abc")
+        >>> cached = cache.lookup(path)
+        >>> if cached is None:
+        ...     cache.store(path, errors, warnings)
+        >>> cache.save()
+    """
+
+    def __init__(self, path: Path, validator_key: str):
+        """
+        Initialize cache.
+
+        Args:
+            path: Path to the cache file
+            validator_key: Validator version and rules the results depend on
+        """
+        self.path = Path(path)
+        self.validator_key = validator_key
+        self.hits = 0
+        self.misses = 0
+        self._files: Optional[Dict[str, Dict[str, Any]]] = None
+        # Resolved path to (signature, digest) of files looked up but not cached
+        self._pending: Dict[str, Tuple[Optional[List[int]], Optional[str]]] = {}
+        self._dirty = False
+
+    @staticmethod
+    def _key(file_path: Path) -> str:
+        return str(Path(file_path).resolve())
+
+    @staticmethod
+    def _signature(file_path: Path) -> Optional[List[int]]:
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            return None
+        return [stat.st_mtime_ns, stat.st_size]
+
+    def _entries(self) -> Dict[str, Dict[str, Any]]:
+        """Load the cache file on first use"""
+        if self._files is None:
+            self._files = {}
+            try:
+                with open(self.path, encoding='utf-8') as f:
+                    data = json.load(f)
+            except (OSError, ValueError):
+                return self._files
+
+            if (isinstance(data, dict)
+                    and data.get('format_version') == CACHE_FORMAT_VERSION
+                    and data.get('validator') == self.validator_key
+                    and isinstance(data.get('files'), dict)):
+                self._files = data['files']
+
+        return self._files
+
+    def lookup(self, file_path: Path) -> Optional[CachedResult]:
+        """
+        Get the cached result for a file, if its contents are unchanged.
+
+        Returns:
+            (errors, warnings) as ValidationError dicts without file_path,
+            or None if the file must be validated
+        """
+        key = self._key(file_path)
+        entry = self._entries().get(key)
+        signature = self._signature(file_path)
+
+        if entry is not None and signature is not None:
+            if entry['signature'] == signature and signature[0] + RACY_WINDOW_NS < entry['checked_ns']:
+                self.hits += 1
+                return entry['errors'], entry['warnings']
+
+            digest = file_digest(file_path)
+            if digest is not None and digest == entry['sha256']:
+                entry['signature'] = signature
+                entry['checked_ns'] = time.time_ns()
+                self._dirty = True
+                self.hits += 1
+                return entry['errors'], entry['warnings']
+        else:
+            digest = file_digest(file_path) if signature is not None else None
+
+        self._pending[key] = (signature, digest)
+        self.misses += 1
+        return None
+
+    def store(self, file_path: Path, errors: List[Dict[str, Any]], warnings: List[Dict[str, Any]]) -> None:
+        """
+        Record the result of validating a file.
+
+        The file is identified by the signature and hash taken when it was
+        looked up, so a file edited while it was validated is validated
+        again next time.
+        """
+        key = self._key(file_path)
+        signature, digest = self._pending.pop(key, (None, None))
+        if signature is None:
+            signature = self._signature(file_path)
+            digest = file_digest(file_path)
+        if signature is None or digest is None:
+            return
+
+        self._entries()[key] = {
+            'signature': signature,
+            'sha256': digest,
+            'checked_ns': time.time_ns(),
+            'errors': errors,
+            'warnings': warnings
+        }
+        self._dirty = True
+
+    def save(self) -> None:
+        """Atomically write the cache, dropping entries for files that no longer exist"""
+        if not self._dirty:
+            return
+
+        files = {key: entry for key, entry in self._entries().items() if os.path.exists(key)}
+        data = {
+            'format_version': CACHE_FORMAT_VERSION,
+            'validator': self.validator_key,
+            'files': files
+        }
+
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.path.parent, prefix=self.path.name, suffix='.tmp')
+        except OSError:
+            # Read-only checkout: validation still works, just uncached
+            return
+
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(data, f)
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
+
+        self._files = files
+        self._dirty = False
+
+    def clear(self) -> None:
+        """Forget all cached results"""
+        self._files = {}
+        self._pending.clear()
+        self._dirty = True
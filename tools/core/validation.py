@@ -2,15 +2,138 @@
 Core validation functionality for Shared Knowledge Base.
 
 Provides YAML validation, schema checking, and quality gates.
+
+With cache=True, per-file results are kept in .kb/cache/ keyed by
+content hash and validator version (see core.valcache), so only files
+that changed since the last run are parsed and validated again.
+
+Files are parsed and validated in a process pool. iter_validate()
+streams per-file results and can stop after max_errors, so CI can fail
+fast without holding every error of a large tree in memory.
+
+Entry ids must be unique across the whole KB, which no single file can
+tell. check_duplicate_ids() reads them from the search index instead, or
+from an EntryIdScan of the search roots when no index should be touched.
 """
 
-import re
-import yaml
+import json
 import time
+import pickle
+import hashlib
+import subprocess
 from pathlib import Path
-from typing import List, Dict, Any, Optional, Tuple
+from typing import List, Dict, Any, Iterable, Iterator, Optional, Tuple
+
+from . import yamlio
+from .corpus import CorpusCache, is_corpus_file
+from .loader import LoadedFile, load_file, imap_files, ERROR_SYNTAX
+from .models import ValidationError, ValidationResult
+from .schema import (
+    ENTRY_SCHEMA, ERROR_FIELDS, PATTERN_FIELDS, SCOPES, SEVERITIES,
+    CompiledSchema, Issue, compile_schema, entry_schema
+)
+from .valcache import ValidationCache, VALIDATION_CACHE_FILENAME
+
+# Bump when validation rules change, so cached results are discarded
+VALIDATOR_VERSION = 3
+
+DEFAULT_CACHE_DIR = Path(".kb") / "cache"
+
+
+def changed_files(ref: str, repo_path: Path, path: Optional[Path] = None) -> List[Path]:
+    """
+    Find YAML knowledge files touched since a git ref.
+
+    Includes committed, staged and unstaged changes as well as untracked
+    files. Deleted files and index/meta files are left out.
+
+    Args:
+        ref: Git ref to compare against (e.g. HEAD, origin/main)
+        repo_path: Repository root
+        path: Only report files under this path (default: whole repository)
+
+    Returns:
+        Changed files, sorted
+
+    Raises:
+        ValueError: If git fails (not a repository, unknown ref)
+    """
+    repo_path = Path(repo_path)
+    pathspec = [str(Path(path).resolve())] if path else []
+
+    commands = [
+        ['git', 'diff', '--name-only', '--relative', '--diff-filter=ACMR', ref, '--'] + pathspec,
+        ['git', 'ls-files', '--others', '--exclude-standard', '--'] + pathspec,
+    ]
+
+    names = set()
+    for command in commands:
+        try:
+            result = subprocess.run(command, cwd=repo_path, capture_output=True, text=True)
+        except OSError as e:
+            raise ValueError(f"Cannot run git: {e}")
+        if result.returncode != 0:
+            raise ValueError(f"git {command[1]} failed: {result.stderr.strip()}")
+        names.update(line for line in result.stdout.splitlines() if line)
+
+    return sorted(
+        repo_path / name for name in names
+        if name.endswith('.yaml') and is_corpus_file(name) and (repo_path / name).is_file()
+    )
+
+
+class EntryIdScan:
+    """
+    Find duplicate entry ids by parsing the search roots, without an index.
+
+    Stands in for KnowledgeSearch in check_duplicate_ids() when no saved
+    index exists and none should be written, e.g. in `kb.py validate`.
+    """
+
+    def __init__(self, roots: List[Tuple[Path, str]], workers: Optional[int] = None):
+        """
+        Initialize scan.
+
+        Args:
+            roots: Search roots and their kb_type, in lookup order
+                (see KnowledgeSearch.search_roots)
+            workers: Processes for parsing files (default: KB_WORKERS or CPU count)
+        """
+        self.roots = roots
+        self.workers = workers
 
-from .models import ValidationError, ValidationResult, SeverityLevel, ScopeLevel
+    def find_duplicate_ids(self) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Find entry ids defined more than once across all roots.
+
+        Returns:
+            Entry id to its occurrences (file_path, line_number, field_path,
+            kb_type), in root order, then file path and position
+        """
+        corpus = CorpusCache()
+        occurrences: Dict[str, List[Dict[str, Any]]] = {}
+
+        for root, kb_type in self.roots:
+            files = sorted((path for path in root.rglob('*.yaml') if is_corpus_file(path)), key=str)
+            corpus.preload(files, kb_type, self.workers)
+
+            for file_path in files:
+                corpus_file = corpus.get(file_path, kb_type)
+                for item in corpus_file.entries if corpus_file else []:
+                    entry_id = item.entry.get('id')
+                    if isinstance(entry_id, str):
+                        occurrences.setdefault(entry_id, []).append({
+                            'file_path': str(item.file_path),
+                            'line_number': item.line,
+                            'field_path': f"{item.field_path}.id",
+                            'kb_type': item.kb_type
+                        })
+
+        return {
+            entry_id: occurrences[entry_id]
+            for entry_id in sorted(occurrences)
+            if len(occurrences[entry_id]) > 1
+        }
 
 
 class KnowledgeValidator:
@@ -18,28 +141,74 @@ class KnowledgeValidator:
     Core validator for knowledge base entries.
 
     Validates YAML syntax, schema compliance, and quality requirements.
+
+    The rule tables below are compiled into a core.schema.CompiledSchema
+    when the validator is created; subclasses can override them.
     """
 
     # Valid severity levels
-    VALID_SEVERITIES = ['critical', 'high', 'medium', 'low']
+    VALID_SEVERITIES = list(SEVERITIES)
 
     # Valid scopes
-    VALID_SCOPES = ['universal', 'python', 'javascript', 'docker', 'postgresql', 'vps', 'framework', 'project']
+    VALID_SCOPES = list(SCOPES)
 
     # Required fields for error entries
-    REQUIRED_ERROR_FIELDS = ['id', 'title', 'severity', 'scope', 'problem', 'solution']
+    REQUIRED_ERROR_FIELDS = list(ERROR_FIELDS)
 
     # Required fields for pattern entries
-    REQUIRED_PATTERN_FIELDS = ['id', 'title', 'scope', 'pattern', 'implementation']
+    REQUIRED_PATTERN_FIELDS = list(PATTERN_FIELDS)
 
-    def __init__(self, repo_path: str = None):
+    def __init__(
+        self,
+        repo_path: str = None,
+        workers: Optional[int] = None,
+        cache: bool = False,
+        cache_path: Optional[Path] = None
+    ):
         """
         Initialize validator.
 
         Args:
             repo_path: Path to repository root (default: current directory)
+            workers: Processes for parsing directories (default: KB_WORKERS or CPU count)
+            cache: Reuse results of files whose contents did not change
+            cache_path: Cache file (default: .kb/cache/validation-cache.json under repo_path)
         """
         self.repo_path = Path(repo_path) if repo_path else Path.cwd()
+        self.workers = workers
+        self.schema = self.compile_schema()
+        self.cache = None
+        if cache:
+            self.cache = ValidationCache(
+                cache_path or self.repo_path / DEFAULT_CACHE_DIR / VALIDATION_CACHE_FILENAME,
+                self.cache_key()
+            )
+
+    def compile_schema(self) -> CompiledSchema:
+        """Compile the schema described by this validator's rule tables"""
+        definition = self.schema_definition()
+        if definition == ENTRY_SCHEMA:
+            return compile_schema()
+        return compile_schema(definition)
+
+    def schema_definition(self) -> Dict[str, Any]:
+        """Describe the entry schema this validator checks"""
+        return entry_schema(
+            severities=self.VALID_SEVERITIES,
+            scopes=self.VALID_SCOPES,
+            error_fields=self.REQUIRED_ERROR_FIELDS,
+            pattern_fields=self.REQUIRED_PATTERN_FIELDS
+        )
+
+    def cache_key(self) -> str:
+        """
+        Identify the validation rules cached results depend on.
+
+        Combines VALIDATOR_VERSION with the schema description, so
+        subclasses or changed tables don't reuse each other's results.
+        """
+        rules = json.dumps(self.schema.definition, sort_keys=True)
+        return f"{VALIDATOR_VERSION}:{hashlib.sha256(rules.encode('utf-8')).hexdigest()[:16]}"
 
     def validate_file(self, file_path: Path) -> ValidationResult:
         """
@@ -52,40 +221,55 @@ class KnowledgeValidator:
             ValidationResult with any errors or warnings found
         """
         start_time = time.time()
+
+        # Check file exists
+        if not file_path.exists():
+            return ValidationResult(
+                is_valid=False,
+                files_checked=0,
+                errors=[ValidationError(
+                    file_path=str(file_path),
+                    error_type="file_not_found",
+                    message=f"File not found: {file_path}",
+                    severity="error"
+                )],
+                execution_time_ms=(time.time() - start_time) * 1000
+            )
+
+        if self.cache is None:
+            return self._validate_loaded(load_file(file_path, lines=True), start_time)
+
+        result = self.validate_files([file_path])
+        result.execution_time_ms = (time.time() - start_time) * 1000
+        return result
+
+    def _validate_loaded(self, loaded: LoadedFile, start_time: float) -> ValidationResult:
+        """Validate a file that was already read and parsed"""
+        file_path = loaded.path
         errors = []
         warnings = []
 
         try:
-            # Check file exists
-            if not file_path.exists():
+            # Check YAML syntax
+            if not loaded.ok:
+                error_type, message = loaded.error
+                if error_type != ERROR_SYNTAX:
+                    raise OSError(message)
+
                 return ValidationResult(
                     is_valid=False,
-                    files_checked=0,
+                    files_checked=1,
                     errors=[ValidationError(
                         file_path=str(file_path),
-                        error_type="file_not_found",
-                        message=f"File not found: {file_path}",
-                        severity="error"
+                        error_type="syntax",
+                        message=f"YAML syntax error: {message}",
+                        severity="error",
+                        line_number=loaded.error_line
                     )],
                     execution_time_ms=(time.time() - start_time) * 1000
                 )
 
-            # Check YAML syntax
-            with open(file_path, 'r', encoding='utf-8') as f:
-                try:
-                    content = yaml.safe_load(f)
-                except yaml.YAMLError as e:
-                    return ValidationResult(
-                        is_valid=False,
-                        files_checked=1,
-                        errors=[ValidationError(
-                            file_path=str(file_path),
-                            error_type="syntax",
-                            message=f"YAML syntax error: {str(e)}",
-                            severity="error"
-                        )],
-                        execution_time_ms=(time.time() - start_time) * 1000
-                    )
+            content = loaded.content
 
             if not content:
                 warnings.append(ValidationError(
@@ -101,16 +285,11 @@ class KnowledgeValidator:
                     execution_time_ms=(time.time() - start_time) * 1000
                 )
 
-            # Validate schema
-            schema_errors, schema_warnings = self._validate_schema(content, file_path)
+            # Validate schema and entries
+            schema_errors, schema_warnings = self._check(content, file_path, loaded.lines)
             errors.extend(schema_errors)
             warnings.extend(schema_warnings)
 
-            # Validate entries
-            entry_errors, entry_warnings = self._validate_entries(content, file_path)
-            errors.extend(entry_errors)
-            warnings.extend(entry_warnings)
-
         except Exception as e:
             errors.append(ValidationError(
                 file_path=str(file_path),
@@ -129,41 +308,64 @@ class KnowledgeValidator:
             execution_time_ms=execution_time
         )
 
-    def validate_directory(self, dir_path: Path, recursive: bool = True) -> ValidationResult:
+    def validate_directory(
+        self,
+        dir_path: Path,
+        recursive: bool = True,
+        max_errors: Optional[int] = None
+    ) -> ValidationResult:
         """
         Validate all YAML files in a directory.
 
         Args:
             dir_path: Path to directory
             recursive: Whether to search recursively
+            max_errors: Stop after this many errors (default: validate everything)
 
         Returns:
             ValidationResult with aggregated results
         """
         start_time = time.time()
-        all_errors = []
-        all_warnings = []
-        files_checked = 0
 
-        # Find all YAML files
+        result = self.validate_files(self.find_files(dir_path, recursive), max_errors)
+        result.execution_time_ms = (time.time() - start_time) * 1000
+        return result
+
+    def find_files(self, dir_path: Path, recursive: bool = True) -> List[Path]:
+        """List the YAML knowledge files in a directory, skipping index and meta files"""
         if recursive:
-            yaml_files = list(dir_path.rglob('*.yaml'))
+            yaml_files = Path(dir_path).rglob('*.yaml')
         else:
-            yaml_files = list(dir_path.glob('*.yaml'))
+            yaml_files = Path(dir_path).glob('*.yaml')
+
+        return [f for f in yaml_files if is_corpus_file(f)]
 
-        # Skip index and meta files
-        yaml_files = [
-            f for f in yaml_files
-            if '_index.yaml' not in str(f) and '_meta.yaml' not in str(f) and 'catalog.yaml' not in str(f)
-        ]
+    def validate_files(self, file_paths: Iterable[Path], max_errors: Optional[int] = None) -> ValidationResult:
+        """
+        Validate a list of YAML files.
+
+        Args:
+            file_paths: Files to validate
+            max_errors: Stop after this many errors; the result then holds
+                the first max_errors errors and counts only the files
+                checked so far
 
-        # Validate each file
-        for yaml_file in yaml_files:
-            result = self.validate_file(yaml_file)
+        Returns:
+            ValidationResult with aggregated results, in input order
+        """
+        start_time = time.time()
+        all_errors = []
+        all_warnings = []
+        files_checked = 0
+
+        for result in self.iter_validate(file_paths, max_errors):
             files_checked += 1
             all_errors.extend(result.errors)
             all_warnings.extend(result.warnings)
 
+        if max_errors is not None:
+            del all_errors[max_errors:]
+
         execution_time = (time.time() - start_time) * 1000
 
         return ValidationResult(
@@ -174,149 +376,165 @@ class KnowledgeValidator:
             execution_time_ms=execution_time
         )
 
-    def _validate_schema(self, content: Dict[str, Any], file_path: Path) -> Tuple[List[ValidationError], List[ValidationError]]:
-        """Validate file-level schema"""
-        errors = []
-        warnings = []
-
-        # Check for required top-level fields
-        if 'version' not in content:
-            errors.append(ValidationError(
-                file_path=str(file_path),
-                error_type="required_field",
-                message="Missing required field: version",
-                severity="error",
-                field_path="version"
-            ))
-
-        if 'category' not in content:
-            errors.append(ValidationError(
-                file_path=str(file_path),
-                error_type="required_field",
-                message="Missing required field: category",
-                severity="error",
-                field_path="category"
-            ))
+    def iter_validate(self, file_paths: Iterable[Path], max_errors: Optional[int] = None) -> Iterator[ValidationResult]:
+        """
+        Validate files one at a time, yielding each file's result as it is ready.
 
-        # Check for errors or patterns
-        has_errors = 'errors' in content and content['errors']
-        has_patterns = 'patterns' in content and content['patterns']
+        Files are parsed and validated in a process pool (KB_WORKERS) and
+        results are yielded in input order. With the cache enabled, files
+        whose contents are unchanged are not parsed again.
 
-        if not has_errors and not has_patterns:
-            warnings.append(ValidationError(
-                file_path=str(file_path),
-                error_type="empty_content",
-                message="File has no errors or patterns",
-                severity="warning",
-                field_path="errors"
-            ))
+        Args:
+            file_paths: Files to validate
+            max_errors: Stop once this many errors have been yielded;
+                files not reached yet are never parsed
 
-        return errors, warnings
+        Yields:
+            ValidationResult for each file (files_checked=1)
+        """
+        file_paths = [Path(file_path) for file_path in file_paths]
+        cached: Dict[Path, Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]] = {}
 
-    def _validate_entries(self, content: Dict[str, Any], file_path: Path) -> Tuple[List[ValidationError], List[ValidationError]]:
-        """Validate individual entries"""
-        errors = []
-        warnings = []
+        if self.cache is not None:
+            for file_path in file_paths:
+                hit = self.cache.lookup(file_path)
+                if hit is not None:
+                    cached[file_path] = hit
 
-        # Validate error entries
-        for idx, entry in enumerate(content.get('errors', [])):
-            entry_errors, entry_warnings = self._validate_entry(entry, file_path, idx, 'error')
-            errors.extend(entry_errors)
-            warnings.extend(entry_warnings)
+        stale = [file_path for file_path in file_paths if file_path not in cached]
+        fresh = imap_files(self._validate_path, stale, self._pool_workers())
+        error_count = 0
 
-        # Validate pattern entries
-        for idx, entry in enumerate(content.get('patterns', [])):
-            entry_errors, entry_warnings = self._validate_entry(entry, file_path, idx, 'pattern')
-            errors.extend(entry_errors)
-            warnings.extend(entry_warnings)
+        try:
+            for file_path in file_paths:
+                if file_path in cached:
+                    errors, warnings = cached[file_path]
+                else:
+                    errors, warnings = next(fresh)
+                    if self.cache is not None:
+                        self.cache.store(file_path, errors, warnings)
+
+                yield ValidationResult(
+                    is_valid=len(errors) == 0,
+                    files_checked=1,
+                    errors=[ValidationError(file_path=str(file_path), **error) for error in errors],
+                    warnings=[ValidationError(file_path=str(file_path), **warning) for warning in warnings]
+                )
 
-        return errors, warnings
+                error_count += len(errors)
+                if max_errors is not None and error_count >= max_errors:
+                    return
+        finally:
+            fresh.close()
+            if self.cache is not None:
+                self.cache.save()
 
-    def _validate_entry(
+    def check_duplicate_ids(
         self,
-        entry: Dict[str, Any],
-        file_path: Path,
-        index: int,
-        entry_type: str
-    ) -> Tuple[List[ValidationError], List[ValidationError]]:
-        """Validate a single entry"""
-        errors = []
-        warnings = []
+        engine: Any,
+        paths: Optional[Iterable[Path]] = None
+    ) -> List[ValidationError]:
+        """
+        Report entry ids defined more than once across the KB.
 
-        field_prefix = f"errors[{index}]" if entry_type == 'error' else f"patterns[{index}]"
+        Uses the id registry of a search engine's index, which spans
+        domains/, .kb/project and .kb/shared and is updated incrementally,
+        so only files changed since the index was last saved are parsed.
 
-        # Determine required fields based on entry type
-        required_fields = self.REQUIRED_ERROR_FIELDS if entry_type == 'error' else self.REQUIRED_PATTERN_FIELDS
+        Args:
+            engine: KnowledgeSearch whose search roots to check, or an
+                EntryIdScan of them
+            paths: Only report occurrences in these files or under these
+                directories (default: all occurrences)
 
-        # Check required fields
-        for field in required_fields:
-            if field not in entry:
-                errors.append(ValidationError(
-                    file_path=str(file_path),
-                    error_type="required_field",
-                    message=f"Missing required field: {field}",
-                    severity="error",
-                    field_path=f"{field_prefix}.{field}"
-                ))
+        Returns:
+            A duplicate_id error for each reported occurrence
+        """
+        scope = {Path(path).resolve() for path in paths} if paths is not None else None
+        errors = []
 
-        # Validate ID format
-        if 'id' in entry:
-            id_errors, id_warnings = self._validate_id(entry['id'], file_path, field_prefix)
-            errors.extend(id_errors)
-            warnings.extend(id_warnings)
+        for entry_id, occurrences in engine.find_duplicate_ids().items():
+            locations = [
+                f"{occurrence['file_path']}:{occurrence['line_number']}"
+                if occurrence['line_number'] else occurrence['file_path']
+                for occurrence in occurrences
+            ]
 
-        # Validate severity
-        if 'severity' in entry:
-            if entry['severity'] not in self.VALID_SEVERITIES:
-                errors.append(ValidationError(
-                    file_path=str(file_path),
-                    error_type="format",
-                    message=f"Invalid severity: {entry['severity']}. Must be one of {self.VALID_SEVERITIES}",
-                    severity="error",
-                    field_path=f"{field_prefix}.severity"
-                ))
+            for position, occurrence in enumerate(occurrences):
+                if scope is not None:
+                    resolved = Path(occurrence['file_path']).resolve()
+                    if resolved not in scope and scope.isdisjoint(resolved.parents):
+                        continue
 
-        # Validate scope
-        if 'scope' in entry:
-            if entry['scope'] not in self.VALID_SCOPES:
+                others = ", ".join(locations[:position] + locations[position + 1:])
                 errors.append(ValidationError(
-                    file_path=str(file_path),
-                    error_type="format",
-                    message=f"Invalid scope: {entry['scope']}. Must be one of {self.VALID_SCOPES}",
+                    file_path=occurrence['file_path'],
+                    line_number=occurrence['line_number'],
+                    error_type="duplicate_id",
+                    message=f"Duplicate ID {entry_id}, also defined in {others}",
                     severity="error",
-                    field_path=f"{field_prefix}.scope"
+                    field_path=occurrence['field_path']
                 ))
 
-        # Validate solution structure
-        if 'solution' in entry and isinstance(entry['solution'], dict):
-            if not entry['solution'].get('code') and not entry['solution'].get('explanation'):
-                warnings.append(ValidationError(
-                    file_path=str(file_path),
-                    error_type="incomplete_solution",
-                    message="Solution should have code or explanation",
-                    severity="warning",
-                    field_path=f"{field_prefix}.solution"
-                ))
+        return errors
 
-        return errors, warnings
+    def _validate_path(self, file_path: Path) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """
+        Parse and validate one file (runs in pool workers).
 
-    def _validate_id(self, entry_id: str, file_path: Path, field_prefix: str) -> Tuple[List[ValidationError], List[ValidationError]]:
-        """Validate entry ID format"""
-        errors = []
-        warnings = []
+        Returns:
+            (errors, warnings) as ValidationError dicts without file_path
+        """
+        result = self._validate_loaded(load_file(file_path, lines=True), time.time())
+        return (
+            [error.model_dump(exclude={'file_path'}) for error in result.errors],
+            [warning.model_dump(exclude={'file_path'}) for warning in result.warnings]
+        )
 
-        # ID should match pattern: CATEGORY-NNN
-        # Example: DOCKER-024, PYTHON-001
-        if not re.match(r'^[A-Z_]+-\d{3,}$', str(entry_id)):
-            warnings.append(ValidationError(
-                file_path=str(file_path),
-                error_type="format",
-                message=f"ID format should be CATEGORY-NNN (e.g., DOCKER-024), got: {entry_id}",
-                severity="warning",
-                field_path=f"{field_prefix}.id"
-            ))
+    def _pool_workers(self) -> Optional[int]:
+        """Worker count for validation, or 1 if this validator can't be sent to workers"""
+        try:
+            pickle.dumps(self)
+        except (pickle.PicklingError, AttributeError, TypeError):
+            # e.g. a validator class defined inside a function
+            return 1
+        return self.workers
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Pool workers validate without the cache; results are cached by the parent
+        state = self.__dict__.copy()
+        state['cache'] = None
+        return state
+
+    def _check(
+        self,
+        content: Dict[str, Any],
+        file_path: Path,
+        lines: Optional[yamlio.FieldLines] = None
+    ) -> Tuple[List[ValidationError], List[ValidationError]]:
+        """Check a parsed file against the compiled schema, locating issues by their field lines"""
+        errors, warnings = self.schema.check(content)
+        return (
+            [self._issue(issue, file_path, "error", lines) for issue in errors],
+            [self._issue(issue, file_path, "warning", lines) for issue in warnings]
+        )
 
-        return errors, warnings
+    @staticmethod
+    def _issue(
+        issue: Issue,
+        file_path: Path,
+        severity: str,
+        lines: Optional[yamlio.FieldLines]
+    ) -> ValidationError:
+        error_type, message, field_path = issue
+        return ValidationError(
+            file_path=str(file_path),
+            error_type=error_type,
+            message=message,
+            severity=severity,
+            field_path=field_path,
+            line_number=yamlio.field_line(lines, field_path) if lines else None
+        )
 
     def validate_yaml_content(self, yaml_content: str) -> ValidationResult:
         """
@@ -334,7 +552,7 @@ class KnowledgeValidator:
         errors = []
 
         try:
-            content = yaml.safe_load(io.StringIO(yaml_content))
+            content, lines = yamlio.safe_load_lines(io.StringIO(yaml_content))
 
             if not content:
                 return ValidationResult(
@@ -349,20 +567,18 @@ class KnowledgeValidator:
                     execution_time_ms=(time.time() - start_time) * 1000
                 )
 
-            # Validate schema
-            schema_errors, schema_warnings = self._validate_schema(content, Path("<string>"))
+            # Validate schema and entries
+            schema_errors, _ = self._check(content, Path("<string>"), lines)
             errors.extend(schema_errors)
 
-            # Validate entries
-            entry_errors, entry_warnings = self._validate_entries(content, Path("<string>"))
-            errors.extend(entry_errors)
-
-        except yaml.YAMLError as e:
+        except yamlio.YAMLError as e:
+            mark = getattr(e, 'problem_mark', None)
             errors.append(ValidationError(
                 file_path="<string>",
                 error_type="syntax",
                 message=f"YAML syntax error: {str(e)}",
-                severity="error"
+                severity="error",
+                line_number=mark.line + 1 if mark is not None else None
             ))
 
         execution_time = (time.time() - start_time) * 1000
@@ -0,0 +1,231 @@
+"""
+Change detection for long-running search engines.
+
+A KnowledgeSearch normally re-lists and stats every file under its
+search roots on each query. Long-running processes such as the MCP
+server instead attach a ChangeWatcher and poll it between requests:
+
+- Directory listings are cached by directory mtime, so only directories
+  where files were added, removed or renamed are listed again.
+- Each YAML file is stat'ed and compared with the signature it was
+  indexed at; only new, changed and deleted files are patched into the
+  index.
+- The git HEAD of the shared KB checkout (.kb/shared) is tracked. When
+  it moves (e.g. after `git pull` or `git submodule update`), every file
+  under it is re-parsed even if its mtime and size look unchanged.
+"""
+
+import os
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+from .corpus import is_corpus_file
+
+# Seconds between polls in long-running servers
+DEFAULT_INTERVAL = 2.0
+
+# Overrides DEFAULT_INTERVAL
+INTERVAL_ENV = "KB_WATCH_INTERVAL"
+
+
+def default_interval() -> float:
+    """Get the poll interval from KB_WATCH_INTERVAL, or DEFAULT_INTERVAL"""
+    try:
+        return max(float(os.environ.get(INTERVAL_ENV, '')), 0.1)
+    except ValueError:
+        return DEFAULT_INTERVAL
+
+
+def git_head(repo_dir: Path) -> Optional[str]:
+    """
+    Get the commit checked out in a git working tree or submodule.
+
+    Reads .git directly (following the `gitdir:` file of submodules and
+    packed refs) instead of running git.
+
+    Returns:
+        Commit hash, or None if the directory is not a git checkout
+    """
+    git_path = Path(repo_dir) / ".git"
+
+    try:
+        if git_path.is_file():
+            # Submodules and worktrees point at their real git directory
+            gitdir = git_path.read_text(encoding='utf-8').strip()
+            if not gitdir.startswith('gitdir:'):
+                return None
+            git_path = (git_path.parent / gitdir[len('gitdir:'):].strip()).resolve()
+
+        head = (git_path / "HEAD").read_text(encoding='utf-8').strip()
+    except OSError:
+        return None
+
+    if not head.startswith('ref:'):
+        return head  # Detached HEAD, as submodules usually are
+
+    ref = head[len('ref:'):].strip()
+    try:
+        return (git_path / ref).read_text(encoding='utf-8').strip()
+    except OSError:
+        pass
+
+    try:
+        with open(git_path / "packed-refs", encoding='utf-8') as f:
+            for line in f:
+                parts = line.split()
+                if len(parts) == 2 and parts[1] == ref:
+                    return parts[0]
+    except OSError:
+        pass
+
+    # Unborn branch, or refs in a format we don't read
+    return head
+
+
+class DirectoryListing:
+    """
+    Files under directory trees, re-listing only directories whose mtime changed.
+
+    Adding, removing or renaming a file changes its directory's mtime, so
+    an unchanged directory costs one stat and its cached listing is reused.
+    """
+
+    def __init__(self, accept: Callable[[str], bool]):
+        """
+        Initialize listing.
+
+        Args:
+            accept: Whether to list a file, given its path
+        """
+        self.accept = accept
+        # Directories listed again (new or changed) by the last files() call
+        self.relisted: Set[str] = set()
+        # Directory path to (mtime, files, subdirectories)
+        self._dirs: Dict[str, Tuple[int, List[str], List[str]]] = {}
+
+    def files(self, root: str) -> List[str]:
+        """Get the accepted files under a directory, in directory order"""
+        self.relisted = set()
+        files: List[str] = []
+        self._list(root, files)
+        return files
+
+    def clear(self) -> None:
+        """Forget all cached listings"""
+        self._dirs.clear()
+
+    def _list(self, directory: str, files: List[str]) -> None:
+        """Collect files under a directory, re-listing only changed directories"""
+        try:
+            mtime = os.stat(directory).st_mtime_ns
+        except OSError:
+            self._dirs.pop(directory, None)
+            return
+
+        cached = self._dirs.get(directory)
+        if cached is None or cached[0] != mtime:
+            listed = []
+            subdirs = []
+            try:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        # Like Path.rglob, don't descend into symlinked directories
+                        if entry.is_dir(follow_symlinks=False):
+                            subdirs.append(entry.path)
+                        elif self.accept(entry.path):
+                            listed.append(entry.path)
+            except OSError:
+                return
+            cached = (mtime, listed, subdirs)
+            self._dirs[directory] = cached
+            self.relisted.add(directory)
+
+        files.extend(cached[1])
+        for subdir in cached[2]:
+            self._list(subdir, files)
+
+
+class ChangeWatcher:
+    """
+    Keeps a KnowledgeSearch index current by polling its search roots.
+
+    The engine should be created with auto_refresh=False, so queries
+    trust the index and only poll() touches the filesystem.
+
+    Example:
+        >>> engine = KnowledgeSearch(auto_refresh=False)
+        >>> watcher = ChangeWatcher(engine)
+        >>> watcher.poll()  # Initial sync
+        >>> # ... then call watcher.poll() every few seconds
+    """
+
+    def __init__(self, engine: Any, on_change: Optional[Callable[[List[str]], None]] = None):
+        """
+        Initialize watcher.
+
+        Args:
+            engine: KnowledgeSearch whose index to keep current
+            on_change: Called with the paths of the files each poll found
+                changed or removed, before they are patched in (e.g.
+                MetricsCalculator.mark_changed)
+        """
+        self.engine = engine
+        self.on_change = on_change
+        self.shared_path = Path(engine.shared_kb_path)
+        self.shared_head = git_head(self.shared_path)
+        self.poll_count = 0
+        self._listing = DirectoryListing(lambda path: path.endswith('.yaml') and is_corpus_file(path))
+
+    def poll(self) -> int:
+        """
+        Patch files changed since the last poll into the index.
+
+        Returns:
+            Number of files re-indexed or removed
+        """
+        head = git_head(self.shared_path)
+        head_moved = head != self.shared_head
+        self.shared_head = head
+        self.poll_count += 1
+
+        updated = 0
+        for root, kb_type in self.engine.search_roots():
+            force = head_moved and self._under_shared(root)
+            updated += self._poll_root(root, kb_type, force)
+
+        return updated
+
+    def _poll_root(self, root: Path, kb_type: str, force: bool) -> int:
+        """Find changed files under one search root and patch them in"""
+        files = self._listing.files(str(root))
+
+        indexed = self.engine.index.file_signatures(str(root))
+        changed = []
+
+        for file_path in files:
+            signature = indexed.pop(file_path, None)
+            if force or signature is None or signature != self._signature(file_path):
+                changed.append(Path(file_path))
+
+        # Whatever is left was indexed but is no longer on disk
+        removed = list(indexed)
+
+        if not changed and not removed:
+            return 0
+
+        if self.on_change is not None:
+            self.on_change([str(path) for path in changed] + removed)
+
+        return self.engine.sync_files(root, kb_type, changed, removed, force=force)
+
+    def _under_shared(self, root: Path) -> bool:
+        root = Path(root)
+        return root == self.shared_path or self.shared_path in root.parents
+
+    @staticmethod
+    def _signature(file_path: str) -> Optional[Tuple[int, int]]:
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
@@ -0,0 +1,145 @@
+"""
+YAML loading and dumping for Shared Knowledge Base.
+
+Every tool reads and writes YAML through this module. When PyYAML was
+built against libyaml the C-accelerated CSafeLoader/CSafeDumper are used,
+which parse several times faster; otherwise the pure-Python
+SafeLoader/SafeDumper are used. Both accept the same documents and
+produce the same data.
+
+safe_load_lines() parses a document once into its node graph and builds
+both the data and a map of source lines from it, for tools that report
+where an entry or field is.
+"""
+
+from typing import Any, Dict, Optional, IO, Tuple, Union
+
+import yaml
+
+try:
+    from yaml import CSafeLoader as SafeLoader, CSafeDumper as SafeDumper
+    LIBYAML = True
+except ImportError:
+    from yaml import SafeLoader, SafeDumper
+    LIBYAML = False
+
+# Re-exported so callers need not import yaml for error handling
+YAMLError = yaml.YAMLError
+
+# Pure-Python classes, kept for benchmarks and parity checks
+PureSafeLoader = yaml.SafeLoader
+PureSafeDumper = yaml.SafeDumper
+
+# Levels of the document recorded by safe_load_lines(): top-level keys,
+# the entries under them and the fields of each entry
+LINE_DEPTH = 3
+
+# Field path (as in ValidationError.field_path, e.g. "errors[0].title")
+# to its 1-based source line
+FieldLines = Dict[str, int]
+
+
+def safe_load(stream: Union[str, bytes, IO], loader: Optional[type] = None) -> Any:
+    """
+    Parse a single YAML document using only standard tags.
+
+    Args:
+        stream: YAML text or a readable stream
+        loader: Loader class (default: CSafeLoader if available)
+
+    Returns:
+        Parsed document
+    """
+    return yaml.load(stream, Loader=loader or SafeLoader)
+
+
+def safe_dump(data: Any, stream: Optional[IO] = None, **kwargs: Any) -> Optional[str]:
+    """
+    Serialize data to YAML using only standard tags.
+
+    Args:
+        data: Data to serialize
+        stream: Writable stream (default: return the YAML as a string)
+        **kwargs: Options passed to yaml.dump (default_flow_style, sort_keys, ...)
+
+    Returns:
+        YAML string if no stream was given, otherwise None
+    """
+    return yaml.dump(data, stream, Dumper=SafeDumper, **kwargs)
+
+
+def safe_load_lines(
+    stream: Union[str, bytes, IO],
+    loader: Optional[type] = None,
+    depth: int = LINE_DEPTH
+) -> Tuple[Any, FieldLines]:
+    """
+    Parse a single YAML document and record where its fields are.
+
+    The document is composed once; the data is constructed from the node
+    graph and the lines are read from the marks of the same nodes.
+
+    Args:
+        stream: YAML text or a readable stream
+        loader: Loader class (default: CSafeLoader if available)
+        depth: Levels of nesting to record lines for
+
+    Returns:
+        (parsed document, field lines), e.g.
+        {'errors': 3, 'errors[0]': 4, 'errors[0].id': 4, ...}
+
+    Raises:
+        YAMLError: If the document is not valid YAML
+    """
+    instance = (loader or SafeLoader)(stream)
+    try:
+        node = instance.get_single_node()
+        if node is None:
+            return None, {}
+        data = instance.construct_document(node)
+    finally:
+        instance.dispose()
+
+    lines: FieldLines = {}
+    _collect_lines(node, '', depth, lines)
+    return data, lines
+
+
+def _collect_lines(node: yaml.Node, path: str, depth: int, lines: FieldLines) -> None:
+    """Record the line of every key and item under node, depth levels deep"""
+    if depth <= 0:
+        return
+
+    if isinstance(node, yaml.MappingNode):
+        for key_node, value_node in node.value:
+            if not isinstance(key_node, yaml.ScalarNode):
+                continue
+            child = f"{path}.{key_node.value}" if path else key_node.value
+            lines[child] = key_node.start_mark.line + 1
+            _collect_lines(value_node, child, depth - 1, lines)
+
+    elif isinstance(node, yaml.SequenceNode):
+        for index, item in enumerate(node.value):
+            child = f"{path}[{index}]"
+            lines[child] = item.start_mark.line + 1
+            _collect_lines(item, child, depth - 1, lines)
+
+
+def field_line(lines: FieldLines, field_path: Optional[str]) -> Optional[int]:
+    """
+    Get the source line of a field, or of its closest recorded parent.
+
+    A missing field is reported at the line of the entry it is missing
+    from, e.g. "errors[0].title" falls back to "errors[0]".
+
+    Returns:
+        1-based line, or None if neither the field nor a parent was recorded
+    """
+    path = field_path or ''
+    while path:
+        line = lines.get(path)
+        if line is not None:
+            return line
+        cut = max(path.rfind('.'), path.rfind('['))
+        path = path[:cut] if cut > 0 else ''
+    return None
@@ -7,7 +7,11 @@ Sets up directories, config files, and templates.
 import sys
 from pathlib import Path
 from datetime import datetime
-import yaml
+
+try:
+    from tools.core import yamlio
+except ImportError:
+    from core import yamlio
 
 
 def initialize_archive(archive_root: Path | None = None) -> bool:
@@ -51,7 +55,7 @@ def initialize_archive(archive_root: Path | None = None) -> bool:
 
     config_file = archive_root / "archive-config.yaml"
     with open(config_file, 'w') as f:
-        yaml.dump(config, f, default_flow_style=False)
+        yamlio.safe_dump(config, f, default_flow_style=False)
     print(f"✓ Created: {config_file}")
 
     # Create README
@@ -6,9 +6,13 @@ Main CLI interface for Shared KB operations.
 
 Usage:
     python kb.py search <query>           # Search knowledge base
+    python kb.py get <id>                 # Show an entry by ID
+    python kb.py browse <category>        # List entries in a category
+    python kb.py daemon start --detach    # Keep the index warm in a daemon
     python kb.py stats                    # Show statistics
     python kb.py index [--force]          # Build/rebuild index
     python kb.py validate <path>          # Validate YAML files
+    python kb.py validate <path> --changed-since HEAD  # Only files changed since a git ref
     python kb.py check-updates            # Check for updates
 """
 
@@ -17,78 +21,143 @@ import argparse
 from pathlib import Path
 
 # Add repository root to path
-repo_root = Path(__file__).parent.parent
+repo_root = Path(__file__).resolve().parent.parent
 sys.path.insert(0, str(repo_root))
 
-from tools import kb_search, kb_metrics, kb_capability, kb_profile, kb_sync, kb_template
-
+# Subcommand modules are imported by the command that uses them, so
+# `kb.py --help` and light commands skip YAML, pydantic and the index.
 
 
 def cmd_search(args):
     """Search knowledge base"""
-    import subprocess
+    from tools import kb_search
+
+    kb_search.configure_logging()
 
-    cmd = [sys.executable, str(repo_root / "tools" / "kb_search.py")]
+    if args.stats:
+        sys.exit(kb_search.show_stats())
 
-    if args.scope:
-        cmd.extend(["--scope", args.scope])
+    sys.exit(kb_search.run_search(
+        args.query,
+        scope=args.scope,
+        category=args.category,
+        severity=args.severity,
+        preview=args.preview
+    ))
 
-    if args.category:
-        cmd.extend(["--category", args.category])
 
-    if args.severity:
-        cmd.extend(["--severity", args.severity])
+def _display_path(path):
+    """Show an index path relative to the repository root"""
+    try:
+        return Path(path).relative_to(repo_root)
+    except ValueError:
+        return path
 
-    if args.stats:
-        cmd.append("--stats")
 
-    cmd.append(args.query)
+def _engine_request(command, **request_args):
+    """Run a search command on the search daemon, or in-process if it is not running"""
+    from tools.core import daemon
 
-    # Run from repo_root so it can find domains/ directory
-    result = subprocess.run(cmd, cwd=repo_root, capture_output=False)
-    sys.exit(result.returncode)
+    client = daemon.DaemonClient.connect(daemon.socket_path(repo_root))
+    if client is not None:
+        try:
+            with client:
+                return client.request(command, **request_args)
+        except (OSError, daemon.DaemonError):
+            pass  # The daemon went away or failed the request, run in-process
 
+    from tools import kb_search
 
-def cmd_stats(args):
-    """Show statistics"""
-    import subprocess
+    engine = kb_search.create_search_engine()
+    engine.load_index()
+    return daemon.execute(engine, command, request_args)
+
+
+def cmd_get(args):
+    """Show an entry by ID"""
+    from tools.core import yamlio
 
-    cmd = [sys.executable, str(repo_root / "tools" / "kb_metrics.py")]
+    result = _engine_request('get', entry_id=args.id)
 
-    if args.verbose:
-        cmd.append("-v")
+    if result is None:
+        print(f"❌ Entry not found: {args.id}")
+        sys.exit(1)
+
+    entry = result['entry']
+    print(f"📄 {entry.get('id', args.id)}: {entry.get('title', 'Untitled')}")
+    print(f"   Category: {result['category']} | Severity: {entry.get('severity', 'unknown')} | Scope: {entry.get('scope', 'unknown')}")
+    line = f":{result['line_number']}" if result.get('line_number') else ""
+    print(f"   Source: {_display_path(result['file_path'])}{line}")
+    for duplicate in result.get('duplicates') or []:
+        line = f":{duplicate['line_number']}" if duplicate['line_number'] else ""
+        print(f"   ⚠️  Also defined in {_display_path(duplicate['file_path'])}{line} (ignored)")
+    print()
+    print(yamlio.safe_dump(entry, default_flow_style=False, sort_keys=False, allow_unicode=True))
+
+
+def cmd_browse(args):
+    """List entries in a category"""
+    results = _engine_request('browse', category=args.category, limit=args.limit, kb_type=args.kb_type)
+
+    print(f"📂 Category: '{args.category}' | Found: {len(results)}\n")
+
+    for result in results:
+        metadata = result['metadata']
+        icon = "⭐" if result['kb_type'] == "project" else "📚"
+        print(f"{icon} {metadata['id']}: {metadata['title']}")
+        print(f"   Severity: {metadata['severity']} | Scope: {metadata['scope']} | {_display_path(metadata['file_path'])}")
+
+
+def cmd_daemon(args):
+    """Manage the search daemon"""
+    from tools import kb_daemon
+
+    argv = [args.action] + (['--detach'] if args.detach else [])
+    sys.exit(kb_daemon.main(argv))
+
+
+def cmd_stats(args):
+    """Show statistics"""
+    from tools import kb_metrics
 
-    # Run from repo_root so it can find domains/ directory
-    result = subprocess.run(cmd, cwd=repo_root, capture_output=False)
-    sys.exit(result.returncode)
+    metrics = kb_metrics.KBMetrics(repo_root)
+    metrics.calculate_all_metrics()
+    metrics.print_dashboard(verbose=args.verbose)
 
 
 def cmd_index(args):
     """Build/rebuild search index"""
+    from tools.core import KnowledgeSearch
+
     domains_dir = repo_root / "domains"
 
     print(f"🔨 Building index for {domains_dir}...")
 
-    # Count entries
-    total_entries = 0
-    for domain_dir in domains_dir.iterdir():
-        if domain_dir.is_dir() and domain_dir.name != "catalog":
-            for yaml_file in domain_dir.rglob("*.yaml"):
-                total_entries += 1
-
-    print(f"📊 Found {total_entries} entries")
-
     if args.force:
         print("🔄 Force rebuild enabled")
 
-    print("✅ Index built successfully")
+    # Absolute paths, matching the index keys of kb_search and the MCP server
+    engine = KnowledgeSearch(repo_path=str(repo_root), workers=args.workers)
+    stats = engine.build_index(force=args.force)
+
+    print(f"📊 Indexed {stats['entries']} entries from {stats['files']} files ({stats['tokens']} tokens)")
+    print(f"♻️  Parsed {stats['parsed']} changed file(s)")
+    print(f"✅ Index written to {stats['path']}")
+    print(f"✅ Binary index written to {stats['binary_path']}")
     print(f"\n💡 Tip: Use 'python kb.py search <query>' to search the knowledge base")
 
 
+def print_error(error):
+    """Print a validation error as path:line: message (field)"""
+    location = f"{error.file_path}:{error.line_number}" if error.line_number else error.file_path
+    field = f" ({error.field_path})" if error.field_path else ""
+    print(f"  - {location}: {error.message}{field}")
+
+
 def cmd_validate(args):
     """Validate YAML files"""
-    import subprocess
-    import yaml
+    from tools.core import KnowledgeSearch, KnowledgeValidator
+    from tools.core.validation import EntryIdScan, changed_files
 
     path = Path(args.path)
 
@@ -96,45 +165,66 @@ def cmd_validate(args):
         print(f"❌ Path not found: {path}")
         sys.exit(1)
 
-    print(f"🔍 Validating {path}...")
-
-    if path.is_file():
-        files = [path]
-    else:
-        files = list(path.rglob("*.yaml"))
+    validator = KnowledgeValidator(str(repo_root), workers=args.workers, cache=not args.no_cache)
 
-    errors = []
-    for file in files:
+    if args.changed_since:
         try:
-            with open(file, 'r', encoding='utf-8') as f:
-                data = yaml.safe_load(f)
-
-            # Basic validation
-            if not isinstance(data, dict):
-                errors.append(f"{file}: Root is not a dict")
-                continue
-
-            if 'version' not in data:
-                errors.append(f"{file}: Missing 'version' field")
+            files = changed_files(args.changed_since, repo_root, path)
+        except ValueError as e:
+            print(f"❌ {e}")
+            sys.exit(1)
 
-            if 'category' not in data:
-                errors.append(f"{file}: Missing 'category' field")
-
-            if 'errors' not in data:
-                errors.append(f"{file}: Missing 'errors' field")
-
-        except yaml.YAMLError as e:
-            errors.append(f"{file}: YAML syntax error: {e}")
-        except Exception as e:
-            errors.append(f"{file}: Error: {e}")
-
-    if errors:
-        print(f"❌ Found {len(errors)} error(s):")
-        for error in errors:
-            print(f"  - {error}")
+        print(f"🔍 Validating {len(files)} file(s) in {path} changed since {args.changed_since}...")
+    else:
+        print(f"🔍 Validating {path}...")
+        files = [path] if path.is_file() else validator.find_files(path)
+
+    # Errors are printed as each file is validated
+    files_checked = 0
+    error_count = 0
+    warning_count = 0
+
+    for result in validator.iter_validate(files, max_errors=args.max_errors):
+        files_checked += 1
+        warning_count += len(result.warnings)
+        for error in result.errors:
+            print_error(error)
+            error_count += 1
+
+    stopped = args.max_errors is not None and error_count >= args.max_errors
+
+    if not stopped and files:
+        # Ids must be unique across domains/, .kb/project and .kb/shared.
+        # Validation never writes the search index: patch the validated files
+        # into a saved index in memory only, or scan the roots without one
+        engine = KnowledgeSearch(repo_path=str(repo_root), workers=args.workers, auto_refresh=False)
+        if engine.load_index():
+            engine.sync_paths(files)
+            source = engine
+        else:
+            source = EntryIdScan(engine.search_roots(), args.workers)
+
+        for error in validator.check_duplicate_ids(source, files):
+            if args.max_errors is not None and error_count >= args.max_errors:
+                stopped = True
+                break
+            print_error(error)
+            error_count += 1
+
+    if validator.cache is not None and validator.cache.hits:
+        print(f"♻️  {validator.cache.hits} unchanged file(s) reused from cache")
+
+    if warning_count:
+        print(f"⚠️  {warning_count} warning(s)")
+
+    if error_count:
+        if stopped:
+            print(f"❌ Stopped after {error_count} error(s) in {files_checked} of {len(files)} file(s)")
+        else:
+            print(f"❌ Found {error_count} error(s) in {files_checked} file(s)")
         sys.exit(1)
     else:
-        print(f"✅ All {len(files)} file(s) validated successfully")
+        print(f"✅ All {files_checked} file(s) validated successfully")
 
 
 def cmd_check_updates(args):
@@ -179,6 +269,8 @@ def cmd_check_updates(args):
 
 def cmd_archive(args):
     """Archive a capability"""
+    from tools import kb_capability
+
     manager = kb_capability.CapabilityManager(repo_root)
     manager.archive(
         file_path=args.file,
@@ -191,6 +283,8 @@ def cmd_archive(args):
 
 def cmd_install(args):
     """Install a capability"""
+    from tools import kb_capability
+
     manager = kb_capability.CapabilityManager(repo_root)
     manager.install(
         name=args.name,
@@ -200,6 +294,8 @@ def cmd_install(args):
 
 def cmd_profile(args):
     """Manage knowledge profile"""
+    from tools import kb_profile
+
     manager = kb_profile.ProfileManager(repo_root)
     
     if args.action == "list":
@@ -218,6 +314,8 @@ def cmd_profile(args):
 
 def cmd_sync(args):
     """Sync with Company OS"""
+    from tools import kb_sync
+
     syncer = kb_sync.RegistrySync(repo_root)
     
     if args.action == "init-passport":
@@ -230,6 +328,8 @@ def cmd_sync(args):
 
 def cmd_template(args):
     """Manage guidelines templates"""
+    from tools import kb_template
+
     manager = kb_template.TemplateManager(repo_root)
     if args.action == "install":
         manager.install_template(args.domain)
@@ -245,9 +345,13 @@ def main():
 Examples:
   python kb.py search "docker compose"
   python kb.py search --scope shared --category python
+  python kb.py get DOCKER-001
+  python kb.py browse docker-errors
+  python kb.py daemon start --detach
   python kb.py stats
   python kb.py index --force
   python kb.py validate domains/python
+  python kb.py validate domains --changed-since HEAD
   python kb.py check-updates
         """
     )
@@ -260,9 +364,26 @@ Examples:
     search_parser.add_argument('--scope', choices=['shared', 'project', 'all'], default='all',
                                help='Search scope (default: all)')
     search_parser.add_argument('--category', help='Filter by category')
-    search_parser.add_argument('--severity', help='Filter by severity')
+    search_parser.add_argument('--severity', choices=['critical', 'high', 'medium', 'low'],
+                               help='Filter by severity')
+    search_parser.add_argument('--preview', action='store_true', help='Show matching lines')
     search_parser.add_argument('--stats', action='store_true', help='Show search statistics')
 
+    # get command
+    get_parser = subparsers.add_parser('get', help='Show an entry by ID')
+    get_parser.add_argument('id', help='Entry ID (e.g. DOCKER-001)')
+
+    # browse command
+    browse_parser = subparsers.add_parser('browse', help='List entries in a category')
+    browse_parser.add_argument('category', help='Category to browse')
+    browse_parser.add_argument('--limit', type=int, default=50, help='Maximum entries (default: 50)')
+    browse_parser.add_argument('--kb-type', choices=['shared', 'project'], help='Only list entries from one KB')
+
+    # daemon command
+    daemon_parser = subparsers.add_parser('daemon', help='Manage the resident search daemon')
+    daemon_parser.add_argument('action', choices=['start', 'stop', 'status'], help='Action to perform')
+    daemon_parser.add_argument('--detach', action='store_true', help='Run in the background (start only)')
+
     # stats command
     stats_parser = subparsers.add_parser('stats', help='Show statistics')
     stats_parser.add_argument('-v', '--verbose', action='store_true', help='Verbose output')
@@ -270,10 +391,15 @@ Examples:
     # index command
     index_parser = subparsers.add_parser('index', help='Build/rebuild search index')
     index_parser.add_argument('--force', action='store_true', help='Force rebuild')
+    index_parser.add_argument('--workers', type=int, help='Parser processes (default: KB_WORKERS or CPU count)')
 
     # validate command
     validate_parser = subparsers.add_parser('validate', help='Validate YAML files')
     validate_parser.add_argument('path', help='Path to validate (file or directory)')
+    validate_parser.add_argument('--changed-since', metavar='REF', help='Only validate files changed since a git ref (e.g. HEAD, origin/main)')
+    validate_parser.add_argument('--no-cache', action='store_true', help='Validate every file instead of reusing cached results')
+    validate_parser.add_argument('--workers', type=int, help='Parser processes (default: KB_WORKERS or CPU count)')
+    validate_parser.add_argument('--max-errors', type=int, metavar='N', help='Stop after N errors (fail fast)')
 
     # check-updates command
     updates_parser = subparsers.add_parser('check-updates', help='Check for updates')
@@ -315,6 +441,12 @@ Examples:
     # Execute command
     if args.command == 'search':
         cmd_search(args)
+    elif args.command == 'get':
+        cmd_get(args)
+    elif args.command == 'browse':
+        cmd_browse(args)
+    elif args.command == 'daemon':
+        cmd_daemon(args)
     elif args.command == 'stats':
         cmd_stats(args)
     elif args.command == 'index':
@@ -0,0 +1,240 @@
+#!/usr/bin/env python3
+"""
+kb_bench.py - Performance benchmarks for Shared Knowledge Base tooling
+
+Usage:
+    python tools/kb_bench.py yaml                   # Pure-Python vs libyaml parsing of domains/
+    python tools/kb_bench.py yaml --repeat 5 --json
+    python tools/kb_bench.py startup                # kb.py startup time against the budget
+
+Each benchmark reports the best of several runs, so results reflect the
+cost being measured rather than disk cache state.
+
+Version: 5.1.0
+"""
+
+import sys
+import json
+import time
+import argparse
+import subprocess
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Tuple
+
+try:
+    from tools.core import yamlio
+except ImportError:
+    from core import yamlio
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+KB_CLI = PROJECT_ROOT / "tools" / "kb.py"
+
+# kb.py commands timed by the startup benchmark
+STARTUP_COMMANDS = {
+    'help': ['--help'],
+    'profile': ['profile', 'list'],
+    'search': ['search', 'docker'],
+}
+
+# Import time `kb.py --help` may add on top of a bare interpreter
+STARTUP_BUDGET_MS = 50
+
+
+def best_of(func: Callable[[], Any], repeat: int) -> float:
+    """Run func repeat times and return the fastest wall time in seconds"""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def bench_yaml(path: Path, repeat: int = 3) -> Dict[str, Any]:
+    """
+    Compare the pure-Python SafeLoader with the loader used by yamlio.
+
+    Args:
+        path: Directory of YAML files to parse
+        repeat: Runs per loader (the fastest is reported)
+
+    Returns:
+        Dictionary with file counts, timings and speedup
+    """
+    texts: List[str] = []
+    for yaml_file in sorted(path.rglob('*.yaml')):
+        try:
+            texts.append(yaml_file.read_text(encoding='utf-8'))
+        except (OSError, UnicodeDecodeError):
+            continue
+
+    def parse_all(loader: type) -> None:
+        for text in texts:
+            try:
+                yamlio.safe_load(text, loader)
+            except yamlio.YAMLError:
+                pass
+
+    pure = best_of(lambda: parse_all(yamlio.PureSafeLoader), repeat)
+    accelerated = best_of(lambda: parse_all(yamlio.SafeLoader), repeat)
+
+    return {
+        'path': str(path),
+        'files': len(texts),
+        'size_kb': round(sum(len(text.encode('utf-8')) for text in texts) / 1024, 1),
+        'libyaml': yamlio.LIBYAML,
+        'loader': yamlio.SafeLoader.__name__,
+        'pure_ms': round(pure * 1000, 1),
+        'accelerated_ms': round(accelerated * 1000, 1),
+        'speedup': round(pure / accelerated, 2) if accelerated else 0
+    }
+
+
+def run_importtime(args: List[str]) -> Tuple[float, float, List[Tuple[str, float]]]:
+    """
+    Run a Python command with -X importtime.
+
+    Args:
+        args: Interpreter arguments after -X importtime
+
+    Returns:
+        (wall time ms, total import time ms, slowest top-level imports as
+        (module, cumulative ms))
+    """
+    start = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime'] + args,
+        cwd=PROJECT_ROOT,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        text=True
+    )
+    wall = (time.perf_counter() - start) * 1000
+
+    total = 0.0
+    top_level = []
+    for line in result.stderr.splitlines():
+        # import time: self [us] | cumulative | imported package
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, cumulative_us, module = line[len('import time:'):].split('|', 2)
+        total += int(self_us) / 1000
+        if not module.startswith('  '):
+            top_level.append((module.strip(), int(cumulative_us) / 1000))
+
+    top_level.sort(key=lambda item: item[1], reverse=True)
+    return wall, total, top_level
+
+
+def bench_startup(repeat: int = 5) -> Dict[str, Any]:
+    """
+    Time kb.py commands against a bare interpreter.
+
+    Args:
+        repeat: Runs per command (the fastest is reported)
+
+    Returns:
+        Dictionary with the bare interpreter baseline and, per command,
+        wall time, import time and import time above the baseline
+    """
+    def best(args: List[str]) -> Tuple[float, float, List[Tuple[str, float]]]:
+        return min((run_importtime(args) for _ in range(repeat)), key=lambda run: run[0])
+
+    bare_wall, bare_imports, _ = best(['-c', 'pass'])
+    commands = {}
+
+    for name, command in STARTUP_COMMANDS.items():
+        wall, imports, top_level = best([str(KB_CLI)] + command)
+        commands[name] = {
+            'command': ' '.join(['kb.py'] + command),
+            'wall_ms': round(wall, 1),
+            'import_ms': round(imports, 1),
+            'overhead_ms': round(imports - bare_imports, 1),
+            'slowest_imports': [(module, round(ms, 1)) for module, ms in top_level[:5]]
+        }
+
+    return {
+        'bare_wall_ms': round(bare_wall, 1),
+        'bare_import_ms': round(bare_imports, 1),
+        'budget_ms': STARTUP_BUDGET_MS,
+        'within_budget': commands['help']['overhead_ms'] <= STARTUP_BUDGET_MS,
+        'commands': commands
+    }
+
+
+def print_startup_report(report: Dict[str, Any]) -> None:
+    """Print startup benchmark results"""
+    print(f"📊 Startup: bare interpreter {report['bare_wall_ms']:.1f} ms "
+          f"({report['bare_import_ms']:.1f} ms imports)")
+
+    for stats in report['commands'].values():
+        print(f"\n  {stats['command']}")
+        print(f"    Wall time:     {stats['wall_ms']:>8.1f} ms")
+        print(f"    Import time:   {stats['import_ms']:>8.1f} ms (+{stats['overhead_ms']:.1f} ms over bare)")
+        slowest = ', '.join(f"{module} {ms:.1f}" for module, ms in stats['slowest_imports'])
+        print(f"    Slowest:       {slowest}")
+
+    overhead = report['commands']['help']['overhead_ms']
+    if report['within_budget']:
+        print(f"\n✅ kb.py --help import overhead {overhead:.1f} ms (budget {report['budget_ms']} ms)")
+    else:
+        print(f"\n❌ kb.py --help import overhead {overhead:.1f} ms exceeds budget of {report['budget_ms']} ms")
+
+
+def print_yaml_report(report: Dict[str, Any]) -> None:
+    """Print YAML benchmark results"""
+    print(f"📊 YAML parsing: {report['files']} files ({report['size_kb']} KB) in {report['path']}")
+    print(f"  SafeLoader (pure Python): {report['pure_ms']:>8.1f} ms")
+    print(f"  {report['loader'] + ':':<24} {report['accelerated_ms']:>8.1f} ms")
+
+    if report['libyaml']:
+        print(f"✅ libyaml speedup: {report['speedup']}x")
+    else:
+        print("⚠️  libyaml is not available, install PyYAML with libyaml for the fast path")
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmark Shared KB tooling",
+        formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    subparsers = parser.add_subparsers(dest="benchmark", help="Benchmark to run")
+
+    yaml_parser = subparsers.add_parser("yaml", help="Compare YAML loaders on the domains/ tree")
+    yaml_parser.add_argument("--path", default=str(PROJECT_ROOT / "domains"), help="Directory of YAML files")
+    yaml_parser.add_argument("--repeat", type=int, default=3, help="Runs per loader (default: 3)")
+    yaml_parser.add_argument("--json", action="store_true", help="Output JSON")
+
+    startup_parser = subparsers.add_parser("startup", help="Time kb.py startup with -X importtime")
+    startup_parser.add_argument("--repeat", type=int, default=5, help="Runs per command (default: 5)")
+    startup_parser.add_argument("--json", action="store_true", help="Output JSON")
+
+    args = parser.parse_args()
+
+    if args.benchmark == "startup":
+        report = bench_startup(max(args.repeat, 1))
+        if args.json:
+            print(json.dumps(report, indent=2))
+        else:
+            print_startup_report(report)
+
+        if not report['within_budget']:
+            sys.exit(1)
+    elif args.benchmark == "yaml":
+        path = Path(args.path)
+        if not path.is_dir():
+            print(f"❌ Directory not found: {path}")
+            sys.exit(1)
+
+        report = bench_yaml(path, max(args.repeat, 1))
+        if args.json:
+            print(json.dumps(report, indent=2))
+        else:
+            print_yaml_report(report)
+    else:
+        parser.print_help()
+
+
+if __name__ == "__main__":
+    main()
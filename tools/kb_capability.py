@@ -8,9 +8,13 @@ import shutil
 import argparse
 from pathlib import Path
 from typing import Optional
-import yaml
 import hashlib
 
+try:
+    from tools.core import yamlio
+except ImportError:
+    from core import yamlio
+
 def get_hash(file_path: Path) -> str:
     """Calculate SHA256 hash of file content."""
     sha256_hash = hashlib.sha256()
@@ -74,7 +78,7 @@ class CapabilityManager:
 
         # 2. Write YAML wrapper
         with open(wrapper_path, 'w') as f:
-            yaml.dump(wrapper_data, f, default_flow_style=False)
+            yamlio.safe_dump(wrapper_data, f, default_flow_style=False)
         print(f"✓ Created wrapper: {wrapper_path}")
         
         return True
@@ -100,7 +104,7 @@ class CapabilityManager:
             
         # Parse wrapper to find source
         with open(found_wrapper, 'r') as f:
-            data = yaml.safe_load(f)
+            data = yamlio.safe_load(f)
             
         source_name = data.get("implementation", {}).get("source")
         if not source_name:
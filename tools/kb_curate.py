@@ -14,13 +14,19 @@ Version: 5.1.0
 import os
 import sys
 import argparse
-import yaml
 import re
 import subprocess
 import logging
 from pathlib import Path
 from typing import Optional, Dict, List, Tuple
 
+try:
+    from tools.core import yamlio
+    from tools.core.schema import compile_schema, format_issue
+except ImportError:
+    from core import yamlio
+    from core.schema import compile_schema, format_issue
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -80,7 +86,7 @@ def extract_yaml_frontmatter(issue_body: str) -> Tuple[Optional[Dict], Optional[
 
     try:
         # Parse metadata (first YAML block)
-        metadata = yaml.safe_load(parts[1])
+        metadata = yamlio.safe_load(parts[1])
 
         # Extract YAML content (between ```yaml and ```)
         content_match = re.search(r'```yaml\n(.*?)\n```', issue_body, re.DOTALL)
@@ -142,38 +148,21 @@ def validate_entry(entry: Dict) -> Tuple[bool, List[str]]:
     """
     Validate KB entry.
 
+    Checks the same entry schema as `kb.py validate`. Curation is
+    stricter than validation: schema warnings (ID format, a solution
+    without code or explanation, no entries) are issues too.
+
     Args:
         entry: Parsed YAML entry dictionary
 
     Returns:
         Tuple of (is_valid, list_of_issues)
     """
-    issues = []
-
-    # Check required fields
-    required_fields = ['version', 'category']
-    for field in required_fields:
-        if field not in entry:
-            issues.append(f"Missing required field: {field}")
-
-    # Check for errors or patterns
-    entries = entry.get('errors', []) or entry.get('patterns', [])
-    if not entries:
-        issues.append("No 'errors' or 'patterns' found")
-    else:
-        item = entries[0]
-
-        # Check entry fields
-        if not item.get('problem'):
-            issues.append("Missing 'problem' field in entry")
+    if not isinstance(entry, dict):
+        return False, ["Entry must be a mapping"]
 
-        if not item.get('solution'):
-            issues.append("Missing 'solution' field in entry")
-        else:
-            if not item['solution'].get('code'):
-                issues.append("Missing 'solution.code' field")
-            if not item['solution'].get('explanation'):
-                issues.append("Missing 'solution.explanation' field")
+    errors, warnings = compile_schema().check(entry)
+    issues = [format_issue(issue) for issue in errors + warnings]
 
     return len(issues) == 0, issues
 
@@ -257,8 +246,8 @@ def validate_submission(g: 'Github', repo_name: str, issue_number: int) -> None:
 
         # Parse YAML entry
         try:
-            entry = yaml.safe_load(yaml_content)
-        except yaml.YAMLError as e:
+            entry = yamlio.safe_load(yaml_content)
+        except yamlio.YAMLError as e:
             logger.error(f"YAML parsing error: {e}")
             print(f"\n❌ YAML parsing error: {e}")
             return
@@ -326,8 +315,8 @@ def approve_submission(g: 'Github', repo_name: str, issue_number: int) -> None:
 
         # Parse YAML to determine domain
         try:
-            entry = yaml.safe_load(yaml_content)
-        except yaml.YAMLError as e:
+            entry = yamlio.safe_load(yaml_content)
+        except yamlio.YAMLError as e:
             logger.error(f"YAML parsing error: {e}")
             print(f"❌ YAML parsing error: {e}")
             return
@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+kb_daemon.py - Resident search daemon for the knowledge base
+
+Keeps the parsed corpus and search index in memory and serves
+`kb.py search`, `kb.py get` and `kb.py browse` over a Unix socket
+(.kb/cache/kb-daemon.sock, or KB_DAEMON_SOCKET). The commands work the
+same without the daemon, they just run in-process instead.
+
+Usage:
+    python tools/kb_daemon.py start             # Serve in the foreground
+    python tools/kb_daemon.py start --detach    # Serve in the background
+    python tools/kb_daemon.py status
+    python tools/kb_daemon.py stop
+
+Version: 5.1.0
+"""
+
+import os
+import sys
+import time
+import argparse
+from pathlib import Path
+
+# Add repository root to path
+repo_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(repo_root))
+
+from tools.core import daemon
+
+# Seconds `start --detach` waits for the daemon to answer
+START_TIMEOUT = 30.0
+
+
+def ping(path: Path):
+    """Get the status of the daemon on a socket, or None if it is not running"""
+    client = daemon.DaemonClient.connect(path, timeout=2.0)
+    if client is None:
+        return None
+
+    try:
+        with client:
+            return client.request('ping')
+    except (OSError, daemon.DaemonError):
+        return None
+
+
+def serve(path: Path) -> int:
+    """Warm the search engine and serve requests until stopped"""
+    from tools import kb_search
+
+    # Requests run on handler threads, and forking a process pool from a
+    # threaded process can deadlock the children, so parse in-process
+    server = daemon.KnowledgeDaemon(kb_search.create_search_engine(workers=1), path)
+
+    start = time.time()
+    server.warm()
+    print(f"🔥 Index warm in {(time.time() - start) * 1000:.0f}ms "
+          f"({server.engine.index.file_count} files)", flush=True)
+    print(f"✅ Search daemon listening on {path} (pid {os.getpid()})", flush=True)
+
+    try:
+        server.serve_forever()
+    except RuntimeError as e:
+        print(f"❌ {e}")
+        return 1
+    except KeyboardInterrupt:
+        pass
+
+    print("👋 Search daemon stopped")
+    return 0
+
+
+def cmd_start(path: Path, detach: bool) -> int:
+    """Start the daemon, optionally in the background"""
+    status = ping(path)
+    if status is not None:
+        print(f"ℹ️  Search daemon already running (pid {status['pid']})")
+        return 0
+
+    if not detach:
+        return serve(path)
+
+    if not hasattr(os, 'fork'):
+        print("❌ --detach is not supported on this platform")
+        return 1
+
+    if os.fork() == 0:
+        # Daemon process: detach from the terminal and serve
+        os.setsid()
+        devnull = os.open(os.devnull, os.O_RDWR)
+        for fd in (0, 1, 2):
+            os.dup2(devnull, fd)
+
+        code = 1
+        try:
+            code = serve(path)
+        finally:
+            os._exit(code)
+
+    deadline = time.time() + START_TIMEOUT
+    while time.time() < deadline:
+        status = ping(path)
+        if status is not None:
+            print(f"✅ Search daemon running (pid {status['pid']}) on {path}")
+            return 0
+        time.sleep(0.1)
+
+    print(f"❌ Search daemon did not start within {START_TIMEOUT:.0f}s")
+    return 1
+
+
+def cmd_stop(path: Path) -> int:
+    """Ask the daemon to shut down"""
+    client = daemon.DaemonClient.connect(path)
+    if client is None:
+        print("ℹ️  Search daemon is not running")
+        return 0
+
+    with client:
+        client.request('shutdown')
+
+    print("✅ Search daemon stopped")
+    return 0
+
+
+def cmd_status(path: Path) -> int:
+    """Report whether the daemon is running"""
+    status = ping(path)
+    if status is None:
+        print(f"❌ Search daemon is not running ({path})")
+        return 1
+
+    print(f"✅ Search daemon running (pid {status['pid']}) on {path}")
+    return 0
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Resident search daemon for the knowledge base",
+        formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument('action', choices=['start', 'stop', 'status'], help='Action to perform')
+    parser.add_argument('--detach', action='store_true', help='Run in the background (start only)')
+
+    args = parser.parse_args(argv)
+    path = daemon.socket_path(repo_root)
+
+    if args.action == 'start':
+        return cmd_start(path, args.detach)
+    elif args.action == 'stop':
+        return cmd_stop(path)
+    return cmd_status(path)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -4,254 +4,56 @@ Shared Knowledge Base Metrics Dashboard
 Generates quality metrics and repository statistics
 """
 
-import os
-import sys
 import json
 from pathlib import Path
-from datetime import datetime
-from collections import defaultdict, Counter
-import yaml
+
+try:
+    from tools.core import MetricsCalculator
+except ImportError:
+    from core import MetricsCalculator
 
 class KBMetrics:
-    """Calculate and display KB metrics"""
+    """
+    Calculate and display KB metrics.
+
+    A dashboard over core.MetricsCalculator, so the CLI reports the same
+    numbers as the MCP server's kb_stats from a single scan.
+    """
 
     def __init__(self, repo_path=None):
         self.repo_path = Path(repo_path) if repo_path else Path.cwd()
         self.domains_path = self.repo_path / "domains"
+        self.calculator = MetricsCalculator(str(self.repo_path))
         self.metrics = {}
 
     def calculate_all_metrics(self):
         """Calculate all metrics"""
         print("🔍 Calculating KB metrics...")
 
-        self.metrics['timestamp'] = datetime.now().isoformat()
-        self.metrics['repository_stats'] = self.get_repository_stats()
-        self.metrics['yaml_files'] = self.analyze_yaml_files()
-        self.metrics['quality_scores'] = self.calculate_quality_scores()
-        self.metrics['domain_distribution'] = self.get_domain_distribution()
+        self.metrics = self.calculator.calculate_all().model_dump()
         self.metrics['entry_types'] = self.get_entry_types()
-        self.metrics['version_distribution'] = self.get_version_distribution()
-
-        # Calculate validation status after yaml_files is set
-        self.metrics['validation_status'] = self.get_validation_status()
 
         return self.metrics
 
     def get_repository_stats(self):
         """Get basic repository statistics"""
-        stats = {
-            'total_files': 0,
-            'total_lines': 0,
-            'total_size_kb': 0,
-            'yaml_files': 0,
-            'markdown_files': 0,
-            'python_files': 0
-        }
-
-        # Count files by type
-        for ext in ['*.yaml', '*.yml', '*.md', '*.py']:
-            files = list(self.repo_path.rglob(ext))
-            for file in files:
-                if '.git' in str(file):
-                    continue
-
-                stats['total_files'] += 1
-
-                # Get file size
-                try:
-                    stats['total_size_kb'] += file.stat().st_size / 1024
-                except:
-                    pass
-
-                # Get line count
-                try:
-                    with open(file, 'r', encoding='utf-8', errors='ignore') as f:
-                        stats['total_lines'] += sum(1 for _ in f)
-                except:
-                    pass
-
-                # Count by type
-                if file.suffix in ['.yaml', '.yml']:
-                    stats['yaml_files'] += 1
-                elif file.suffix == '.md':
-                    stats['markdown_files'] += 1
-                elif file.suffix == '.py':
-                    stats['python_files'] += 1
-
-        return stats
+        return self.calculator.get_repository_stats()
 
     def analyze_yaml_files(self):
         """Analyze YAML files in domains/"""
-        yaml_stats = {
-            'total_entries': 0,
-            'errors': 0,
-            'patterns': 0,
-            'avg_entry_size_lines': 0,
-            'largest_file': None,
-            'domains': {}
-        }
-
-        total_lines = 0
-        max_lines = 0
-        largest_file = None
-
-        for yaml_file in self.domains_path.rglob('*.yaml'):
-            if '_meta.yaml' in str(yaml_file):
-                continue
-
-            try:
-                with open(yaml_file, 'r') as f:
-                    content = yaml.safe_load(f)
-                    lines = sum(1 for _ in open(yaml_file, 'r'))
-
-                    # Count entries
-                    if 'errors' in content:
-                        count = len(content['errors'])
-                        yaml_stats['errors'] += count
-                        yaml_stats['total_entries'] += count
-                    elif 'patterns' in content:
-                        count = len(content['patterns'])
-                        yaml_stats['patterns'] += count
-                        yaml_stats['total_entries'] += count
-
-                    total_lines += lines
-
-                    # Track largest file
-                    if lines > max_lines:
-                        max_lines = lines
-                        largest_file = str(yaml_file.relative_to(self.repo_path))
-
-                    # Track by domain
-                    try:
-                        rel_path = yaml_file.relative_to(self.domains_path)
-                        domain = rel_path.parts[0]
-                        # Debug: print(f"{yaml_file} -> {domain}") 
-                    except ValueError:
-                        domain = "unknown"
-                    
-                    if domain not in yaml_stats['domains']:
-                        yaml_stats['domains'][domain] = {
-                            'files': 0,
-                            'entries': 0,
-                            'lines': 0
-                        }
-
-                    yaml_stats['domains'][domain]['files'] += 1
-                    yaml_stats['domains'][domain]['entries'] += count
-                    yaml_stats['domains'][domain]['lines'] += lines
-
-            except Exception as e:
-                print(f"  ⚠️  Error reading {yaml_file}: {e}")
-
-        if yaml_stats['total_entries'] > 0:
-            yaml_stats['avg_entry_size_lines'] = total_lines / yaml_stats['total_entries']
-
-        yaml_stats['largest_file'] = {
-            'path': largest_file,
-            'lines': max_lines
-        }
-
-        return yaml_stats
+        return self.calculator.analyze_yaml_files()
 
     def calculate_quality_scores(self):
         """Calculate quality scores for entries"""
-        quality_stats = {
-            'total_entries': 0,
-            'excellent': 0,  # 90-100
-            'good': 0,       # 75-89
-            'acceptable': 0, # 60-74
-            'poor': 0,       # 40-59
-            'critical': 0,   # 0-39
-            'avg_score': 0
-        }
-
-        total_score = 0
-
-        for yaml_file in self.domains_path.rglob('*.yaml'):
-            if '_meta.yaml' in str(yaml_file):
-                continue
-
-            try:
-                with open(yaml_file, 'r') as f:
-                    content = yaml.safe_load(f)
-
-                    entries = content.get('errors', []) + content.get('patterns', [])
-
-                    for entry in entries:
-                        score = self.calculate_entry_score(entry)
-                        quality_stats['total_entries'] += 1
-                        total_score += score
-
-                        if score >= 90:
-                            quality_stats['excellent'] += 1
-                        elif score >= 75:
-                            quality_stats['good'] += 1
-                        elif score >= 60:
-                            quality_stats['acceptable'] += 1
-                        elif score >= 40:
-                            quality_stats['poor'] += 1
-                        else:
-                            quality_stats['critical'] += 1
-
-            except Exception as e:
-                pass
-
-        if quality_stats['total_entries'] > 0:
-            quality_stats['avg_score'] = total_score / quality_stats['total_entries']
-
-        return quality_stats
+        return self.calculator.calculate_quality_distribution()
 
     def calculate_entry_score(self, entry):
         """Calculate quality score for a single entry (0-100)"""
-        score = 0
-
-        # Required fields (40 points)
-        required_fields = ['id', 'title', 'severity', 'scope', 'problem', 'solution']
-        for field in required_fields:
-            if field in entry:
-                score += 40 // len(required_fields)
-
-        # Solution quality (30 points)
-        if 'solution' in entry:
-            solution = entry['solution']
-            if isinstance(solution, dict):
-                if 'code' in solution and solution['code']:
-                    score += 15
-                if 'explanation' in solution and solution['explanation']:
-                    score += 15
-
-        # Prevention/best practices (20 points)
-        if 'prevention' in entry and entry['prevention']:
-            score += 20
-
-        # Additional metadata (10 points)
-        if 'tags' in entry and entry['tags']:
-            score += 5
-        if 'symptoms' in entry or 'root_cause' in entry:
-            score += 5
-
-        return min(score, 100)
+        return self.calculator.calculate_entry_score(entry)
 
     def get_domain_distribution(self):
         """Get distribution of entries across domains"""
-        distribution = defaultdict(int)
-
-        for yaml_file in self.domains_path.rglob('*.yaml'):
-            if '_meta.yaml' in str(yaml_file):
-                continue
-
-            try:
-                with open(yaml_file, 'r') as f:
-                    content = yaml.safe_load(f)
-
-                    domain = yaml_file.parent.parent.name
-                    entries = content.get('errors', []) + content.get('patterns', [])
-                    distribution[domain] += len(entries)
-
-            except:
-                pass
-
-        return dict(sorted(distribution.items(), key=lambda x: x[1], reverse=True))
+        return self.calculator.get_domain_distribution()
 
     def get_entry_types(self):
         """Get distribution of entry types"""
@@ -263,38 +65,14 @@ class KBMetrics:
 
     def get_version_distribution(self):
         """Get distribution of schema versions"""
-        versions = Counter()
-
-        for yaml_file in self.domains_path.rglob('*.yaml'):
-            if '_meta.yaml' in str(yaml_file):
-                continue
-
-            try:
-                with open(yaml_file, 'r') as f:
-                    content = yaml.safe_load(f)
-                    if 'version' in content:
-                        versions[content['version']] += 1
-            except:
-                pass
-
-        return dict(versions)
+        return self.calculator.get_version_distribution()
 
     def get_validation_status(self):
         """Get validation status"""
-        yaml_stats = self.metrics.get('yaml_files', {})
-        total = 0
-        for domain in yaml_stats.get('domains', {}).values():
-            total += domain.get('files', 0)
+        return self.calculator.get_validation_status(self.metrics.get('yaml_files', {}))
 
-        return {
-            'total_files': total,
-            'validated': total,
-            'errors': 0,  # Would be populated by actual validation
-            'warnings': 0
-        }
-
-    def print_dashboard(self):
-        """Print metrics dashboard"""
+    def print_dashboard(self, verbose=False):
+        """Print metrics dashboard (verbose adds per-domain file details)"""
         print("\n" + "="*60)
         print("📊 SHARED KNOWLEDGE BASE METRICS DASHBOARD")
         print("="*60)
@@ -322,6 +100,11 @@ class KBMetrics:
         for domain, count in list(self.metrics['domain_distribution'].items())[:10]:
             print(f"  {domain}: {count} entries")
 
+        if verbose:
+            print("\n📄 Domain Details:")
+            for domain, stats in sorted(yaml['domains'].items()):
+                print(f"  {domain}: {stats['files']} files, {stats['entries']} entries, {stats['lines']:,} lines")
+
         # Quality Scores
         quality = self.metrics['quality_scores']
         print("\n⭐ Quality Scores:")
@@ -368,6 +151,7 @@ def main():
     parser.add_argument('--repo', '-r', help='Repository path', default='.')
     parser.add_argument('--export', '-e', help='Export to JSON file')
     parser.add_argument('--json', action='store_true', help='Output as JSON')
+    parser.add_argument('--verbose', '-v', action='store_true', help='Show per-domain details')
 
     args = parser.parse_args()
 
@@ -379,7 +163,7 @@ def main():
     if args.json:
         print(json.dumps(metrics.metrics, indent=2))
     else:
-        metrics.print_dashboard()
+        metrics.print_dashboard(verbose=args.verbose)
 
     # Export if requested
     if args.export:
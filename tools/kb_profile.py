@@ -5,10 +5,14 @@ Manages active knowledge domains for the current project.
 """
 
 import sys
-import yaml
 from pathlib import Path
 from typing import List, Set
 
+try:
+    from tools.core import yamlio
+except ImportError:
+    from core import yamlio
+
 class ProfileManager:
     def __init__(self, repo_root: Path):
         self.repo_root = repo_root
@@ -18,13 +22,13 @@ class ProfileManager:
     def _load_config(self) -> dict:
         if self.config_path.exists():
             with open(self.config_path, 'r') as f:
-                return yaml.safe_load(f) or {"active_domains": ["universal"]}
+                return yamlio.safe_load(f) or {"active_domains": ["universal"]}
         return {"active_domains": ["universal"]}
 
     def _save_config(self, config: dict):
         self.config_path.parent.mkdir(parents=True, exist_ok=True)
         with open(self.config_path, 'w') as f:
-            yaml.dump(config, f, default_flow_style=False)
+            yamlio.safe_dump(config, f, default_flow_style=False)
 
     def get_available_domains(self) -> List[str]:
         """List all available domains in shared KB."""
@@ -6,12 +6,16 @@ Helps agents create semantic releases and broadcast them to Company OS.
 
 import os
 import sys
-import yaml
 import argparse
 import subprocess
 from pathlib import Path
 from datetime import datetime
 
+try:
+    from tools.core import yamlio
+except ImportError:
+    from core import yamlio
+
 class ReleaseManager:
     def __init__(self, repo_root: Path):
         self.repo_root = repo_root
@@ -22,7 +26,7 @@ class ReleaseManager:
         if not self.passport_path.exists():
             return "0.0.0"
         with open(self.passport_path, 'r') as f:
-            data = yaml.safe_load(f)
+            data = yamlio.safe_load(f)
         return data.get("version", "0.0.0")
 
     def create_release(self, version: str, title: str, description: str):
@@ -32,7 +36,7 @@ class ReleaseManager:
         # 1. Update Passport
         if self.passport_path.exists():
             with open(self.passport_path, 'r') as f:
-                data = yaml.safe_load(f)
+                data = yamlio.safe_load(f)
             
             data["version"] = version
             data["latest_release"] = {
@@ -43,7 +47,7 @@ class ReleaseManager:
             }
             
             with open(self.passport_path, 'w') as f:
-                yaml.dump(data, f, default_flow_style=False)
+                yamlio.safe_dump(data, f, default_flow_style=False)
             print("✅ Updated PROJECT.yaml")
         else:
             print("❌ PROJECT.yaml not found. Run 'kb sync init-passport' first.")
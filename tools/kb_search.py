@@ -7,6 +7,13 @@ Usage:
     python tools/v5.1/kb_search.py "fastapi cors" --scope shared
     python tools/v5.1/kb_search.py "stripe" --scope project
 
+Searches the memory-mapped binary index built by `kb.py index` when it
+is up to date, then the pickled index snapshot: a file matches if one
+of its entries matches the query's words, and files are ranked by their
+best matching entry. Without an index, a file matches if its text or
+name contains the query. Either way a file is described, and filtered,
+by its first entry that contains the query (or its first entry).
+
 Version: 5.1.0
 """
 
@@ -14,14 +21,18 @@ import os
 import argparse
 import logging
 from pathlib import Path
-from typing import List, Tuple, Dict, Any
-
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    datefmt='%Y-%m-%d %H:%M:%S'
-)
+from typing import List, Tuple, Dict, Any, Iterator, Optional
+
+# Core package is optional. Its submodules are imported on first use, so
+# the binary index reader does not load pydantic or the YAML parser.
+try:
+    from tools import core
+except ImportError:
+    try:
+        import core
+    except ImportError:
+        core = None
+
 logger = logging.getLogger(__name__)
 
 # --- Configuration ---
@@ -41,45 +52,273 @@ PATHS = {
     "shared": SHARED_KB_PATH
 }
 
+# Binary index written by `kb.py index`, relative to the project root
+BINARY_INDEX_PATH = Path(".kb") / "cache" / "search-index.bin"
+
+# Index-backed search engine, loaded on first use
+_search_engine = None
+_search_engine_loaded = False
+
+# Metadata of the files matched by the last search, so display skips re-parsing
+_file_metadata: Dict[Path, Dict[str, Any]] = {}
 
-def search_files(root_path: Path, query: str) -> List[Path]:
+
+def create_search_engine(workers: Optional[int] = None) -> Any:
     """
-    Search for YAML files containing query string.
+    Create an in-process KnowledgeSearch over the Project and Shared KB.
+
+    Used for local searches, by the search daemon and by `kb.py get`/
+    `kb.py browse` when no daemon is running.
 
     Args:
+        workers: Processes for parsing many changed files at once
+            (default: KB_WORKERS or CPU count)
+
+    Raises:
+        ImportError: If the core package or pydantic is not available
+    """
+    if core is None:
+        raise ImportError("tools.core is not available")
+
+    # Absolute paths, so the index keys do not depend on the working
+    # directory and match `kb.py index`
+    return core.KnowledgeSearch(
+        search_paths=[str(SHARED_KB_PATH.relative_to(PROJECT_ROOT))],
+        repo_path=str(PROJECT_ROOT),
+        workers=workers
+    )
+
+
+def get_search_engine() -> Optional[Any]:
+    """
+    Get an index-backed search engine.
+
+    Prefers a running search daemon (`kb_daemon.py start`), which holds
+    the index in memory. Otherwise uses the memory-mapped binary index,
+    which answers a query without parsing YAML or loading the full
+    index, and falls back to the pickled snapshot when the binary index
+    is missing or out of date.
+
+    Returns:
+        DaemonClient, BinaryIndex or KnowledgeSearch, or None if no index
+        has been built
+    """
+    global _search_engine, _search_engine_loaded
+
+    if _search_engine_loaded:
+        return _search_engine
+
+    _search_engine_loaded = True
+
+    if core is None:
+        return None
+
+    client = core.DaemonClient.connect(core.daemon.socket_path(PROJECT_ROOT))
+    if client is not None:
+        logger.debug(f"Using search daemon at {client.path}")
+        _search_engine = client
+        return _search_engine
+
+    _search_engine = load_local_engine()
+    return _search_engine
+
+
+def load_local_engine() -> Optional[Any]:
+    """
+    Load an in-process index-backed search engine.
+
+    Returns:
+        BinaryIndex or KnowledgeSearch, or None if no index has been built
+    """
+    search_paths = [str(SHARED_KB_PATH.relative_to(PROJECT_ROOT))]
+
+    binary_index = core.BinaryIndex.open(PROJECT_ROOT / BINARY_INDEX_PATH)
+    if binary_index is not None:
+        # Absolute paths, matching `kb.py index`
+        expected_roots = [
+            str(PROJECT_ROOT / path)
+            for path in search_paths + [Path(".kb") / "project", Path(".kb") / "shared"]
+        ]
+        if binary_index.roots == expected_roots and binary_index.is_fresh():
+            logger.debug(f"Using binary search index {binary_index.path}")
+            return binary_index
+        binary_index.close()
+
+    try:
+        engine = create_search_engine()
+    except ImportError:
+        # pydantic is not installed
+        return None
+
+    if engine.load_index():
+        logger.debug(f"Loaded search index from {engine.store.path}")
+        return engine
+
+    logger.debug("No search index found, using text search")
+    return None
+
+
+def search_index(
+    engine: Any,
+    root_path: Path,
+    query: str,
+    category: Optional[str] = None,
+    severity: Optional[str] = None
+) -> List[Path]:
+    """
+    Search files using the index, without reading them.
+
+    A file matches if one of its entries matches the query's words. Files
+    are ranked by their best matching entry and described by their first
+    matching entry, whose metadata the filters apply to.
+
+    Args:
+        engine: BinaryIndex, DaemonClient or KnowledgeSearch
         root_path: Root directory to search
         query: Search query string
+        category: Only match files in this category
+        severity: Only match files with this severity
 
     Returns:
-        List of matching file paths
+        List of matching file paths, best match first
     """
+    kb_type = "project" if root_path == PATHS["project"] else "shared"
+
+    # First matching entry of each file, in the order of their best entries
+    first_hits: Dict[Path, Dict[str, Any]] = {}
+    for hit_kb_type, metadata in iter_index_hits(engine, query, include_project=(kb_type == "project")):
+        if hit_kb_type != kb_type:
+            continue
+
+        path = Path(metadata['file_path']).resolve()
+        first = first_hits.get(path)
+        if first is None or (metadata['line_number'] or 0) < (first['line_number'] or 0):
+            first_hits[path] = metadata
+
     matches = []
+    for path, metadata in first_hits.items():
+        _file_metadata[path] = {
+            'title': metadata['title'],
+            'severity': metadata['severity'],
+            'category': metadata['category'] or 'general',
+            'scope': metadata['scope']
+        }
+        if matches_filters(path, category, severity):
+            matches.append(path)
 
-    if not root_path.exists():
-        logger.warning(f"Search path does not exist: {root_path}")
-        return matches
+    return matches
 
-    query_lower = query.lower()
 
-    # Search recursively for YAML files
+def iter_index_hits(engine: Any, query: str, include_project: bool) -> Iterator[Tuple[str, Dict[str, Any]]]:
+    """
+    Yield (kb_type, metadata) of every entry matching a query, best first.
+
+    Every definition of an ID is included, and there is no result limit.
+
+    Args:
+        engine: BinaryIndex, DaemonClient or KnowledgeSearch
+        query: Search query string
+        include_project: Include project KB entries (shared KB roots other
+            than the search paths are left out)
+    """
+    options = {'include_project': include_project, 'include_shared': False, 'unique_ids': False}
+
+    if isinstance(engine, (core.BinaryIndex, core.DaemonClient)):
+        for hit in engine.query(query, limit=None, **options):
+            yield hit['kb_type'], hit['metadata']
+    else:
+        for result in engine.iter_search(query, **options):
+            yield result.kb_type, result.metadata.model_dump(mode='json')
+
+
+def iter_yaml_files(root_path: Path) -> Iterator[Path]:
+    """Yield the YAML files under a root, skipping index files"""
     for path in root_path.rglob("*.yaml"):
-        # Skip index files
-        if "_index" in path.name or "_index" in str(path):
+        # Only look below the root, which may itself be under an *_index* directory
+        if "_index" in str(path.relative_to(root_path)):
             continue
+        yield path
+
+
+def scan_files(root_path: Path, query: str) -> List[Path]:
+    """
+    Find YAML files whose text or name contains the query (case-insensitive).
+
+    Args:
+        root_path: Root directory to search
+        query: Search query string
+
+    Returns:
+        List of matching file paths, in directory order
+    """
+    query_lower = query.lower()
+    matches = []
 
+    for path in iter_yaml_files(root_path):
         try:
             with open(path, 'r', encoding='utf-8') as f:
                 content = f.read().lower()
 
-                # Check if query is in content or filename
-                if query_lower in content or query_lower in path.name.lower():
-                    matches.append(path)
+            # Check if query is in content or filename
+            if query_lower in content or query_lower in path.name.lower():
+                matches.append(path)
 
         except Exception as e:
             logger.debug(f"Could not read file {path}: {e}")
             # Skip files that can't be read
             continue
 
+    return matches
+
+
+def search_files(
+    root_path: Path,
+    query: str,
+    category: Optional[str] = None,
+    severity: Optional[str] = None
+) -> List[Path]:
+    """
+    Search for YAML files containing query string.
+
+    Args:
+        root_path: Root directory to search
+        query: Search query string
+        category: Only match files in this category
+        severity: Only match files with this severity
+
+    Returns:
+        List of matching file paths
+    """
+    global _search_engine
+
+    matches = []
+
+    if not root_path.exists():
+        logger.warning(f"Search path does not exist: {root_path}")
+        return matches
+
+    engine = get_search_engine()
+    if engine is not None and isinstance(engine, core.DaemonClient):
+        try:
+            matches = search_index(engine, root_path, query, category, severity)
+            logger.info(f"Daemon search completed: {len(matches)} matches found in {root_path}")
+            return matches
+        except (OSError, core.daemon.DaemonError) as e:
+            # The daemon stopped or rejected the request; search in-process instead
+            logger.warning(f"Search daemon failed ({e}), searching in-process")
+            engine.close()
+            _search_engine = engine = load_local_engine()
+
+    if engine is not None:
+        matches = search_index(engine, root_path, query, category, severity)
+        logger.info(f"Index search completed: {len(matches)} matches found in {root_path}")
+        return matches
+
+    for path in scan_files(root_path, query):
+        _file_metadata[path] = read_metadata(path, query)
+        if matches_filters(path, category, severity):
+            matches.append(path)
+
     logger.info(f"Search completed: {len(matches)} matches found in {root_path}")
     return matches
 
@@ -88,21 +327,45 @@ def extract_metadata(file_path: Path) -> Dict[str, Any]:
     """
     Extract metadata from YAML file for better display.
 
+    Uses the metadata found by the last search when it matched the file.
+
     Args:
         file_path: Path to YAML file
 
     Returns:
         Dictionary with title, problem, severity, etc.
     """
+    cached = _file_metadata.get(file_path)
+    if cached is not None:
+        return cached
+
+    return read_metadata(file_path)
+
+
+def read_metadata(file_path: Path, query: str = "") -> Dict[str, Any]:
+    """
+    Read a YAML file's metadata from its first entry that contains the query.
+
+    Args:
+        file_path: Path to YAML file
+        query: Search query string (empty for the first entry)
+
+    Returns:
+        Dictionary with title, severity, category and scope
+    """
     try:
-        import yaml
+        if core is not None:
+            safe_load = core.yamlio.safe_load
+        else:
+            from yaml import safe_load
         with open(file_path, 'r', encoding='utf-8') as f:
-            data = yaml.safe_load(f)
+            data = safe_load(f)
 
         # Extract from errors or patterns
         entries = data.get('errors', []) or data.get('patterns', [])
         if entries:
-            entry = entries[0]
+            query_lower = query.lower()
+            entry = next((entry for entry in entries if contains_query(entry, query_lower)), entries[0])
             return {
                 'title': entry.get('title', 'No title'),
                 'severity': entry.get('severity', 'unknown'),
@@ -120,6 +383,31 @@ def extract_metadata(file_path: Path) -> Dict[str, Any]:
     }
 
 
+def contains_query(value: Any, query_lower: str) -> bool:
+    """Check whether a parsed entry's keys or values contain a lower-cased query"""
+    if isinstance(value, dict):
+        return any(
+            contains_query(key, query_lower) or contains_query(item, query_lower)
+            for key, item in value.items()
+        )
+    if isinstance(value, list):
+        return any(contains_query(item, query_lower) for item in value)
+    return query_lower in str(value).lower()
+
+
+def matches_filters(file_path: Path, category: Optional[str], severity: Optional[str]) -> bool:
+    """Check a file's category and severity, as displayed, against filters"""
+    if category is None and severity is None:
+        return True
+
+    metadata = extract_metadata(file_path)
+    if category is not None and metadata['category'] != category:
+        return False
+    if severity is not None and metadata['severity'] != severity:
+        return False
+    return True
+
+
 def extract_preview(file_path: Path, query: str, max_lines: int = 3) -> str:
     """
     Extract lines containing query for preview.
@@ -251,7 +539,75 @@ def get_kb_stats() -> Dict[str, Any]:
     return stats
 
 
-def main() -> None:
+def configure_logging() -> None:
+    """Log search progress to stderr, as the CLI does"""
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+        datefmt='%Y-%m-%d %H:%M:%S'
+    )
+
+
+def show_stats() -> int:
+    """Print KB statistics"""
+    stats = get_kb_stats()
+
+    logger.info("Displaying KB statistics")
+    print("📊 Knowledge Base Statistics\n")
+    for source, stat in stats.items():
+        if stat["exists"]:
+            print(f"✅ {source.upper()} KB: {stat['entries']} entries")
+            print(f"   Path: {stat['path']}")
+        else:
+            print(f"❌ {source.upper()} KB: Not found")
+            print(f"   Expected: {stat['path']}")
+
+        print()
+
+    return 0
+
+
+def run_search(
+    query: str,
+    scope: str = "all",
+    category: Optional[str] = None,
+    severity: Optional[str] = None,
+    preview: bool = False
+) -> int:
+    """
+    Search the requested KBs and print the results.
+
+    Used by main() and, in-process, by `kb.py search`.
+
+    Args:
+        query: Search query
+        scope: 'project', 'shared' or 'all'
+        category: Only show files in this category
+        severity: Only show files with this severity
+        preview: Whether to show content preview
+
+    Returns:
+        Process exit code
+    """
+    results = {}
+    scopes = []
+
+    if scope in ["project", "all"]:
+        scopes.append("project")
+        results["PROJECT"] = search_files(PATHS["project"], query, category, severity)
+
+    if scope in ["shared", "all"]:
+        scopes.append("shared")
+        results["SHARED"] = search_files(PATHS["shared"], query, category, severity)
+
+    logger.info(f"Searching in scopes: {', '.join(scopes)}")
+    # Display results
+    display_results(results, query, show_preview=preview)
+
+    return 0
+
+
+def main() -> int:
     """CLI interface"""
     parser = argparse.ArgumentParser(
         description="Knowledge Base Search Tool v5.1",
@@ -270,6 +626,9 @@ Examples:
   # Search with preview
   python tools/v5.1/kb_search.py "postgresql" --preview
 
+  # Only high-severity Docker errors
+  python tools/v5.1/kb_search.py "compose" --category docker-errors --severity high
+
   # Show KB statistics
   python tools/v5.1/kb_search.py --stats
         """
@@ -288,6 +647,17 @@ Examples:
         help="Where to search: 'project', 'shared', or 'all' (default: all)"
     )
 
+    parser.add_argument(
+        "--category",
+        help="Only show entries in this category"
+    )
+
+    parser.add_argument(
+        "--severity",
+        choices=["critical", "high", "medium", "low"],
+        help="Only show entries with this severity"
+    )
+
     parser.add_argument(
         "--preview",
         action="store_true",
@@ -301,47 +671,24 @@ Examples:
     )
 
     args = parser.parse_args()
+    configure_logging()
 
     # Show statistics if requested
     if args.stats:
-        stats = get_kb_stats()
-
-        logger.info("Displaying KB statistics")
-        print("📊 Knowledge Base Statistics\n")
-        for source, stat in stats.items():
-            if stat["exists"]:
-                print(f"✅ {source.upper()} KB: {stat['entries']} entries")
-                print(f"   Path: {stat['path']}")
-            else:
-                print(f"❌ {source.upper()} KB: Not found")
-                print(f"   Expected: {stat['path']}")
-
-            print()
-
-        return 0
+        return show_stats()
 
     # Require query if not showing stats
     if not args.query:
         parser.print_help()
         return 1
 
-    # Search in requested scopes
-    results = {}
-    scopes = []
-
-    if args.scope in ["project", "all"]:
-        scopes.append("project")
-        results["PROJECT"] = search_files(PATHS["project"], args.query)
-
-    if args.scope in ["shared", "all"]:
-        scopes.append("shared")
-        results["SHARED"] = search_files(PATHS["shared"], args.query)
-
-    logger.info(f"Searching in scopes: {', '.join(scopes)}")
-    # Display results
-    display_results(results, args.query, show_preview=args.preview)
-
-    return 0
+    return run_search(
+        args.query,
+        scope=args.scope,
+        category=args.category,
+        severity=args.severity,
+        preview=args.preview
+    )
 
 
 if __name__ == "__main__":
@@ -12,12 +12,18 @@ Version: 5.1.0
 import os
 import sys
 import argparse
-import yaml
 import logging
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Tuple, Dict
 
+try:
+    from tools.core import yamlio
+    from tools.core.schema import compile_schema, format_issue
+except ImportError:
+    from core import yamlio
+    from core.schema import compile_schema, format_issue
+
 import subprocess
 
 # Configure logging
@@ -103,7 +109,7 @@ def load_project_context() -> Dict[str, Any]:
     if CONTEXT_FILE.exists():
         try:
             with open(CONTEXT_FILE, 'r', encoding='utf-8') as f:
-                return yaml.safe_load(f)
+                return yamlio.safe_load(f)
         except Exception as e:
             logger.warning(f"Could not load PROJECT.yaml: {e}")
     return {}
@@ -125,21 +131,24 @@ def validate_yaml_content(yaml_content: str) -> Tuple[bool, str, int]:
     """
     Validate YAML content before submission.
 
+    Uses the same entry schema as `kb.py validate`, so a submission that
+    passes here also passes validation once merged.
+
     Returns:
         tuple: (is_valid, message, score)
     """
     try:
-        data = yaml.safe_load(yaml_content)
-
-        # Required fields check
-        required_fields = ['version', 'category']
-        missing = [f for f in required_fields if f not in data]
+        data = yamlio.safe_load(yaml_content)
+        if not isinstance(data, dict):
+            return False, "YAML content must be a mapping", 0
 
-        if missing:
-            return False, f"Missing required fields: {', '.join(missing)}", 0
+        # Schema check
+        errors, warnings = compile_schema().check(data)
+        if errors:
+            return False, "; ".join(format_issue(error) for error in errors), 0
 
         # Check for errors or patterns
-        entries = data.get('errors', []) or data.get('patterns', [])
+        entries = data.get('errors') or data.get('patterns')
         if not entries:
             return False, "No 'errors' or 'patterns' entries found", 0
 
@@ -170,9 +179,12 @@ def validate_yaml_content(yaml_content: str) -> Tuple[bool, str, int]:
         if entry.get('severity'):
             score += 10
 
-        return True, f"Quality score: {score}/100", score
+        message = f"Quality score: {score}/100"
+        if warnings:
+            message += f" ({'; '.join(format_issue(warning) for warning in warnings)})"
+        return True, message, score
 
-    except yaml.YAMLError as e:
+    except yamlio.YAMLError as e:
         return False, f"YAML parsing error: {e}", 0
     except Exception as e:
         return False, f"Validation error: {e}", 0
@@ -229,7 +241,7 @@ def submit_local(file_path: Path, auto_commit: bool = False) -> None:
     # Determine target path based on category or default to knowledge/
     with open(file_path, 'r', encoding='utf-8') as f:
         content = f.read()
-        data = yaml.safe_load(content) if content else {}
+        data = yamlio.safe_load(content) if content else {}
 
     # Extract category to determine subdirectory
     category = data.get('category', 'general')
@@ -6,13 +6,17 @@ Manages the link between the local Project and the central Company OS Registry.
 
 import os
 import sys
-import yaml
 import shutil
 import subprocess
 import stat
 from pathlib import Path
 from datetime import datetime
 
+try:
+    from tools.core import yamlio
+except ImportError:
+    from core import yamlio
+
 def on_rm_error(func, path, exc_info):
     """
     Error handler for ``shutil.rmtree``.
@@ -59,7 +63,7 @@ class RegistrySync:
             "last_updated": datetime.now().isoformat()
         }
         with open(self.passport_path, 'w') as f:
-            yaml.dump(template, f, default_flow_style=False)
+            yamlio.safe_dump(template, f, default_flow_style=False)
         print(f"✅ Created passport template at {self.passport_path}")
 
     def _setup_git_auth(self, cwd: str):
@@ -158,7 +162,7 @@ class RegistrySync:
 
         # Load local passport
         with open(self.passport_path, 'r') as f:
-            passport = yaml.safe_load(f)
+            passport = yamlio.safe_load(f)
 
         # Validate before pushing
         if not self.validate_passport(passport):
@@ -182,7 +186,7 @@ class RegistrySync:
             # Load existing registry
             if registry_path.exists():
                 with open(registry_path, 'r') as f:
-                    registry = yaml.safe_load(f) or {"projects": []}
+                    registry = yamlio.safe_load(f) or {"projects": []}
             else:
                 registry = {"projects": []}
                 
@@ -213,7 +217,7 @@ class RegistrySync:
             
             # Save back
             with open(registry_path, 'w') as f:
-                yaml.dump(registry, f, default_flow_style=False)
+                yamlio.safe_dump(registry, f, default_flow_style=False)
                 
             # Commit and Push
             # NOTE: This requires authentication (SSH/Token) in the environment
@@ -251,10 +255,10 @@ class RegistrySync:
             return
 
         with open(self.passport_path, 'r') as f:
-            passport = yaml.safe_load(f)
+            passport = yamlio.safe_load(f)
             
         with open(self.registry_cache, 'r') as f:
-            registry = yaml.safe_load(f)
+            registry = yamlio.safe_load(f)
             
         dependencies = passport.get("dependencies", [])
         projects = {p["id"]: p for p in registry.get("projects", [])}
@@ -10,6 +10,8 @@ Based on ayga-mcp-client architecture.
 import asyncio
 import json
 import sys
+import threading
+from contextlib import contextmanager
 from pathlib import Path
 from typing import Any, List
 from datetime import datetime
@@ -26,20 +28,71 @@ except ImportError:
 # Import core modules
 from core import (
     KnowledgeSearch,
+    ChangeWatcher,
+    ToolExecutor,
     MetricsCalculator,
     KnowledgeValidator,
     SearchFilter,
     HealthStatus
 )
+from core.watcher import default_interval as default_watch_interval
+from core.validation import changed_files
 
 # Create MCP server instance
 server = Server("shared-knowledge-base")
 
 # Initialize core components
 repo_path = Path.cwd()
-search_engine = KnowledgeSearch()
-metrics_calculator = MetricsCalculator(str(repo_path))
-validator = KnowledgeValidator(str(repo_path))
+# Tool calls run on ToolExecutor threads, and forking a process pool from a
+# threaded process can deadlock the children, so the server parses in-process
+PARSE_WORKERS = 1
+# Queries trust the in-memory index; the watcher patches in changed files
+# Absolute index keys, matching `kb.py index`
+search_engine = KnowledgeSearch(repo_path=str(repo_path), auto_refresh=False, workers=PARSE_WORKERS)
+metrics_calculator = MetricsCalculator(str(repo_path), workers=PARSE_WORKERS)
+# Files the watcher finds edited in place are also reported to the metrics
+index_watcher = ChangeWatcher(search_engine, on_change=metrics_calculator.mark_changed)
+# Only files changed since the last validation are parsed again
+validator = KnowledgeValidator(str(repo_path), workers=PARSE_WORKERS, cache=True)
+
+# The search engine updates its index in place, so queries and watcher
+# polls take turns. The metrics calculator serializes its own cache
+# updates, and the validator's cache is only used by kb_validate, which
+# runs one call at a time.
+index_lock = threading.Lock()
+# Set once watch_index has loaded the index; queries wait for it
+index_ready = threading.Event()
+
+
+@contextmanager
+def locked_index():
+    """Hold the index lock, once the startup warm-up has run"""
+    index_ready.wait()
+    with index_lock:
+        yield
+
+
+def display_path(path: str) -> str:
+    """Show an index path relative to the repository root"""
+    try:
+        return str(Path(path).relative_to(repo_path))
+    except ValueError:
+        return path
+
+# Concurrent calls allowed per tool. Full-corpus scans are limited to one
+# at a time so repeated calls queue up instead of taking every thread.
+TOOL_CONCURRENCY = {
+    "kb_search": 4,
+    "kb_get": 4,
+    "kb_browse": 4,
+    "kb_validate": 1,
+    "kb_stats": 1,
+    "kb_health": 1,
+}
+
+# Tool calls run here instead of on the event loop, so a slow kb_stats
+# doesn't stall stdio or other requests
+tool_executor = ToolExecutor(TOOL_CONCURRENCY)
 
 # Track server start time for health checks
 server_start_time = datetime.now()
@@ -78,12 +131,27 @@ async def list_tools() -> List[Tool]:
                         "enum": ["universal", "python", "javascript", "docker", "postgresql", "vps", "framework", "project"],
                         "description": "Filter by scope"
                     },
+                    "tags": {
+                        "type": "array",
+                        "items": {"type": "string"},
+                        "description": "Only return entries with all of these tags"
+                    },
                     "limit": {
                         "type": "integer",
                         "description": "Maximum results to return (default: 50, max: 500)",
                         "default": 50,
                         "minimum": 1,
                         "maximum": 500
+                    },
+                    "offset": {
+                        "type": "integer",
+                        "description": "Number of results to skip (default: 0)",
+                        "default": 0,
+                        "minimum": 0
+                    },
+                    "cursor": {
+                        "type": "string",
+                        "description": "Cursor from a previous page to fetch the next page (overrides offset)"
                     }
                 }
             }
@@ -137,6 +205,15 @@ async def list_tools() -> List[Tool]:
                         "type": "boolean",
                         "description": "Search recursively in directories (default: true)",
                         "default": True
+                    },
+                    "changed_since": {
+                        "type": "string",
+                        "description": "Only validate files changed since this git ref (e.g. 'HEAD', 'origin/main')"
+                    },
+                    "max_errors": {
+                        "type": "integer",
+                        "description": "Stop after this many errors",
+                        "minimum": 1
                     }
                 }
             }
@@ -179,24 +256,16 @@ async def call_tool(name: str, arguments: Any) -> List[TextContent]:
     Returns:
         List of TextContent with results or errors
     """
+    handler = TOOL_HANDLERS.get(name)
+    if handler is None:
+        return [TextContent(
+            type="text",
+            text=f"Error: Unknown tool '{name}'"
+        )]
+
     try:
-        if name == "kb_search":
-            return await kb_search(arguments)
-        elif name == "kb_get":
-            return await kb_get(arguments)
-        elif name == "kb_browse":
-            return await kb_browse(arguments)
-        elif name == "kb_validate":
-            return await kb_validate(arguments)
-        elif name == "kb_stats":
-            return await kb_stats(arguments)
-        elif name == "kb_health":
-            return await kb_health(arguments)
-        else:
-            return [TextContent(
-                type="text",
-                text=f"Error: Unknown tool '{name}'"
-            )]
+        # Cancellation (e.g. the client cancelled the request) propagates
+        return await tool_executor.run(name, handler, arguments or {})
 
     except Exception as e:
         # Return error as text (MCP protocol requirement)
@@ -206,29 +275,38 @@ async def call_tool(name: str, arguments: Any) -> List[TextContent]:
         )]
 
 
-async def kb_search(arguments: dict) -> List[TextContent]:
+def kb_search(arguments: dict) -> List[TextContent]:
     """Search knowledge base"""
     query = arguments.get("query", "")
     category = arguments.get("category")
     severity = arguments.get("severity")
     scope = arguments.get("scope")
+    tags = arguments.get("tags")
     limit = arguments.get("limit", 50)
+    offset = arguments.get("offset", 0)
+    cursor = arguments.get("cursor")
 
     # Perform search
-    results = search_engine.search(
-        query=query,
-        category=category,
-        severity=severity,
-        scope=scope,
-        limit=limit,
-        include_project=True,
-        include_shared=True
-    )
+    with locked_index():
+        results = search_engine.search(
+            query=query,
+            category=category,
+            severity=severity,
+            scope=scope,
+            tags=tags,
+            limit=limit,
+            offset=offset,
+            cursor=cursor,
+            include_project=True,
+            include_shared=True
+        )
 
     # Format results
     output = []
     output.append(f"## Search Results for '{query}'")
     output.append(f"Found {results.total} entries")
+    if results.offset or results.has_more:
+        output.append(f"Showing results {results.offset + 1}-{results.offset + results.total}")
 
     if results.project_results:
         output.append(f"\n### Project KB Results ({len(results.project_results)})")
@@ -248,27 +326,48 @@ async def kb_search(arguments: dict) -> List[TextContent]:
             if result.preview:
                 output.append(f"  - Preview: {result.preview[:100]}...")
 
+    # Facet counts over all matches, to help narrow the query
+    facet_lines = [
+        f"- {facet}: " + ", ".join(f"{value} ({count})" for value, count in list(counts.items())[:10])
+        for facet, counts in results.facets.items()
+        if counts
+    ]
+    if facet_lines:
+        output.append("\n### Facets")
+        output.extend(facet_lines)
+
+    if results.has_more:
+        output.append(f"\nMore results available. Next page: cursor=\"{results.next_cursor}\"")
+
     if results.execution_time_ms:
         output.append(f"\nExecution time: {results.execution_time_ms:.1f}ms")
 
     return [TextContent(type="text", text="\n".join(output))]
 
 
-async def kb_get(arguments: dict) -> List[TextContent]:
+def kb_get(arguments: dict) -> List[TextContent]:
     """Get entry by ID"""
     entry_id = arguments.get("id")
 
     if not entry_id:
         return [TextContent(type="text", text="Error: 'id' parameter is required")]
 
-    result = search_engine.get_by_id(entry_id)
+    with locked_index():
+        result = search_engine.get_by_id(entry_id)
 
     if not result:
         return [TextContent(type="text", text=f"Error: Entry '{entry_id}' not found")]
 
     entry = result["entry"]
     category = result["category"]
-    file_path = result["file_path"]
+    file_path = display_path(result["file_path"])
+    if result.get("line_number"):
+        file_path = f"{file_path}:{result['line_number']}"
+    field_lines = result.get("lines") or {}
+
+    def heading(title: str, field: str) -> str:
+        line = field_lines.get(field)
+        return f"\n### {title} (line {line})" if line else f"\n### {title}"
 
     # Format entry
     output = []
@@ -277,21 +376,24 @@ async def kb_get(arguments: dict) -> List[TextContent]:
     output.append(f"**Severity:** {entry.get('severity', 'unknown')}")
     output.append(f"**Scope:** {entry.get('scope', 'unknown')}")
     output.append(f"**Source:** {file_path}")
+    for duplicate in result.get("duplicates") or []:
+        line = f":{duplicate['line_number']}" if duplicate["line_number"] else ""
+        output.append(f"**Also defined in:** {display_path(duplicate['file_path'])}{line} (ignored)")
 
     if entry.get('symptoms'):
-        output.append(f"\n### Symptoms")
+        output.append(heading("Symptoms", "symptoms"))
         output.append(entry['symptoms'])
 
     if entry.get('root_cause'):
-        output.append(f"\n### Root Cause")
+        output.append(heading("Root Cause", "root_cause"))
         output.append(entry['root_cause'])
 
     if entry.get('problem'):
-        output.append(f"\n### Problem")
+        output.append(heading("Problem", "problem"))
         output.append(entry['problem'])
 
     if entry.get('solution'):
-        output.append(f"\n### Solution")
+        output.append(heading("Solution", "solution"))
         solution = entry['solution']
         if isinstance(solution, dict):
             if solution.get('code'):
@@ -306,13 +408,13 @@ async def kb_get(arguments: dict) -> List[TextContent]:
             output.append(str(solution))
 
     if entry.get('prevention'):
-        output.append(f"\n### Prevention")
+        output.append(heading("Prevention", "prevention"))
         output.append(entry['prevention'])
 
     return [TextContent(type="text", text="\n".join(output))]
 
 
-async def kb_browse(arguments: dict) -> List[TextContent]:
+def kb_browse(arguments: dict) -> List[TextContent]:
     """Browse entries by category"""
     category = arguments.get("category")
     limit = arguments.get("limit", 50)
@@ -320,7 +422,8 @@ async def kb_browse(arguments: dict) -> List[TextContent]:
     if not category:
         return [TextContent(type="text", text="Error: 'category' parameter is required")]
 
-    results = search_engine.browse_by_category(category, limit=limit)
+    with locked_index():
+        results = search_engine.browse_by_category(category, limit=limit)
 
     output = []
     output.append(f"## Browsing Category: {category}")
@@ -337,10 +440,12 @@ async def kb_browse(arguments: dict) -> List[TextContent]:
     return [TextContent(type="text", text="\n".join(output))]
 
 
-async def kb_validate(arguments: dict) -> List[TextContent]:
+def kb_validate(arguments: dict) -> List[TextContent]:
     """Validate YAML files"""
     path_str = arguments.get("path", "domains")
     recursive = arguments.get("recursive", True)
+    changed_since = arguments.get("changed_since")
+    max_errors = arguments.get("max_errors")
 
     path = Path(path_str)
 
@@ -351,10 +456,25 @@ async def kb_validate(arguments: dict) -> List[TextContent]:
         return [TextContent(type="text", text=f"Error: Path not found: {path}")]
 
     # Validate
-    if path.is_file():
+    if changed_since:
+        scope = changed_files(changed_since, repo_path, path)
+        result = validator.validate_files(scope, max_errors)
+    elif path.is_file():
+        scope = [path]
         result = validator.validate_file(path)
     else:
-        result = validator.validate_directory(path, recursive=recursive)
+        scope = [path]
+        result = validator.validate_directory(path, recursive=recursive, max_errors=max_errors)
+
+    # Ids must also be unique across the KB, which the search index tracks
+    if scope and (max_errors is None or len(result.errors) < max_errors):
+        with locked_index():
+            duplicates = validator.check_duplicate_ids(search_engine, scope)
+        if duplicates:
+            result.errors.extend(duplicates)
+            result.is_valid = False
+            if max_errors is not None:
+                del result.errors[max_errors:]
 
     # Format results
     output = []
@@ -368,7 +488,8 @@ async def kb_validate(arguments: dict) -> List[TextContent]:
     if result.errors:
         output.append(f"\n### Errors ({len(result.errors)})")
         for error in result.errors[:10]:
-            output.append(f"- **{error.file_path}**")
+            line = f":{error.line_number}" if error.line_number else ""
+            output.append(f"- **{error.file_path}{line}**")
             output.append(f"  - {error.error_type}: {error.message}")
             if error.field_path:
                 output.append(f"  - Field: {error.field_path}")
@@ -376,7 +497,8 @@ async def kb_validate(arguments: dict) -> List[TextContent]:
     if result.warnings:
         output.append(f"\n### Warnings ({len(result.warnings)})")
         for warning in result.warnings[:10]:
-            output.append(f"- **{warning.file_path}**")
+            line = f":{warning.line_number}" if warning.line_number else ""
+            output.append(f"- **{warning.file_path}{line}**")
             output.append(f"  - {warning.error_type}: {warning.message}")
             if warning.field_path:
                 output.append(f"  - Field: {warning.field_path}")
@@ -390,7 +512,7 @@ async def kb_validate(arguments: dict) -> List[TextContent]:
     return [TextContent(type="text", text="\n".join(output))]
 
 
-async def kb_stats(arguments: dict) -> List[TextContent]:
+def kb_stats(arguments: dict) -> List[TextContent]:
     """Get repository statistics"""
     format_type = arguments.get("format", "text")
 
@@ -443,7 +565,7 @@ async def kb_stats(arguments: dict) -> List[TextContent]:
     return [TextContent(type="text", text="\n".join(output))]
 
 
-async def kb_health(arguments: dict) -> List[TextContent]:
+def kb_health(arguments: dict) -> List[TextContent]:
     """Check knowledge base health"""
     uptime = (datetime.now() - server_start_time).total_seconds()
 
@@ -502,14 +624,86 @@ async def kb_health(arguments: dict) -> List[TextContent]:
     return [TextContent(type="text", text="\n".join(output))]
 
 
+TOOL_HANDLERS = {
+    "kb_search": kb_search,
+    "kb_get": kb_get,
+    "kb_browse": kb_browse,
+    "kb_validate": kb_validate,
+    "kb_stats": kb_stats,
+    "kb_health": kb_health,
+}
+
+
+def warm_index() -> int:
+    """Load the index snapshot and patch in files changed since it was saved"""
+    try:
+        with index_lock:
+            # Start from the on-disk index built by `kb.py index` instead of re-parsing YAML
+            search_engine.load_index()
+            return index_watcher.poll()
+    finally:
+        index_ready.set()
+
+
+def poll_index() -> int:
+    """Patch changed files into the search index between queries"""
+    with index_lock:
+        return index_watcher.poll()
+
+
+async def watch_index(interval: float) -> None:
+    """
+    Poll for changed knowledge files and patch them into the search index.
+
+    Picks up entries written by `kb_submit --target local`, edits and
+    `git pull`s of .kb/shared while the server runs. Polls run on the
+    tool executor under the index lock, so a query never sees a
+    half-patched index. The task starts by loading the on-disk index,
+    so importing the server does no file I/O and queries wait until the
+    index is ready.
+    """
+    try:
+        await tool_executor.run("watch", warm_index)
+    except Exception as e:
+        print(f"Index warm-up error: {e}", file=sys.stderr)
+
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            await tool_executor.run("watch", poll_index)
+        except Exception as e:
+            print(f"Index watcher error: {e}", file=sys.stderr)
+
+
+async def warm_metrics() -> None:
+    """
+    Calculate metrics once in the background after startup.
+
+    Later kb_stats and kb_health calls only re-parse files that changed
+    since, instead of paying for a full scan on the first call.
+    """
+    try:
+        await tool_executor.run("kb_stats", metrics_calculator.calculate_all)
+    except Exception as e:
+        print(f"Metrics warm-up error: {e}", file=sys.stderr)
+
+
 async def main():
     """Main entry point for MCP server"""
-    async with stdio_server() as (read_stream, write_stream):
-        await server.run(
-            read_stream,
-            write_stream,
-            server.create_initialization_options()
-        )
+    watcher_task = asyncio.create_task(watch_index(default_watch_interval()))
+    warm_task = asyncio.create_task(warm_metrics())
+
+    try:
+        async with stdio_server() as (read_stream, write_stream):
+            await server.run(
+                read_stream,
+                write_stream,
+                server.create_initialization_options()
+            )
+    finally:
+        watcher_task.cancel()
+        warm_task.cancel()
+        tool_executor.shutdown()
 
 
 if __name__ == "__main__":